@@ -0,0 +1,172 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+BUDGETS_PATH = Path(__file__).resolve().parent / "budgets.json"
+DEFAULT_BUDGET = {
+    "p50_pct": 0.10,
+    "p99_pct": 0.25,
+    "latency_floor_ms": 0.5,
+    "noise_factor": 1.0,
+    "throughput_pct": 0.10,
+    "sql_statements": 0.0,
+    "alloc_pct": 0.10,
+    "alloc_floor_kib": 4.0
+}
+
+Key = Tuple[str, str, int]
+
+
+class Finding(NamedTuple):
+    route: str
+    method: str
+    concurrency: int
+    metric: str
+    baseline: float
+    candidate: float
+    allowed: float
+
+    @property
+    def change(self) -> str:
+        if not self.baseline:
+            return "n/a"
+        return f"{(self.candidate - self.baseline) / self.baseline:+.1%}"
+
+
+def load(path: Path) -> Dict:
+    try:
+        report = json.loads(path.read_text())
+    except (OSError, ValueError) as error:
+        raise SystemExit(f"cannot read benchmark results {path}: {error}")
+
+    if "results" not in report:
+        raise SystemExit(f"{path} is not a benchmark results file")
+    return report
+
+
+def index(report: Dict) -> Dict[Key, Dict]:
+    return {(row["method"], row["route"], row["concurrency"]): row for row in report["results"]}
+
+
+def budget_for(budgets: Dict, method: str, route: str) -> Dict:
+    budget = {**DEFAULT_BUDGET, **budgets.get("default", {})}
+    routes = budgets.get("routes", {})
+    budget.update(routes.get(route, {}))
+    budget.update(routes.get(f"{method} {route}", {}))
+    return budget
+
+
+def latency_allowance(base: Dict, metric: str, budget: Dict) -> float:
+    noise = max(0.0, base.get("p90_ms", base[metric]) - base["p50_ms"]) * budget["noise_factor"]
+    relative = base[metric] * budget[f"{metric.split('_')[0]}_pct"]
+    return max(relative, budget["latency_floor_ms"], noise if metric == "p99_ms" else noise / 2)
+
+
+def compare_row(key: Key, base: Dict, head: Dict, budget: Dict) -> List[Finding]:
+    method, route, concurrency = key
+    findings = []
+
+    def check(metric: str, baseline: float, candidate: float, allowed: float, higher_is_worse: bool = True):
+        if baseline is None or candidate is None:
+            return
+        worse = candidate - baseline if higher_is_worse else baseline - candidate
+        if worse > allowed:
+            findings.append(Finding(route, method, concurrency, metric, baseline, candidate, allowed))
+
+    for metric in ("p50_ms", "p99_ms"):
+        check(metric, base[metric], head[metric], latency_allowance(base, metric, budget))
+
+    check(
+        "throughput_rps", base["throughput_rps"], head["throughput_rps"],
+        base["throughput_rps"] * budget["throughput_pct"], higher_is_worse=False
+    )
+    check("sql_statements", base.get("sql_statements"), head.get("sql_statements"), budget["sql_statements"])
+
+    base_alloc, head_alloc = base.get("alloc_peak_kib"), head.get("alloc_peak_kib")
+    if base_alloc is not None:
+        check(
+            "alloc_peak_kib", base_alloc, head_alloc,
+            max(base_alloc * budget["alloc_pct"], budget["alloc_floor_kib"])
+        )
+
+    check("errors", base.get("errors", 0), head.get("errors", 0), 0)
+    return findings
+
+
+def compare(baseline: Dict, candidate: Dict, budgets: Dict) -> Tuple[List[Finding], List[Key], List[str]]:
+    base_rows, head_rows = index(baseline), index(candidate)
+    warnings = []
+
+    for field in ("scale", "settings", "requests"):
+        if baseline["meta"].get(field) != candidate["meta"].get(field):
+            warnings.append(f"runs differ in {field}: {baseline['meta'].get(field)} vs {candidate['meta'].get(field)}")
+
+    findings: List[Finding] = []
+    missing: List[Key] = []
+    for key, base in sorted(base_rows.items()):
+        head = head_rows.get(key)
+        if head is None:
+            missing.append(key)
+            continue
+        findings += compare_row(key, base, head, budget_for(budgets, key[0], key[1]))
+
+    return findings, missing, warnings
+
+
+def print_summary(baseline: Dict, candidate: Dict) -> None:
+    base_rows, head_rows = index(baseline), index(candidate)
+    print(f"{'route':<42} {'c':>3} {'p50 ms':>17} {'p99 ms':>17} {'rps':>17} {'sql':>11}")
+    for key, base in sorted(base_rows.items()):
+        head = head_rows.get(key)
+        if head is None:
+            continue
+        method, route, concurrency = key
+        print(
+            f"{method + ' ' + route:<42} {concurrency:>3} "
+            f"{base['p50_ms']:>8.2f}>{head['p50_ms']:<8.2f} {base['p99_ms']:>8.2f}>{head['p99_ms']:<8.2f} "
+            f"{base['throughput_rps']:>8.0f}>{head['throughput_rps']:<8.0f} "
+            f"{base.get('sql_statements', 0):>5.1f}>{head.get('sql_statements', 0):<5.1f}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fail when a benchmark run regresses against a baseline.")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_PATH,
+                        help="JSON with 'default' and per-route threshold overrides")
+    parser.add_argument("--allow-missing", action="store_true", help="do not fail when a baseline route was not run")
+    parser.add_argument("--quiet", action="store_true", help="only print regressions")
+    args = parser.parse_args(argv)
+
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    budgets = json.loads(args.budgets.read_text()) if args.budgets and args.budgets.exists() else {}
+
+    findings, missing, warnings = compare(baseline, candidate, budgets)
+
+    if not args.quiet:
+        print_summary(baseline, candidate)
+        print()
+    for warning in warnings:
+        print(f"warning: {warning}")
+    for method, route, concurrency in missing:
+        print(f"missing: {method} {route} c={concurrency} is not in the candidate run")
+
+    if findings:
+        print(f"{len(findings)} regression(s):")
+        for finding in findings:
+            print(
+                f"  {finding.method} {finding.route} c={finding.concurrency}: {finding.metric} "
+                f"{finding.baseline:g} -> {finding.candidate:g} ({finding.change}, "
+                f"allowed {'-' if finding.metric == 'throughput_rps' else '+'}{finding.allowed:.2f})"
+            )
+
+    failed = bool(findings) or (bool(missing) and not args.allow_missing)
+    print("FAIL" if failed else "OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
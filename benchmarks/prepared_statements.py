@@ -0,0 +1,128 @@
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import mysql.connector
+
+from core.config import settings
+from core.statements import StatementRegistry
+
+QUERIES = {
+    "match": (
+        "SELECT * FROM tblMatches WHERE Id = %s AND Void = 0",
+        lambda key: (key,)
+    ),
+    "team": (
+        "SELECT Id, Name, Slogan, LogoUrl FROM tblTeams WHERE Id = %s AND Void = 0",
+        lambda key: (key,)
+    ),
+    "roster": (
+        """
+            SELECT p.Id AS PlayerId, p.FirstName, p.LastName, p.AvatarUrl
+            FROM tblPlayersSeasonsTeams pst
+            JOIN tblPlayers p ON pst.PlayerId = p.Id
+            WHERE pst.SeasonId = %s AND pst.TeamId = %s
+              AND pst.Void = 0 AND p.Void = 0
+        """,
+        lambda key: (key, key)
+    ),
+    "country-exists": (
+        "SELECT 1 FROM tblCountries WHERE Id = %s AND Void = 0 LIMIT 1",
+        lambda key: (key,)
+    )
+}
+
+
+def connect():
+    return mysql.connector.connect(
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        database=settings.DB_NAME,
+        autocommit=True
+    )
+
+
+def server_counters(connection) -> dict:
+    cursor = connection.cursor()
+    cursor.execute(
+        "SHOW SESSION STATUS WHERE Variable_name IN "
+        "('Com_select', 'Com_stmt_prepare', 'Com_stmt_execute')"
+    )
+    return {name: int(value) for name, value in cursor.fetchall()}
+
+
+def run_text(connection, query: str, params, iterations: int) -> list:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(query, params)
+        cursor.fetchall()
+        cursor.close()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def run_prepared(connection, query: str, params, iterations: int) -> list:
+    registry = StatementRegistry(connection)
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        registry.fetch_all(query, params, dictionary=True)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def summarize(label: str, timings: list, counters: dict) -> dict:
+    ordered = sorted(timings)
+    result = {
+        "mode": label,
+        "mean_us": statistics.fmean(timings) * 1e6,
+        "p50_us": ordered[len(ordered) // 2] * 1e6,
+        "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6,
+        **counters
+    }
+    print(
+        f"{label:>9}  mean {result['mean_us']:8.1f}us  p50 {result['p50_us']:8.1f}us  "
+        f"p99 {result['p99_us']:8.1f}us  {counters}"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare text-protocol and prepared hot lookups.")
+    parser.add_argument("--query", choices=sorted(QUERIES), default="match")
+    parser.add_argument("--key", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=200)
+    args = parser.parse_args()
+
+    query, build_params = QUERIES[args.query]
+    params = build_params(args.key)
+
+    results = []
+    for label, runner in (("text", run_text), ("prepared", run_prepared)):
+        connection = connect()
+        try:
+            runner(connection, query, params, args.warmup)
+            before = server_counters(connection)
+            timings = runner(connection, query, params, args.iterations)
+            after = server_counters(connection)
+            counters = {name: after[name] - before.get(name, 0) for name in after}
+            results.append(summarize(label, timings, counters))
+        finally:
+            connection.close()
+
+    text, prepared = results
+    saving = 1 - prepared["mean_us"] / text["mean_us"]
+    print(f"prepared statements save {saving:.1%} per call on '{args.query}'")
+
+
+if __name__ == "__main__":
+    main()
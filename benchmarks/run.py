@@ -0,0 +1,225 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.synthetic import add_scale_arguments, load, parse_scale
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+SERVER_TIMING = re.compile(r'db;dur=([\d.]+);desc="(\d+) statements')
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    route: str
+    query: str = ""
+    body: Optional[dict] = None
+
+
+SCENARIOS = [
+    Scenario("teams", "GET", "/teams/"),
+    Scenario("team", "GET", "/teams/{team_id}"),
+    Scenario("players", "GET", "/players/", "limit=100"),
+    Scenario("matches", "GET", "/matches", "seasonId={season_id}&limit=100"),
+    Scenario("match", "GET", "/matches/{match_id}"),
+    Scenario("league-table", "GET", "/seasons/{season_id}/league-table"),
+    Scenario("season-rosters", "GET", "/rosters/season/{season_id}"),
+    Scenario("season-teams", "GET", "/rosters/season/{season_id}/teams"),
+    Scenario("player-history", "GET", "/rosters/player/{player_id}"),
+    Scenario("head-to-head", "GET", "/stats/head-to-head", "team1Id={team_id}&team2Id={other_team_id}"),
+    Scenario("match-update", "PATCH", "/matches/{match_id}", body={"duration": 30})
+]
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def git_revision() -> Dict:
+    def run(*args) -> str:
+        try:
+            return subprocess.run(
+                ["git", *args], cwd=ROOT, capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+    return {"commit": run("rev-parse", "HEAD") or None, "dirty": bool(run("status", "--porcelain"))}
+
+
+def target(scenario: Scenario, ids: Dict[str, int]) -> str:
+    path = scenario.route.format(**ids)
+    return f"{path}?{scenario.query.format(**ids)}" if scenario.query else path
+
+
+async def send(client, scenario: Scenario, url: str):
+    started = time.perf_counter()
+    response = await client.request(scenario.method, url, json=scenario.body)
+    elapsed = time.perf_counter() - started
+
+    match = SERVER_TIMING.search(response.headers.get("server-timing", ""))
+    db_ms, statements = (float(match.group(1)), int(match.group(2))) if match else (0.0, 0)
+    return elapsed, response.status_code < 400, db_ms, statements
+
+
+async def measure(client, scenario: Scenario, url: str, concurrency: int, requests: int) -> Dict:
+    latencies: List[float] = []
+    db_times: List[float] = []
+    statements: List[int] = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            elapsed, ok, db_ms, count = await send(client, scenario, url)
+            latencies.append(elapsed)
+            db_times.append(db_ms)
+            statements.append(count)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "scenario": scenario.name,
+        "method": scenario.method,
+        "route": scenario.route,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / wall, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p90_ms": round(percentile(ordered, 0.90) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "db_ms": round(statistics.fmean(db_times), 3),
+        "sql_statements": round(statistics.fmean(statements), 2)
+    }
+
+
+async def allocations(client, scenario: Scenario, url: str, requests: int) -> float:
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(requests):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await send(client, scenario, url)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return round(statistics.median(peaks) / 1024, 2)
+
+
+async def run(args, ids: Dict[str, int]) -> List[Dict]:
+    import httpx
+    from main import app
+
+    scenarios = [scenario for scenario in SCENARIOS if not args.only or scenario.name in args.only]
+    results = []
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for scenario in scenarios:
+                url = target(scenario, ids)
+
+                for _ in range(args.warmup):
+                    await send(client, scenario, url)
+
+                alloc_kib = await allocations(client, scenario, url, args.alloc_requests) if args.alloc_requests else None
+
+                for concurrency in args.concurrency:
+                    result = await measure(client, scenario, url, concurrency, args.requests)
+                    result["alloc_peak_kib"] = alloc_kib
+                    results.append(result)
+                    print(
+                        f"{scenario.name:>15} c={concurrency:<3} {result['throughput_rps']:9.1f} rps  "
+                        f"p50 {result['p50_ms']:8.2f}ms  p99 {result['p99_ms']:8.2f}ms  "
+                        f"sql {result['sql_statements']:5.1f}  errors {result['errors']}"
+                    )
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the API in-process against a local stand-in database.")
+    parser.add_argument("--database", default=os.getenv("CPL_BENCH_DB_NAME", "cpl_bench"))
+    parser.add_argument("--skip-setup", action="store_true", help="reuse the existing benchmark database")
+    add_scale_arguments(parser)
+    parser.add_argument("--force", action="store_true", help="allow resetting a database without 'bench' in its name")
+    parser.add_argument("--concurrency", type=lambda value: [int(item) for item in value.split(",")], default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario and concurrency level")
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--alloc-requests", type=int, default=50, help="sequential requests traced for allocations; 0 disables")
+    parser.add_argument("--only", nargs="*", help="scenario names to run")
+    parser.add_argument("--output", type=Path, help="results file; defaults to benchmarks/results/<commit>.json")
+    args = parser.parse_args()
+
+    if not args.skip_setup and "bench" not in args.database and not args.force:
+        parser.error(f"refusing to reset '{args.database}'; pass --force or use a *bench* database")
+
+    os.environ["CPL_DB_NAME"] = args.database
+
+    from benchmarks import stand_in
+    from core.config import settings
+
+    scale = parse_scale(args)
+    if not args.skip_setup:
+        stand_in.reset_database(args.database)
+        load(args.database, scale, args.seed)
+
+    ids = stand_in.sample_ids(args.database)
+    results = asyncio.run(run(args, ids))
+
+    revision = git_revision()
+    report = {
+        "meta": {
+            **revision,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "database": args.database,
+            "scale": None if args.skip_setup else {"name": args.scale, "seed": args.seed, **scale._asdict()},
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "settings": {
+                "DB_POOL_SIZE": settings.DB_POOL_SIZE,
+                "DB_PREPARED_STATEMENTS": settings.DB_PREPARED_STATEMENTS,
+                "FAST_RESPONSES": settings.FAST_RESPONSES,
+                "LEAGUE_TABLE_SOURCE": settings.LEAGUE_TABLE_SOURCE,
+                "HEAD_TO_HEAD_SOURCE": settings.HEAD_TO_HEAD_SOURCE
+            }
+        },
+        "results": results
+    }
+
+    output = args.output or RESULTS_DIR / f"{(revision['commit'] or 'local')[:12]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+-- Stand-in schema for local benchmarks. Mirrors the columns and defaults the
+-- repositories rely on; the usp_* procedures reproduce the result shapes of the
+-- production procedures, not their exact implementation.
+
+CREATE TABLE tblCountries (
+    Id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    Name VARCHAR(255) NOT NULL,
+    IsoCode2 CHAR(2) NOT NULL,
+    IsoCode3 CHAR(3) NOT NULL,
+    Capital VARCHAR(255) NULL,
+    PhoneCode VARCHAR(20) NULL,
+    Continent VARCHAR(255) NULL,
+    Void TINYINT NOT NULL DEFAULT 0,
+    KEY IX_Countries_Name (Name),
+    UNIQUE KEY UX_Countries_Name ((IF(Void = 0, Name, NULL))),
+    UNIQUE KEY UX_Countries_IsoCode2 ((IF(Void = 0, IsoCode2, NULL))),
+    UNIQUE KEY UX_Countries_IsoCode3 ((IF(Void = 0, IsoCode3, NULL)))
+);
+
+CREATE TABLE tblTeams (
+    Id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    Name VARCHAR(255) NOT NULL,
+    Slogan VARCHAR(255) NULL,
+    LogoUrl VARCHAR(2048) NULL,
+    Void TINYINT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE tblPlayers (
+    Id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    FirstName VARCHAR(255) NOT NULL,
+    LastName VARCHAR(255) NOT NULL,
+    DateOfBirth DATE NULL,
+    AvatarUrl VARCHAR(2048) NULL,
+    NationalityId INT NULL,
+    Void TINYINT NOT NULL DEFAULT 0,
+    KEY IX_Players_Nationality (NationalityId)
+);
+
+CREATE TABLE tblSeasons (
+    Id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    Name VARCHAR(255) NOT NULL,
+    StartDate DATE NULL,
+    EndDate DATE NULL,
+    Status TINYINT NOT NULL DEFAULT 1,
+    Void TINYINT NOT NULL DEFAULT 0,
+    KEY IX_Seasons_Name (Name)
+);
+
+CREATE TABLE tblMatches (
+    Id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    Team1 INT NULL,
+    Team2 INT NULL,
+    ScheduledDate DATE NOT NULL,
+    Duration INT NULL,
+    Extra INT NULL,
+    GoldenStrike TINYINT NOT NULL DEFAULT 0,
+    Category TINYINT NOT NULL,
+    Status TINYINT NOT NULL,
+    `Order` INT NOT NULL,
+    SeasonId INT NOT NULL,
+    NetPoints INT NULL,
+    Outcome TINYINT NULL,
+    TossOutcome TINYINT NOT NULL DEFAULT 0,
+    Void TINYINT NOT NULL DEFAULT 0,
+    KEY IX_Matches_Season_Order (SeasonId, Void, `Order`),
+    KEY IX_Matches_Team1 (Team1),
+    KEY IX_Matches_Team2 (Team2)
+);
+
+CREATE TABLE tblPlayersSeasonsTeams (
+    Id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    PlayerId INT NOT NULL,
+    SeasonId INT NOT NULL,
+    TeamId INT NOT NULL,
+    Void TINYINT NOT NULL DEFAULT 0,
+    KEY IX_Rosters_Season_Team (SeasonId, TeamId),
+    KEY IX_Rosters_Player_Season (PlayerId, SeasonId)
+);
+
+DELIMITER $$
+
+CREATE PROCEDURE usp_GetLeagueTable(IN pSeasonId INT)
+BEGIN
+    WITH sides AS (
+        SELECT Team1 AS TeamId, Team2 AS OpponentId, Status,
+               Outcome = 1 AS Won, Outcome = 2 AS Lost, COALESCE(NetPoints, 0) AS NetPoints
+        FROM tblMatches
+        WHERE SeasonId = pSeasonId AND Category = 1 AND Void = 0
+          AND Team1 IS NOT NULL AND Team2 IS NOT NULL
+        UNION ALL
+        SELECT Team2, Team1, Status,
+               Outcome = 2, Outcome = 1, COALESCE(NetPoints, 0)
+        FROM tblMatches
+        WHERE SeasonId = pSeasonId AND Category = 1 AND Void = 0
+          AND Team1 IS NOT NULL AND Team2 IS NOT NULL
+    ),
+    results AS (
+        SELECT TeamId, OpponentId,
+               SUM(Status = 3 AND (Won OR Lost)) AS Played,
+               SUM(Status = 3 AND Won) AS Wins,
+               SUM(CASE
+                   WHEN Status = 3 AND Won THEN NetPoints
+                   WHEN Status = 3 AND Lost THEN -NetPoints
+                   ELSE 0
+               END) AS NetPoints
+        FROM sides
+        GROUP BY TeamId, OpponentId
+    ),
+    totals AS (
+        SELECT TeamId, SUM(Played) AS MatchesPlayed, SUM(Wins) AS Wins, SUM(NetPoints) AS TotalNetPoints
+        FROM results
+        GROUP BY TeamId
+    )
+    SELECT t.TeamId,
+           tm.Name AS TeamName,
+           t.MatchesPlayed,
+           t.Wins,
+           t.Wins * 2 AS Points,
+           t.TotalNetPoints,
+           COALESCE((
+               SELECT SUM(r.Wins)
+               FROM results r
+               JOIN totals o ON o.TeamId = r.OpponentId
+               WHERE r.TeamId = t.TeamId AND o.Wins = t.Wins
+           ), 0) AS HeadToHeadWins,
+           EXISTS (
+               SELECT 1
+               FROM tblMatches f
+               WHERE f.SeasonId = pSeasonId AND f.Category = 2 AND f.Status = 3 AND f.Void = 0
+                 AND ((f.Outcome = 1 AND f.Team1 = t.TeamId) OR (f.Outcome = 2 AND f.Team2 = t.TeamId))
+           ) AS IsWinner
+    FROM totals t
+    JOIN tblTeams tm ON tm.Id = t.TeamId
+    ORDER BY Points DESC, HeadToHeadWins DESC, TotalNetPoints DESC, Wins DESC, TeamName, t.TeamId;
+
+    SELECT Status AS SeasonStatus
+    FROM tblSeasons
+    WHERE Id = pSeasonId;
+END$$
+
+CREATE PROCEDURE usp_GetLifetimeHeadToHead(IN pTeamAId INT, IN pTeamBId INT)
+BEGIN
+    SELECT pTeamAId AS TeamAId,
+           pTeamBId AS TeamBId,
+           COUNT(*) AS TotalMatches,
+           COALESCE(SUM((Team1 = pTeamAId AND Outcome = 1) OR (Team2 = pTeamAId AND Outcome = 2)), 0) AS TeamAWins,
+           COALESCE(SUM((Team1 = pTeamBId AND Outcome = 1) OR (Team2 = pTeamBId AND Outcome = 2)), 0) AS TeamBWins,
+           COALESCE(SUM(CASE
+               WHEN (Team1 = pTeamAId AND Outcome = 1) OR (Team2 = pTeamAId AND Outcome = 2) THEN COALESCE(NetPoints, 0)
+               WHEN (Team1 = pTeamBId AND Outcome = 1) OR (Team2 = pTeamBId AND Outcome = 2) THEN -COALESCE(NetPoints, 0)
+               ELSE 0
+           END), 0) AS TeamANetPoints,
+           -COALESCE(SUM(CASE
+               WHEN (Team1 = pTeamAId AND Outcome = 1) OR (Team2 = pTeamAId AND Outcome = 2) THEN COALESCE(NetPoints, 0)
+               WHEN (Team1 = pTeamBId AND Outcome = 1) OR (Team2 = pTeamBId AND Outcome = 2) THEN -COALESCE(NetPoints, 0)
+               ELSE 0
+           END), 0) AS TeamBNetPoints
+    FROM tblMatches
+    WHERE Void = 0 AND Status = 3
+      AND ((Team1 = pTeamAId AND Team2 = pTeamBId) OR (Team1 = pTeamBId AND Team2 = pTeamAId));
+END$$
+
+CREATE PROCEDURE usp_AssignPlayerToTeam(IN pSeasonId INT, IN pTeamId INT, IN pPlayerId INT)
+BEGIN
+    DECLARE vStatus TINYINT;
+
+    SELECT Status INTO vStatus FROM tblSeasons WHERE Id = pSeasonId AND Void = 0;
+
+    IF vStatus IS NULL THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Season not found';
+    END IF;
+
+    IF vStatus = 3 THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Season already completed';
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM tblTeams WHERE Id = pTeamId AND Void = 0) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Team not found';
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM tblPlayers WHERE Id = pPlayerId AND Void = 0) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Player not found';
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM tblPlayersSeasonsTeams
+        WHERE SeasonId = pSeasonId AND PlayerId = pPlayerId AND Void = 0
+    ) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Player already assigned for this season';
+    END IF;
+
+    INSERT INTO tblPlayersSeasonsTeams (PlayerId, SeasonId, TeamId)
+    VALUES (pPlayerId, pSeasonId, pTeamId);
+END$$
+
+DELIMITER ;
@@ -0,0 +1,92 @@
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import mysql.connector
+
+from core.config import settings
+from enums.match_status import MatchStatus
+
+SCHEMA_PATH = Path(__file__).resolve().parent / "schema.sql"
+
+
+def connect(database: str = None, **options):
+    return mysql.connector.connect(
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        database=database,
+        autocommit=True,
+        **options
+    )
+
+
+def split_statements(script: str) -> Iterator[str]:
+    delimiter = ";"
+    buffer: List[str] = []
+
+    for line in script.splitlines():
+        stripped = line.strip()
+
+        if stripped.upper().startswith("DELIMITER "):
+            delimiter = stripped.split()[1]
+            continue
+
+        if not buffer and (not stripped or stripped.startswith("--")):
+            continue
+
+        buffer.append(line)
+        if stripped.endswith(delimiter):
+            statement = "\n".join(buffer).rstrip()[:-len(delimiter)].strip()
+            buffer = []
+            if statement:
+                yield statement
+
+
+def reset_database(database: str) -> None:
+    connection = connect()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+        cursor.execute(f"CREATE DATABASE `{database}` CHARACTER SET utf8mb4")
+        cursor.execute(f"USE `{database}`")
+
+        for statement in split_statements(SCHEMA_PATH.read_text()):
+            cursor.execute(statement)
+    finally:
+        connection.close()
+
+
+def sample_ids(database: str) -> Dict[str, int]:
+    connection = connect(database)
+
+    try:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("""
+            SELECT s.Id AS season_id, MIN(m.Team1) AS team_id, MAX(m.Team2) AS other_team_id
+            FROM tblSeasons s
+            JOIN tblMatches m ON m.SeasonId = s.Id AND m.Void = 0
+            WHERE s.Void = 0
+            GROUP BY s.Id
+            ORDER BY s.Id DESC
+            LIMIT 1
+        """)
+        ids = cursor.fetchone()
+        if ids is None:
+            raise RuntimeError(f"Database '{database}' has no seasons with matches; run without --skip-setup.")
+
+        cursor.execute(
+            "SELECT MIN(PlayerId) AS player_id FROM tblPlayersSeasonsTeams WHERE SeasonId = %s AND Void = 0",
+            (ids["season_id"],)
+        )
+        ids.update(cursor.fetchone())
+
+        cursor.execute(
+            "SELECT MAX(Id) AS match_id FROM tblMatches WHERE SeasonId = %s AND Status <> %s AND Void = 0",
+            (ids["season_id"], MatchStatus.Played.value)
+        )
+        ids.update(cursor.fetchone())
+
+        return {key: int(value) for key, value in ids.items() if value is not None}
+    finally:
+        connection.close()
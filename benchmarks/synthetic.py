@@ -0,0 +1,352 @@
+import argparse
+import hashlib
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engines.fixture_generator import round_dates, round_robin
+from enums.match_category import MatchCategory
+from enums.match_outcome import MatchOutcome
+from enums.match_status import MatchStatus
+from enums.season_status import SeasonStatus
+
+
+class Scale(NamedTuple):
+    countries: int
+    teams: int
+    teams_per_season: int
+    players_per_team: int
+    seasons: int
+
+
+SCALES = {
+    "small": Scale(countries=20, teams=8, teams_per_season=8, players_per_team=12, seasons=3),
+    "medium": Scale(countries=50, teams=24, teams_per_season=16, players_per_team=14, seasons=20),
+    "large": Scale(countries=100, teams=80, teams_per_season=40, players_per_team=15, seasons=60),
+    "huge": Scale(countries=200, teams=200, teams_per_season=100, players_per_team=16, seasons=110)
+}
+
+COLUMNS = {
+    "tblCountries": ("Id", "Name", "IsoCode2", "IsoCode3", "Capital", "PhoneCode", "Continent"),
+    "tblTeams": ("Id", "Name", "Slogan", "LogoUrl"),
+    "tblPlayers": ("Id", "FirstName", "LastName", "DateOfBirth", "AvatarUrl", "NationalityId"),
+    "tblSeasons": ("Id", "Name", "StartDate", "EndDate", "Status"),
+    "tblPlayersSeasonsTeams": ("Id", "PlayerId", "SeasonId", "TeamId"),
+    "tblMatches": (
+        "Id", "Team1", "Team2", "ScheduledDate", "Duration", "Extra", "GoldenStrike",
+        "Category", "Status", "`Order`", "SeasonId", "NetPoints", "Outcome", "TossOutcome"
+    )
+}
+
+CONTINENTS = ("Africa", "Asia", "Europe", "North America", "Oceania", "South America")
+FIRST_NAMES = (
+    "Aarav", "Aditi", "Arjun", "Bianca", "Chen", "Dev", "Elena", "Farhan", "Grace", "Hiro",
+    "Ishaan", "Jaya", "Kabir", "Lena", "Meera", "Nikhil", "Omar", "Priya", "Rahul", "Sana",
+    "Tara", "Uday", "Vikram", "Wei", "Yusuf", "Zara"
+)
+LAST_NAMES = (
+    "Banerjee", "Chowdhury", "Das", "Ghosh", "Gupta", "Iyer", "Kapoor", "Khan", "Mehta", "Mukherjee",
+    "Nair", "Patel", "Rao", "Roy", "Saha", "Sen", "Shah", "Singh", "Verma", "Yadav"
+)
+TEAM_WORDS = (
+    "Strikers", "Titans", "Falcons", "Warriors", "Knights", "Rangers", "Royals", "Chargers",
+    "Panthers", "Tigers", "Sharks", "Comets", "Rockets", "Blazers", "Giants", "Spartans"
+)
+PLAYOFFS = (MatchCategory.Qualifier1, MatchCategory.Eliminator, MatchCategory.Qualifier2, MatchCategory.Final)
+
+Row = Tuple
+
+
+class LeagueGenerator:
+
+    def __init__(self, scale: Scale, seed: int = 42, first_year: int = 2000):
+        self.scale = scale
+        self.seed = seed
+        self.first_year = first_year
+        self.rng = random.Random(seed)
+
+        per_season = scale.teams_per_season * scale.players_per_team
+        self.player_count = math.ceil(per_season * 1.4 * (scale.seasons + 10) / 7.5)
+        self.careers: List[Tuple[int, int]] = []
+        self.match_id = 0
+        self.roster_id = 0
+
+    def countries(self) -> Iterator[Row]:
+        for country_id in range(1, self.scale.countries + 1):
+            code = f"{country_id:03d}"
+            iso2 = f"{chr(65 + country_id % 26)}{chr(65 + country_id // 26 % 26)}"
+            yield (
+                country_id, f"Country {code}", iso2,
+                f"{iso2}C", f"Capital {code}", f"+{country_id}", CONTINENTS[country_id % len(CONTINENTS)]
+            )
+
+    def teams(self) -> Iterator[Row]:
+        for team_id in range(1, self.scale.teams + 1):
+            word = TEAM_WORDS[team_id % len(TEAM_WORDS)]
+            yield team_id, f"Team {team_id:03d} {word}", f"Go {word}!", f"https://cdn.example.com/teams/{team_id}.png"
+
+    def players(self) -> Iterator[Row]:
+        rng = self.rng
+        for player_id in range(1, self.player_count + 1):
+            debut = rng.randint(-9, self.scale.seasons)
+            self.careers.append((debut, debut + rng.randint(3, 12)))
+            born = date(self.first_year + max(debut, 1) - 22, 1, 1) + timedelta(days=rng.randrange(2500))
+            yield (
+                player_id, rng.choice(FIRST_NAMES), f"{rng.choice(LAST_NAMES)}{player_id}", born,
+                None if rng.random() < 0.3 else f"https://cdn.example.com/players/{player_id}.png",
+                rng.randint(1, self.scale.countries)
+            )
+
+    def _roster(self, season_index: int, season_id: int, team_ids: List[int]) -> Iterator[Row]:
+        needed = len(team_ids) * self.scale.players_per_team
+        active = [
+            player_id for player_id, (debut, retired) in enumerate(self.careers, start=1)
+            if debut <= season_index < retired
+        ]
+        self.rng.shuffle(active)
+
+        if len(active) < needed:
+            chosen = set(active)
+            others = [player_id for player_id in range(1, self.player_count + 1) if player_id not in chosen]
+            active += self.rng.sample(others, needed - len(active))
+
+        for position, player_id in enumerate(active[:needed]):
+            self.roster_id += 1
+            yield self.roster_id, player_id, season_id, team_ids[position // self.scale.players_per_team]
+
+    def _match(self, season_id: int, order: int, team1, team2, scheduled: date, category: MatchCategory, played: bool):
+        rng = self.rng
+        self.match_id += 1
+
+        if not played:
+            return (
+                self.match_id, team1, team2, scheduled, None, None, 0, category.value,
+                MatchStatus.Scheduled.value, order, season_id, None, MatchOutcome.NotDecided.value, 0
+            )
+
+        outcome = rng.choice((MatchOutcome.Team1Win, MatchOutcome.Team2Win))
+        golden_strike = rng.random() < 0.05
+        return (
+            self.match_id, team1, team2, scheduled, rng.randint(18, 45), rng.randint(0, 5) if golden_strike else 0,
+            int(golden_strike), category.value, MatchStatus.Played.value, order, season_id,
+            rng.randint(1, 29), outcome.value, rng.choice((1, 2))
+        )
+
+    @staticmethod
+    def _winner(row: Row) -> int:
+        return row[1] if row[12] == MatchOutcome.Team1Win.value else row[2]
+
+    @staticmethod
+    def _loser(row: Row) -> int:
+        return row[2] if row[12] == MatchOutcome.Team1Win.value else row[1]
+
+    def _playoffs(self, season_id: int, order: int, wins: Dict[int, int], start: date) -> Iterator[Row]:
+        top = sorted(wins, key=lambda team_id: (-wins[team_id], team_id))[:4]
+        if len(top) < 4:
+            return
+
+        qualifier1 = self._match(season_id, order, top[0], top[1], start, PLAYOFFS[0], True)
+        eliminator = self._match(season_id, order + 1, top[2], top[3], start + timedelta(days=1), PLAYOFFS[1], True)
+        qualifier2 = self._match(
+            season_id, order + 2, self._loser(qualifier1), self._winner(eliminator), start + timedelta(days=3), PLAYOFFS[2], True
+        )
+        final = self._match(
+            season_id, order + 3, self._winner(qualifier1), self._winner(qualifier2), start + timedelta(days=5), PLAYOFFS[3], True
+        )
+        yield from (qualifier1, eliminator, qualifier2, final)
+
+    def generate(self) -> Iterator[Tuple[str, Row]]:
+        for row in self.countries():
+            yield "tblCountries", row
+        for row in self.teams():
+            yield "tblTeams", row
+        for row in self.players():
+            yield "tblPlayers", row
+
+        all_teams = list(range(1, self.scale.teams + 1))
+
+        for season_index in range(self.scale.seasons):
+            season_id = season_index + 1
+            current = season_id == self.scale.seasons
+            start = date(self.first_year + season_index, 1, 10)
+            end = start + timedelta(days=300)
+            status = SeasonStatus.InProgress if current else SeasonStatus.Completed
+            yield "tblSeasons", (season_id, f"Season {self.first_year + season_index}", start, end, status.value)
+
+            team_ids = sorted(self.rng.sample(all_teams, self.scale.teams_per_season))
+            for row in self._roster(season_index, season_id, team_ids):
+                yield "tblPlayersSeasonsTeams", row
+
+            rounds = round_robin(team_ids, double=True)
+            dates = round_dates(start, end - timedelta(days=14), len(rounds))
+            played_rounds = len(rounds) // 2 if current else len(rounds)
+
+            wins: Dict[int, int] = defaultdict(int)
+            order = 0
+            for round_index, (pairings, scheduled) in enumerate(zip(rounds, dates)):
+                for team1, team2 in pairings:
+                    order += 1
+                    row = self._match(
+                        season_id, order, team1, team2, scheduled, MatchCategory.League, round_index < played_rounds
+                    )
+                    if row[12] != MatchOutcome.NotDecided.value:
+                        wins[team1 if row[12] == MatchOutcome.Team1Win.value else team2] += 1
+                    yield "tblMatches", row
+
+            if current:
+                yield "tblMatches", self._match(
+                    season_id, order + 1, None, None, end, MatchCategory.Final, False
+                )
+                continue
+
+            for row in self._playoffs(season_id, order + 1, wins, end - timedelta(days=10)):
+                yield "tblMatches", row
+
+
+def _insert_sql(table: str) -> str:
+    columns = COLUMNS[table]
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+
+def load_insert(connection, rows: Iterator[Tuple[str, Row]], batch_size: int) -> Dict[str, int]:
+    cursor = connection.cursor()
+    buffers: Dict[str, List[Row]] = defaultdict(list)
+    counts: Dict[str, int] = defaultdict(int)
+
+    def flush(table: str) -> None:
+        cursor.executemany(_insert_sql(table), buffers[table])
+        connection.commit()
+        counts[table] += len(buffers[table])
+        buffers[table] = []
+
+    for table, row in rows:
+        buffers[table].append(row)
+        if len(buffers[table]) >= batch_size:
+            flush(table)
+
+    for table in COLUMNS:
+        if buffers[table]:
+            flush(table)
+
+    return dict(counts)
+
+
+def _tsv(value) -> str:
+    return "\\N" if value is None else str(value)
+
+
+def load_infile(connection, rows: Iterator[Tuple[str, Row]], directory: Path) -> Dict[str, int]:
+    files = {table: open(directory / f"{table}.tsv", "w") for table in COLUMNS}
+    counts: Dict[str, int] = defaultdict(int)
+
+    try:
+        for table, row in rows:
+            files[table].write("\t".join(_tsv(value) for value in row) + "\n")
+            counts[table] += 1
+    finally:
+        for handle in files.values():
+            handle.close()
+
+    cursor = connection.cursor()
+    for table, columns in COLUMNS.items():
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} "
+            f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({', '.join(columns)})",
+            (str(directory / f"{table}.tsv"),)
+        )
+    connection.commit()
+
+    return dict(counts)
+
+
+def load(database: str, scale: Scale, seed: int = 42, method: str = "insert", batch_size: int = 5000) -> Dict[str, int]:
+    from benchmarks.stand_in import connect
+
+    connection = connect(database, allow_local_infile=method == "infile")
+    try:
+        connection.autocommit = False
+        cursor = connection.cursor()
+        cursor.execute("SET SESSION unique_checks = 0, SESSION foreign_key_checks = 0")
+
+        rows = LeagueGenerator(scale, seed).generate()
+        if method == "infile":
+            with tempfile.TemporaryDirectory(prefix="cpl_synthetic_") as directory:
+                return load_infile(connection, rows, Path(directory))
+        return load_insert(connection, rows, batch_size)
+    finally:
+        connection.close()
+
+
+def fingerprint(scale: Scale, seed: int = 42) -> Tuple[Dict[str, int], str]:
+    digest = hashlib.sha256()
+    counts: Dict[str, int] = defaultdict(int)
+
+    for table, row in LeagueGenerator(scale, seed).generate():
+        digest.update(f"{table}\t{row!r}\n".encode())
+        counts[table] += 1
+
+    return dict(counts), digest.hexdigest()
+
+
+def parse_scale(args) -> Scale:
+    scale = SCALES[args.scale]
+    overrides = {field: getattr(args, field) for field in Scale._fields if getattr(args, field) is not None}
+    scale = scale._replace(**overrides)
+    if scale.teams_per_season > scale.teams:
+        raise SystemExit("--teams-per-season cannot exceed --teams")
+    return scale
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    for field in Scale._fields:
+        parser.add_argument(f"--{field.replace('_', '-')}", dest=field, type=int)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic league and bulk-load it.")
+    add_scale_arguments(parser)
+    parser.add_argument("--database", default=os.getenv("CPL_BENCH_DB_NAME", "cpl_bench"))
+    parser.add_argument("--method", choices=("insert", "infile"), default="insert",
+                        help="multi-row INSERT batches, or LOAD DATA LOCAL INFILE (server needs local_infile=ON)")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--no-reset", action="store_true", help="load into the existing schema")
+    parser.add_argument("--force", action="store_true", help="allow resetting a database without 'bench' in its name")
+    parser.add_argument("--dry-run", action="store_true", help="only print row counts and a content hash")
+    args = parser.parse_args()
+
+    scale = parse_scale(args)
+    started = time.perf_counter()
+
+    if args.dry_run:
+        counts, digest = fingerprint(scale, args.seed)
+    else:
+        if not args.no_reset and "bench" not in args.database and not args.force:
+            parser.error(f"refusing to reset '{args.database}'; pass --force or use a *bench* database")
+
+        os.environ["CPL_DB_NAME"] = args.database
+        from benchmarks import stand_in
+
+        if not args.no_reset:
+            stand_in.reset_database(args.database)
+        counts = load(args.database, scale, args.seed, args.method, args.batch_size)
+        digest = None
+
+    elapsed = time.perf_counter() - started
+    for table in COLUMNS:
+        print(f"{table:>24} {counts.get(table, 0):>10,}")
+    print(f"{sum(counts.values()):,} rows in {elapsed:.1f}s" + (f"  sha256 {digest}" if digest else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+from services.async_match_service import AsyncMatchService
+
+
+class AsyncMatchController:
+
+    def __init__(self, service: AsyncMatchService):
+        self.service = service
+
+    async def get_by_id(self, match_id: int):
+        return await self.service.get_by_id(match_id)
+
+    async def get_all(self, season_id: int = None, after: str = None, limit: int = None):
+        return await self.service.get_all(season_id=season_id, after=after, limit=limit)
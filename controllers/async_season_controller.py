@@ -0,0 +1,17 @@
+from services.async_season_service import AsyncSeasonService
+from schemas.season_schema import (
+    SeasonResponse,
+    LeagueTableResponse
+)
+
+
+class AsyncSeasonController:
+
+    def __init__(self, service: AsyncSeasonService):
+        self.service = service
+
+    async def get_by_id(self, season_id: int) -> SeasonResponse:
+        return await self.service.get_season(season_id)
+
+    async def get_league_table(self, season_id: int) -> LeagueTableResponse:
+        return await self.service.get_league_table(season_id)
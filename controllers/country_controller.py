@@ -1,5 +1,5 @@
-from typing import List
 from services.country_service import CountryService
+from core.pagination import Page
 from schemas.country_schema import (
     CountryCreateRequest,
     CountryUpdateRequest,
@@ -12,8 +12,8 @@ class CountryController:
     def __init__(self, service: CountryService):
         self.service = service
 
-    def get_all(self) -> List[CountryResponse]:
-        return self.service.get_all()
+    def get_all(self, after: str = None, limit: int = None) -> Page[CountryResponse]:
+        return self.service.get_all(after=after, limit=limit)
 
     def get_by_id(self, country_id: int) -> CountryResponse:
         return self.service.get_by_id(country_id)
@@ -1,7 +1,8 @@
 from services.match_service import MatchService
 from schemas.match_schema import (
     MatchCreateRequest,
-    MatchUpdateRequest
+    MatchUpdateRequest,
+    FixtureGenerateRequest
 )
 
 
@@ -13,11 +14,17 @@ class MatchController:
     def create(self, request: MatchCreateRequest):
         return self.service.create(request)
 
+    def generate_fixtures(self, request: FixtureGenerateRequest):
+        return self.service.generate_fixtures(request)
+
     def get_by_id(self, match_id: int):
         return self.service.get_by_id(match_id)
 
-    def get_all(self, season_id: int = None):
-        return self.service.get_all(season_id=season_id)
+    def get_all(self, season_id: int = None, after: str = None, limit: int = None):
+        return self.service.get_all(season_id=season_id, after=after, limit=limit)
+
+    def iter_all(self, season_id: int = None):
+        return self.service.iter_all(season_id=season_id)
 
     def update(self, match_id: int, request: MatchUpdateRequest):
         return self.service.update(match_id, request)
@@ -1,5 +1,6 @@
-from typing import List
+from typing import Iterator
 from services.player_service import PlayerService
+from core.pagination import Page
 from schemas.player_schema import (
     PlayerCreateRequest,
     PlayerUpdateRequest,
@@ -12,8 +13,11 @@ class PlayerController:
     def __init__(self, service: PlayerService):
         self.service = service
 
-    def get_all(self) -> List[PlayerResponse]:
-        return self.service.get_all()
+    def get_all(self, after: str = None, limit: int = None) -> Page[PlayerResponse]:
+        return self.service.get_all(after=after, limit=limit)
+
+    def iter_all(self) -> Iterator[PlayerResponse]:
+        return self.service.iter_all()
 
     def get_by_id(self, player_id: int) -> PlayerResponse:
         return self.service.get_by_id(player_id)
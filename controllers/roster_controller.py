@@ -1,4 +1,5 @@
 from services.roster_service import RosterService
+from schemas.roster_schema import RosterBulkAssignRequest, RosterCloneRequest
 
 
 class RosterController:
@@ -13,6 +14,12 @@ class RosterController:
             player_id
         )
     
+    def assign_players(self, request: RosterBulkAssignRequest):
+        return self.service.assign_players(request)
+
+    def clone_rosters(self, season_id: int, source_season_id: int, request: RosterCloneRequest):
+        return self.service.clone_rosters(season_id, source_season_id, request)
+
     def remove_player(self, season_id: int, player_id: int):
         return self.service.remove_player(season_id, player_id)
 
@@ -1,6 +1,5 @@
 from typing import List
 from fastapi import HTTPException
-from repositories.season_repository import SeasonRepository
 from services.season_service import SeasonService
 from schemas.season_schema import (
     SeasonCreateRequest,
@@ -12,9 +11,8 @@ from schemas.season_schema import (
 
 class SeasonController:
 
-    def __init__(self, db):
-        self.repository = SeasonRepository(db)
-        self.service = SeasonService(self.repository)
+    def __init__(self, service: SeasonService):
+        self.service = service
 
     def create(self, request: SeasonCreateRequest) -> SeasonResponse:
         return self.service.create_season(request)
@@ -22,8 +20,8 @@ class SeasonController:
     def get_by_id(self, season_id: int) -> SeasonResponse:
         return self.service.get_season(season_id)
 
-    def get_all(self):
-        return self.service.get_all_seasons()
+    def get_all(self, after: str = None, limit: int = None):
+        return self.service.get_all_seasons(after=after, limit=limit)
 
     def update(self, season_id: int, request: SeasonUpdateRequest) -> SeasonResponse:
         return self.service.update_season(season_id, request)
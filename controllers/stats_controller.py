@@ -1,4 +1,6 @@
+from typing import List
 from services.stats_service import StatsService
+from schemas.stats_schema import HeadToHeadPair
 
 
 class StatsController:
@@ -8,3 +10,9 @@ class StatsController:
 
     def get_head_to_head(self, team1_id: int, team2_id: int):
         return self.service.get_head_to_head(team1_id, team2_id)
+
+    def get_head_to_head_matrix(self):
+        return self.service.get_head_to_head_matrix()
+
+    def get_head_to_head_batch(self, pairs: List[HeadToHeadPair]):
+        return self.service.get_head_to_head_batch(pairs)
@@ -0,0 +1,117 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+import aiomysql
+from core.config import settings
+from core.pool import PoolSaturatedError
+
+
+class AsyncDatabase:
+
+    _pool: aiomysql.Pool | None = None
+
+    @classmethod
+    async def initialize(cls) -> None:
+        if cls._pool is not None:
+            return
+
+        cls._pool = await aiomysql.create_pool(
+            minsize=1,
+            maxsize=settings.DB_ASYNC_POOL_SIZE,
+            host=settings.DB_HOST,
+            port=settings.DB_PORT,
+            user=settings.DB_USER,
+            password=settings.DB_PASSWORD,
+            db=settings.DB_NAME,
+            autocommit=False
+        )
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._pool is None:
+            return
+
+        cls._pool.close()
+        await cls._pool.wait_closed()
+        cls._pool = None
+
+    @classmethod
+    async def get_connection(cls):
+        if cls._pool is None:
+            raise RuntimeError("Async database pool is not initialized.")
+        try:
+            return await asyncio.wait_for(cls._pool.acquire(), timeout=settings.DB_POOL_ACQUIRE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise PoolSaturatedError("cpl_async_pool", "acquire timed out", settings.DB_POOL_RETRY_AFTER)
+
+    @classmethod
+    def release(cls, connection) -> None:
+        if cls._pool is not None:
+            cls._pool.release(connection)
+
+
+class AsyncSession:
+
+    def __init__(self):
+        self._connection = None
+
+    @property
+    def acquired(self) -> bool:
+        return self._connection is not None
+
+    async def connection(self):
+        if self._connection is None:
+            self._connection = await AsyncDatabase.get_connection()
+        return self._connection
+
+    @asynccontextmanager
+    async def cursor(self, *args, **kwargs):
+        connection = await self.connection()
+        async with connection.cursor(*args, **kwargs) as cursor:
+            yield cursor
+
+    async def commit(self) -> None:
+        if self._connection is not None:
+            await self._connection.commit()
+
+    async def rollback(self) -> None:
+        if self._connection is not None:
+            await self._connection.rollback()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            AsyncDatabase.release(self._connection)
+            self._connection = None
+
+
+_current: ContextVar[AsyncSession | None] = ContextVar("cpl_async_session", default=None)
+
+
+def current_async_db() -> AsyncSession:
+    session = _current.get()
+    if session is None:
+        raise RuntimeError("No async database session is bound to the current request.")
+    return session
+
+
+class AsyncSessionScoped:
+
+    @property
+    def db(self) -> AsyncSession:
+        return current_async_db()
+
+
+async def get_async_db():
+    session = AsyncSession()
+    previous = _current.get()
+    _current.set(session)
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        session.close()
+        _current.set(previous)
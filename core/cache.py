@@ -0,0 +1,102 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable
+
+from pydantic import BaseModel
+
+from core.config import settings
+
+
+def _detach(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_detach(item) for item in value]
+    if isinstance(value, BaseModel):
+        return value.model_copy(update={
+            name: _detach(item)
+            for name, item in value.__dict__.items()
+            if isinstance(item, (list, BaseModel))
+        })
+    return value
+
+
+class TTLCache:
+
+    registry: Dict[str, "TTLCache"] = {}
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = settings.CACHE_MAX_ENTRIES,
+        ttl_seconds: float = settings.CACHE_TTL
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._generation = 0
+        self._lock = Lock()
+        TTLCache.registry[name] = self
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return _detach(value)
+                del self._entries[key]
+
+            self.misses += 1
+            generation = self._generation
+
+        value = loader()
+
+        if value is None:
+            return None
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+        return _detach(value)
+
+    def invalidate(self, *keys: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in [
+                key for key in self._entries
+                if key == prefix or (isinstance(key, tuple) and key and key[0] == prefix)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
@@ -0,0 +1,45 @@
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+
+class ColumnDefaults:
+
+    _defaults: Dict[Tuple[str, str], Optional[int]] = {}
+    _lock = Lock()
+
+    QUERY = """
+        SELECT COLUMN_DEFAULT
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = %s
+          AND COLUMN_NAME = %s
+    """
+
+    @staticmethod
+    def _parse(value: Any) -> Optional[int]:
+        if value is None:
+            return None
+
+        if isinstance(value, (bytes, bytearray)):
+            value = value.decode()
+
+        try:
+            return int(str(value).strip("'"))
+        except ValueError:
+            return None
+
+    @classmethod
+    def get_int(cls, db, table: str, column: str) -> Optional[int]:
+        key = (table, column)
+
+        with cls._lock:
+            if key in cls._defaults:
+                return cls._defaults[key]
+
+        row = db.fetch_one(cls.QUERY, (table, column))
+        value = cls._parse(row[0] if row else None)
+
+        with cls._lock:
+            cls._defaults[key] = value
+
+        return value
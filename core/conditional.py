@@ -0,0 +1,29 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from core.response import FastJSONResponse
+
+
+def etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _matches(if_none_match: str, tag: str) -> bool:
+    candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+    return tag in candidates or "*" in candidates
+
+
+def conditional_response(request: Request, content: BaseModel, vary: Optional[str] = None) -> Response:
+    response = FastJSONResponse(content)
+    headers = {"ETag": etag(response.body)}
+    if vary:
+        headers["Vary"] = vary
+
+    if _matches(request.headers.get("if-none-match", ""), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return response
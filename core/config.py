@@ -18,6 +18,46 @@ class Settings:
         self.DB_PASSWORD: str = self._get_env("CPL_DB_PWD")
         self.DB_NAME: str = self._get_env("CPL_DB_NAME")
         self.DB_POOL_SIZE: int = self._get_int_env("CPL_DB_POOL_SIZE")
+        self.DB_POOL_MAX_WAITERS: int = self._get_optional_int_env("CPL_DB_POOL_MAX_WAITERS", self.DB_POOL_SIZE * 4)
+        self.DB_POOL_ACQUIRE_TIMEOUT: float = self._get_optional_float_env("CPL_DB_POOL_ACQUIRE_TIMEOUT", 2.0)
+        self.DB_POOL_RETRY_AFTER: int = self._get_optional_int_env("CPL_DB_POOL_RETRY_AFTER", 1)
+        self.DB_PREPARED_STATEMENTS: bool = self._get_bool_env("CPL_DB_PREPARED_STATEMENTS", False)
+        self.DB_STATEMENT_CACHE_SIZE: int = self._get_optional_int_env("CPL_DB_STATEMENT_CACHE_SIZE", 64)
+        self.DB_REPLICA_HOSTS: list[str] = self._get_list_env("CPL_DB_REPLICA_HOSTS")
+        self.DB_REPLICA_POOL_SIZE: int = self._get_optional_int_env("CPL_DB_REPLICA_POOL_SIZE", self.DB_POOL_SIZE)
+        self.DB_REPLICA_MAX_LAG: float = self._get_optional_float_env("CPL_DB_REPLICA_MAX_LAG", 5.0)
+        self.DB_ASYNC: bool = self._get_bool_env("CPL_DB_ASYNC", False)
+        self.DB_ASYNC_POOL_SIZE: int = self._get_optional_int_env("CPL_DB_ASYNC_POOL_SIZE", self.DB_POOL_SIZE)
+
+        self.CACHE_MAX_ENTRIES: int = self._get_optional_int_env("CPL_CACHE_MAX_ENTRIES", 1024)
+        self.CACHE_TTL: int = self._get_optional_int_env("CPL_CACHE_TTL", 300)
+
+        self.PAGE_DEFAULT_LIMIT: int = self._get_optional_int_env("CPL_PAGE_DEFAULT_LIMIT", 100)
+        self.PAGE_MAX_LIMIT: int = self._get_optional_int_env("CPL_PAGE_MAX_LIMIT", 500)
+
+        self.STREAM_CHUNK_SIZE: int = self._get_optional_int_env("CPL_STREAM_CHUNK_SIZE", 500)
+        self.FIXTURE_BATCH_SIZE: int = self._get_optional_int_env("CPL_FIXTURE_BATCH_SIZE", 200)
+
+        self.FAST_RESPONSES: bool = self._get_bool_env("CPL_FAST_RESPONSES", self.APP_ENV == "prod")
+
+        self.SERVER_TIMING: bool = self._get_bool_env("CPL_SERVER_TIMING", True)
+        self.METRICS_ENABLED: bool = self._get_bool_env("CPL_METRICS_ENABLED", False)
+        self.SQL_DEBUG: bool = self._get_bool_env("CPL_SQL_DEBUG", False)
+        self.QUERY_GUARD: Literal["off", "warn"] = self._get_choice_env(
+            "CPL_QUERY_GUARD", ("off", "warn"), "off"
+        )  # type: ignore
+        self.QUERY_BUDGET: int = self._get_optional_int_env("CPL_QUERY_BUDGET", 0)
+        self.QUERY_BUDGETS: list[str] = self._get_list_env("CPL_QUERY_BUDGETS")
+        self.QUERY_REPEAT_THRESHOLD: int = self._get_optional_int_env("CPL_QUERY_REPEAT_THRESHOLD", 5)
+
+        self.LEAGUE_TABLE_SOURCE: Literal["procedure", "engine", "parity"] = self._get_choice_env(
+            "CPL_LEAGUE_TABLE_SOURCE", ("procedure", "engine", "parity"), "procedure"
+        )  # type: ignore
+        self.LEAGUE_TABLE_CACHE_TTL: int = self._get_optional_int_env("CPL_LEAGUE_TABLE_CACHE_TTL", 300)
+        self.HEAD_TO_HEAD_SOURCE: Literal["procedure", "matrix"] = self._get_choice_env(
+            "CPL_HEAD_TO_HEAD_SOURCE", ("procedure", "matrix"), "procedure"
+        )  # type: ignore
+        self.HEAD_TO_HEAD_CACHE_TTL: int = self._get_optional_int_env("CPL_HEAD_TO_HEAD_CACHE_TTL", 300)
 
     @staticmethod
     def _get_env(key: str) -> str:
@@ -36,6 +76,53 @@ class Settings:
         except ValueError:
             raise RuntimeError(f"Environment variable {key} must be an integer.")
 
+    @staticmethod
+    def _get_optional_int_env(key: str, default: int) -> int:
+        value = os.getenv(key)
+        if value is None or value.strip() == "":
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise RuntimeError(f"Environment variable {key} must be an integer.")
+
+    @staticmethod
+    def _get_list_env(key: str) -> list[str]:
+        value = os.getenv(key) or ""
+        return [item.strip() for item in value.split(",") if item.strip()]
+
+    @staticmethod
+    def _get_optional_float_env(key: str, default: float) -> float:
+        value = os.getenv(key)
+        if value is None or value.strip() == "":
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            raise RuntimeError(f"Environment variable {key} must be a number.")
+
+    @staticmethod
+    def _get_choice_env(key: str, choices: tuple[str, ...], default: str) -> str:
+        value = os.getenv(key)
+        if value is None or value.strip() == "":
+            return default
+        normalized = value.strip().lower()
+        if normalized not in choices:
+            raise RuntimeError(f"Environment variable {key} must be one of: {', '.join(choices)}.")
+        return normalized
+
+    @staticmethod
+    def _get_bool_env(key: str, default: bool) -> bool:
+        value = os.getenv(key)
+        if value is None or value.strip() == "":
+            return default
+        normalized = value.strip().lower()
+        if normalized in ("1", "true", "yes", "on"):
+            return True
+        if normalized in ("0", "false", "no", "off"):
+            return False
+        raise RuntimeError(f"Environment variable {key} must be a boolean.")
+
 
 @lru_cache()
 def get_settings() -> Settings:
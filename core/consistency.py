@@ -0,0 +1,23 @@
+import math
+
+from fastapi import Request
+
+from core.config import settings
+from core.database import CONSISTENCY_HEADER, CONSISTENCY_COOKIE
+
+
+async def consistency_middleware(request: Request, call_next):
+    response = await call_next(request)
+
+    token = getattr(request.state, "consistency_token", None)
+    if token is not None and response.status_code < 400:
+        response.headers[CONSISTENCY_HEADER] = str(token)
+        response.set_cookie(
+            CONSISTENCY_COOKIE,
+            str(token),
+            max_age=max(1, math.ceil(settings.DB_REPLICA_MAX_LAG)),
+            httponly=True,
+            samesite="lax"
+        )
+
+    return response
@@ -0,0 +1,46 @@
+from controllers.async_match_controller import AsyncMatchController
+from controllers.async_season_controller import AsyncSeasonController
+from controllers.country_controller import CountryController
+from controllers.match_controller import MatchController
+from controllers.player_controller import PlayerController
+from controllers.roster_controller import RosterController
+from controllers.season_controller import SeasonController
+from controllers.stats_controller import StatsController
+from controllers.team_controller import TeamController
+from repositories.async_match_repository import AsyncMatchRepository
+from repositories.async_season_repository import AsyncSeasonRepository
+from repositories.country_repository import CountryRepository
+from repositories.match_repository import MatchRepository
+from repositories.player_repository import PlayerRepository
+from repositories.roster_repository import RosterRepository
+from repositories.season_repository import SeasonRepository
+from repositories.stats_repository import StatsRepository
+from repositories.team_repository import TeamRepository
+from services.async_match_service import AsyncMatchService
+from services.async_season_service import AsyncSeasonService
+from services.country_service import CountryService
+from services.match_service import MatchService
+from services.player_service import PlayerService
+from services.roster_service import RosterService
+from services.season_service import SeasonService
+from services.stats_service import StatsService
+from services.team_service import TeamService
+
+
+class Container:
+
+    def __init__(self):
+        country_service = CountryService(CountryRepository())
+
+        self.countries = CountryController(country_service)
+        self.players = PlayerController(PlayerService(PlayerRepository(), country_service))
+        self.teams = TeamController(TeamService(TeamRepository()))
+        self.seasons = SeasonController(SeasonService(SeasonRepository()))
+        self.matches = MatchController(MatchService(MatchRepository()))
+        self.rosters = RosterController(RosterService(RosterRepository()))
+        self.stats = StatsController(StatsService(StatsRepository()))
+        self.async_seasons = AsyncSeasonController(AsyncSeasonService(AsyncSeasonRepository()))
+        self.async_matches = AsyncMatchController(AsyncMatchService(AsyncMatchRepository()))
+
+
+container = Container()
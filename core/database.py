@@ -1,43 +1,263 @@
+import itertools
+import logging
+import time
+from contextvars import ContextVar
+from typing import Callable
+
+import anyio
 import mysql.connector
-from mysql.connector import pooling
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
 from core.config import settings
+from core.pool import ConnectionPoolManager, PoolSaturatedError
+
+logger = logging.getLogger(__name__)
+
+CONSISTENCY_HEADER = "X-Consistency-Token"
+CONSISTENCY_COOKIE = "cpl_consistency"
 
 
 class Database:
 
-    _pool: pooling.MySQLConnectionPool | None = None
+    _pool: ConnectionPoolManager | None = None
+    _replicas: list[ConnectionPoolManager] = []
+    _replica_cycle = itertools.count()
 
     @classmethod
-    def initialize(cls) -> None:
-        if cls._pool is not None:
-            return
-
-        cls._pool = pooling.MySQLConnectionPool(
-            pool_name="cpl_pool",
-            pool_size=settings.DB_POOL_SIZE,
-            host=settings.DB_HOST,
-            port=settings.DB_PORT,
+    def _create_pool(cls, name: str, host: str, port: int, pool_size: int) -> ConnectionPoolManager:
+        return ConnectionPoolManager(
+            name,
+            pool_size=pool_size,
+            max_waiters=settings.DB_POOL_MAX_WAITERS,
+            acquire_timeout=settings.DB_POOL_ACQUIRE_TIMEOUT,
+            retry_after=settings.DB_POOL_RETRY_AFTER,
+            host=host,
+            port=port,
             user=settings.DB_USER,
             password=settings.DB_PASSWORD,
             database=settings.DB_NAME,
             autocommit=False
         )
 
+    @classmethod
+    def initialize(cls) -> None:
+        if cls._pool is not None:
+            return
+
+        cls._pool = cls._create_pool("cpl_pool", settings.DB_HOST, settings.DB_PORT, settings.DB_POOL_SIZE)
+
+        cls._replicas = []
+        for index, address in enumerate(settings.DB_REPLICA_HOSTS):
+            host, _, port = address.partition(":")
+            cls._replicas.append(cls._create_pool(
+                f"cpl_replica_{index}",
+                host,
+                int(port) if port else settings.DB_PORT,
+                settings.DB_REPLICA_POOL_SIZE
+            ))
+
     @classmethod
     def get_connection(cls):
         if cls._pool is None:
             raise RuntimeError("Database pool is not initialized.")
-        return cls._pool.get_connection()
+        return cls._pool.acquire()
+
+    @classmethod
+    def write_token(cls) -> int:
+        return int(time.time() * 1000)
+
+    @classmethod
+    def requires_primary(cls, token: int | None = None) -> bool:
+        if not token:
+            return False
+        return time.time() - token / 1000 < settings.DB_REPLICA_MAX_LAG
+
+    @classmethod
+    def get_read_connection(cls, token: int | None = None):
+        if not cls._replicas or cls.requires_primary(token):
+            return cls.get_connection()
+
+        replica = cls._replicas[next(cls._replica_cycle) % len(cls._replicas)]
+        try:
+            return replica.acquire()
+        except (mysql.connector.Error, PoolSaturatedError):
+            return cls.get_connection()
+
+    @classmethod
+    def stats(cls) -> dict | None:
+        if cls._pool is None:
+            return None
+        return {
+            "primary": cls._pool.stats(),
+            "replicas": [replica.stats() for replica in cls._replicas]
+        }
+
+
+class UnitOfWork:
+
+    def __init__(self, acquire: Callable | None = None, read_only: bool = False):
+        self._acquire = acquire or Database.get_connection
+        self.read_only = read_only
+        self._connection = None
+        self._depth = 0
+        self._savepoints = 0
+        self._after_commit: list[Callable[[], None]] = []
+        self.wrote = False
+
+    @property
+    def acquired(self) -> bool:
+        return self._connection is not None
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            self._connection = self._acquire()
+        return self._connection
+
+    def cursor(self, *args, **kwargs):
+        return self.connection.cursor(*args, **kwargs)
+
+    def fetch_all(self, query: str, params=(), dictionary: bool = False) -> list:
+        return self.connection.fetch_all(query, params, dictionary)
+
+    def fetch_one(self, query: str, params=(), dictionary: bool = False):
+        return self.connection.fetch_one(query, params, dictionary)
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self._after_commit.append(callback)
 
-def get_db():
-    connection = Database.get_connection()
+    @contextmanager
+    def transaction(self):
+        if self._depth > 0:
+            with self.savepoint():
+                yield self
+            return
+
+        self._depth += 1
+        try:
+            yield self
+            self.commit()
+        except BaseException:
+            self.rollback()
+            raise
+        finally:
+            self._depth -= 1
+
+    @contextmanager
+    def savepoint(self):
+        self._savepoints += 1
+        name = f"sp_{self._savepoints}"
+        pending = len(self._after_commit)
+
+        cursor = self.cursor()
+        cursor.execute(f"SAVEPOINT {name}")
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            del self._after_commit[pending:]
+            raise
+        else:
+            cursor.execute(f"RELEASE SAVEPOINT {name}")
+        finally:
+            self._depth -= 1
+
+    def commit(self) -> None:
+        if self._connection is not None:
+            self._connection.commit()
+            self.wrote = self.wrote or not self.read_only
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("After-commit callback %r failed", callback)
+
+    def rollback(self) -> None:
+        if self._connection is not None:
+            self._connection.rollback()
+        self._after_commit.clear()
+
+    def release(self) -> None:
+        if not self.read_only or self._connection is None or self._depth > 1:
+            return
+
+        self._connection.commit()
+        self.close()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+_current: ContextVar[UnitOfWork | None] = ContextVar("cpl_unit_of_work", default=None)
+
+
+def current_db() -> UnitOfWork:
+    uow = _current.get()
+    if uow is None:
+        raise RuntimeError("No database session is bound to the current request.")
+    return uow
+
+
+class SessionScoped:
+
+    @property
+    def db(self) -> UnitOfWork:
+        return current_db()
+
+
+async def _offload(uow: UnitOfWork, function: Callable, *args):
+    if uow.acquired:
+        return await run_in_threadpool(function, *args)
+    return function(*args)
+
+
+@asynccontextmanager
+async def session_scope(uow: UnitOfWork):
+    previous = _current.get()
+    _current.set(uow)
+    transaction = uow.transaction()
+    transaction.__enter__()
     try:
-        yield connection
-        connection.commit()
-    except Exception:
-        connection.rollback()
+        yield uow
+    except BaseException as error:
+        with anyio.CancelScope(shield=True):
+            await _offload(uow, transaction.__exit__, type(error), error, error.__traceback__)
         raise
+    else:
+        await _offload(uow, transaction.__exit__, None, None, None)
     finally:
-        connection.close()
\ No newline at end of file
+        with anyio.CancelScope(shield=True):
+            await _offload(uow, uow.close)
+        _current.set(previous)
+
+
+async def get_db(request: Request):
+    async with session_scope(UnitOfWork()) as uow:
+        yield uow
+
+    if uow.wrote:
+        request.state.consistency_token = Database.write_token()
+
+
+def read_token(request: Request) -> int | None:
+    value = request.headers.get(CONSISTENCY_HEADER) or request.cookies.get(CONSISTENCY_COOKIE)
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def read_session(request: Request) -> UnitOfWork:
+    token = read_token(request)
+    return UnitOfWork(lambda: Database.get_read_connection(token), read_only=True)
+
+
+async def get_read_db(request: Request):
+    async with session_scope(read_session(request)) as uow:
+        yield uow
@@ -4,6 +4,7 @@ from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import ValidationError
 
+from core.pool import PoolSaturatedError
 from core.response import ApiResponse
 
 
@@ -53,6 +54,18 @@ def add_exception_handlers(app):
             ).model_dump()
         )
 
+    @app.exception_handler(PoolSaturatedError)
+    async def pool_saturated_exception_handler(request: Request, exc: PoolSaturatedError):
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": str(exc.retry_after)},
+            content=ApiResponse(
+                success=False,
+                message="Service is busy, please retry",
+                data=exc.reason
+            ).model_dump()
+        )
+
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
         return JSONResponse(
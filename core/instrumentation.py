@@ -0,0 +1,229 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from core.config import settings
+from core.metrics import PROCEDURE_LATENCY, REQUEST_LATENCY, REQUESTS_IN_FLIGHT
+from core.query_guard import QueryGuard
+
+logger = logging.getLogger("cpl.sql")
+
+SERVER_TIMING_HEADER = "Server-Timing"
+QUERY_VIOLATIONS_HEADER = "X-Query-Violations"
+
+
+class StatementRecord:
+
+    __slots__ = ("sql", "seconds", "rows", "procedure")
+
+    def __init__(self, sql: str, procedure: bool = False):
+        self.sql = " ".join(sql.split())
+        self.seconds = 0.0
+        self.rows = 0
+        self.procedure = procedure
+
+    def to_dict(self) -> Dict:
+        return {
+            "sql": self.sql,
+            "ms": round(self.seconds * 1000, 3),
+            "rows": self.rows,
+            "procedure": self.procedure
+        }
+
+
+class RequestMetrics:
+
+    def __init__(self, scope: dict, debug: bool = settings.SQL_DEBUG):
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.debug = debug
+        self.guard = QueryGuard(scope) if settings.QUERY_GUARD != "off" else None
+        self.started = time.perf_counter()
+        self.statements = 0
+        self.procedures = 0
+        self.rows = 0
+        self.db_seconds = 0.0
+        self.records: List[StatementRecord] = []
+
+    def statement(self, sql: str, params: Any = None, procedure: bool = False) -> StatementRecord:
+        if self.guard is not None:
+            self.guard.observe(sql, params)
+
+        self.statements += 1
+        if procedure:
+            self.procedures += 1
+
+        record = StatementRecord(sql, procedure)
+        if self.debug:
+            self.records.append(record)
+        return record
+
+    def observe(self, record: Optional[StatementRecord], seconds: float, rows: int = 0) -> None:
+        self.db_seconds += seconds
+        self.rows += rows
+        if record is not None:
+            record.seconds += seconds
+            record.rows += rows
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        total = self.elapsed() * 1000
+        db = self.db_seconds * 1000
+        return (
+            f'db;dur={db:.2f};desc="{self.statements} statements, {self.rows} rows, '
+            f'{self.procedures} procedures", app;dur={max(0.0, total - db):.2f}, total;dur={total:.2f}'
+        )
+
+    def log_record(self, status: Optional[int]) -> Dict:
+        record = {
+            "method": self.method,
+            "path": self.path,
+            "status": status,
+            "total_ms": round(self.elapsed() * 1000, 3),
+            "db_ms": round(self.db_seconds * 1000, 3),
+            "statements": self.statements,
+            "procedures": self.procedures,
+            "rows": self.rows
+        }
+        if self.debug:
+            record["sql"] = [statement.to_dict() for statement in self.records]
+        if self.guard is not None and self.guard.violations:
+            record["query_guard"] = self.guard.summary()
+        return record
+
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar("cpl_request_metrics", default=None)
+
+
+def current_metrics() -> Optional[RequestMetrics]:
+    return _current.get()
+
+
+def _count(rows: Any) -> int:
+    if rows is None:
+        return 0
+    if isinstance(rows, list):
+        return len(rows)
+    return 1
+
+
+class InstrumentedCursor:
+
+    def __init__(self, cursor, metrics: RequestMetrics, record: Optional[StatementRecord] = None):
+        self._cursor = cursor
+        self._metrics = metrics
+        self._record = record
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def _run(self, sql: str, params: Any, procedure: bool, method, *args):
+        self._record = self._metrics.statement(sql, params, procedure)
+        started = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._metrics.observe(self._record, time.perf_counter() - started)
+
+    def _fetch(self, method, *args):
+        started = time.perf_counter()
+        rows = method(*args)
+        self._metrics.observe(self._record, time.perf_counter() - started, _count(rows))
+        return rows
+
+    def execute(self, operation, params=(), *args, **kwargs):
+        return self._run(
+            operation, params, False,
+            lambda: self._cursor.execute(operation, params, *args, **kwargs)
+        )
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        return self._run(
+            operation, seq_params, False,
+            lambda: self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        )
+
+    def callproc(self, procname, args=()):
+        started = time.perf_counter()
+        try:
+            return self._run(
+                f"CALL {procname}", args, True,
+                lambda: self._cursor.callproc(procname, args)
+            )
+        finally:
+            PROCEDURE_LATENCY.observe((procname,), time.perf_counter() - started)
+
+    def stored_results(self):
+        for result in self._cursor.stored_results():
+            yield InstrumentedCursor(result, self._metrics, self._record)
+
+    def fetchone(self):
+        return self._fetch(self._cursor.fetchone)
+
+    def fetchmany(self, size: int = 1):
+        return self._fetch(self._cursor.fetchmany, size)
+
+    def fetchall(self):
+        return self._fetch(self._cursor.fetchall)
+
+
+def instrument_cursor(cursor):
+    metrics = _current.get()
+    return cursor if metrics is None else InstrumentedCursor(cursor, metrics)
+
+
+def timed_fetch(sql: str, params: Any, fetch):
+    metrics = _current.get()
+    if metrics is None:
+        return fetch()
+
+    record = metrics.statement(sql, params)
+    started = time.perf_counter()
+    rows = fetch()
+    metrics.observe(record, time.perf_counter() - started, _count(rows))
+    return rows
+
+
+class InstrumentationMiddleware:
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics(scope)
+        token = _current.set(metrics)
+        status: Optional[int] = None
+        REQUESTS_IN_FLIGHT.inc()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                if settings.SERVER_TIMING:
+                    headers.append((b"server-timing", metrics.server_timing().encode()))
+                if metrics.guard is not None and metrics.guard.violations:
+                    headers.append((b"x-query-violations", str(len(metrics.guard.violations)).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            REQUESTS_IN_FLIGHT.dec()
+            if settings.METRICS_ENABLED:
+                route = scope.get("route")
+                REQUEST_LATENCY.observe(
+                    (metrics.method, getattr(route, "path", "unmatched"), str(status or 500)),
+                    metrics.elapsed()
+                )
+            logger.info(json.dumps(metrics.log_record(status)))
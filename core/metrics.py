@@ -0,0 +1,168 @@
+import functools
+import inspect
+from bisect import bisect_left
+from time import perf_counter
+from threading import Lock
+from typing import Dict, Iterable, List, Tuple
+
+from core.config import settings
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class LatencyHistogram:
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def snapshot(self) -> Dict:
+        cumulative = 0
+        buckets: List[Dict] = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            buckets.append({"le": "+Inf" if bound == float("inf") else bound, "count": cumulative})
+
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _header(name: str, help_text: str, kind: str) -> List[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+
+def render_histogram(name: str, help_text: str, labels: Tuple[str, ...], series: Dict[Tuple, Dict]) -> List[str]:
+    lines = _header(name, help_text, "histogram")
+    for values, snapshot in series.items():
+        for bucket in snapshot["buckets"]:
+            bound = f'le="{bucket["le"]}"'
+            lines.append(f"{name}_bucket{_labels(labels, values, bound)} {bucket['count']}")
+        lines.append(f"{name}_sum{_labels(labels, values)} {snapshot['sum']}")
+        lines.append(f"{name}_count{_labels(labels, values)} {snapshot['count']}")
+    return lines
+
+
+def render_samples(name: str, help_text: str, kind: str, labels: Tuple[str, ...], samples: Iterable[Tuple[Tuple, float]]) -> List[str]:
+    lines = _header(name, help_text, kind)
+    for values, value in samples:
+        lines.append(f"{name}{_labels(labels, values)} {value}")
+    return lines
+
+
+class Histogram:
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...], buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = buckets
+        self._series: Dict[Tuple, LatencyHistogram] = {}
+        self._lock = Lock()
+
+    def observe(self, values: Tuple, seconds: float) -> None:
+        with self._lock:
+            histogram = self._series.get(values)
+            if histogram is None:
+                histogram = self._series[values] = LatencyHistogram(self.buckets)
+            histogram.observe(seconds)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = {values: histogram.snapshot() for values, histogram in self._series.items()}
+        return render_histogram(self.name, self.help_text, self.labels, series)
+
+
+class Gauge:
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.value = 0
+        self._lock = Lock()
+
+    def inc(self) -> None:
+        with self._lock:
+            self.value += 1
+
+    def dec(self) -> None:
+        with self._lock:
+            self.value -= 1
+
+    def render(self) -> List[str]:
+        return render_samples(self.name, self.help_text, "gauge", (), [((), self.value)])
+
+
+REQUEST_LATENCY = Histogram(
+    "cpl_http_request_duration_seconds",
+    "HTTP request latency by route template and status.",
+    ("method", "route", "status")
+)
+REQUESTS_IN_FLIGHT = Gauge("cpl_http_requests_in_flight", "HTTP requests currently being served.")
+REPOSITORY_LATENCY = Histogram(
+    "cpl_repository_duration_seconds",
+    "Repository method latency, including the SQL it runs.",
+    ("method",)
+)
+PROCEDURE_LATENCY = Histogram(
+    "cpl_db_procedure_duration_seconds",
+    "Stored procedure call latency.",
+    ("procedure",)
+)
+
+METRICS = (REQUEST_LATENCY, REQUESTS_IN_FLIGHT, REPOSITORY_LATENCY, PROCEDURE_LATENCY)
+
+
+def _timed(label: str, function):
+    if inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            started = perf_counter()
+            try:
+                return await function(*args, **kwargs)
+            finally:
+                REPOSITORY_LATENCY.observe((label,), perf_counter() - started)
+
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        started = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            REPOSITORY_LATENCY.observe((label,), perf_counter() - started)
+
+    return wrapper
+
+
+def instrument_repository(cls):
+    if not settings.METRICS_ENABLED:
+        return cls
+
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(member):
+            continue
+        if inspect.isgeneratorfunction(member):
+            continue
+        setattr(cls, name, _timed(f"{cls.__name__}.{name}", member))
+
+    return cls
+
@@ -0,0 +1,39 @@
+import base64
+import json
+from typing import Generic, TypeVar, Optional, List
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from core.config import settings
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def page_limit(limit: Optional[int]) -> int:
+    if limit is None:
+        return settings.PAGE_DEFAULT_LIMIT
+    return max(1, min(limit, settings.PAGE_MAX_LIMIT))
+
+
+def encode_cursor(*values) -> str:
+    payload = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+    if not isinstance(values, list) or len(values) != size or not all(isinstance(v, int) for v in values):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+    return values
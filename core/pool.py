@@ -0,0 +1,148 @@
+import time
+from threading import Condition
+from typing import Dict
+
+from mysql.connector import pooling
+
+from core.config import settings
+from core.instrumentation import instrument_cursor, timed_fetch
+from core.metrics import LatencyHistogram
+from core.statements import StatementRegistry
+
+
+class PoolSaturatedError(Exception):
+
+    def __init__(self, pool_name: str, reason: str, retry_after: int):
+        super().__init__(f"Database pool '{pool_name}' is saturated: {reason}")
+        self.pool_name = pool_name
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class ManagedConnection:
+
+    def __init__(self, manager: "ConnectionPoolManager", connection):
+        self._manager = manager
+        self._connection = connection
+        self._acquired_at = time.monotonic()
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def cursor(self, *args, **kwargs):
+        return instrument_cursor(self._connection.cursor(*args, **kwargs))
+
+    def fetch_all(self, query: str, params=(), dictionary: bool = False) -> list:
+        if settings.DB_PREPARED_STATEMENTS:
+            raw = getattr(self._connection, "_cnx", self._connection)
+            registry = StatementRegistry.for_connection(raw)
+            return timed_fetch(query, params, lambda: registry.fetch_all(query, params, dictionary))
+
+        cursor = self.cursor(dictionary=dictionary)
+        cursor.execute(query, tuple(params))
+        return cursor.fetchall()
+
+    def fetch_one(self, query: str, params=(), dictionary: bool = False):
+        rows = self.fetch_all(query, params, dictionary)
+        return rows[0] if rows else None
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+
+        connection, self._connection = self._connection, None
+        try:
+            connection.close()
+        finally:
+            self._manager.release(time.monotonic() - self._acquired_at)
+
+
+class ConnectionPoolManager:
+
+    def __init__(
+        self,
+        name: str,
+        pool_size: int,
+        max_waiters: int,
+        acquire_timeout: float,
+        retry_after: int,
+        **connect_args
+    ):
+        self.name = name
+        self.pool_size = pool_size
+        self.max_waiters = max_waiters
+        self.acquire_timeout = acquire_timeout
+        self.retry_after = retry_after
+        self.in_use = 0
+        self.waiters = 0
+        self.acquired = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.latency = LatencyHistogram()
+        self.hold_latency = LatencyHistogram()
+        self._condition = Condition()
+        self._pool = pooling.MySQLConnectionPool(
+            pool_name=name,
+            pool_size=pool_size,
+            pool_reset_session=not settings.DB_PREPARED_STATEMENTS,
+            **connect_args
+        )
+
+    def acquire(self) -> ManagedConnection:
+        started = time.monotonic()
+
+        with self._condition:
+            if self.in_use >= self.pool_size:
+                if self.waiters >= self.max_waiters:
+                    self.rejected += 1
+                    raise PoolSaturatedError(self.name, "wait queue is full", self.retry_after)
+
+                self.waiters += 1
+                try:
+                    acquired = self._condition.wait_for(
+                        lambda: self.in_use < self.pool_size,
+                        timeout=self.acquire_timeout
+                    )
+                finally:
+                    self.waiters -= 1
+
+                if not acquired:
+                    self.timeouts += 1
+                    raise PoolSaturatedError(self.name, "acquire timed out", self.retry_after)
+
+            self.in_use += 1
+
+        try:
+            connection = self._pool.get_connection()
+        except Exception:
+            self.release()
+            raise
+
+        with self._condition:
+            self.acquired += 1
+            self.latency.observe(time.monotonic() - started)
+
+        return ManagedConnection(self, connection)
+
+    def release(self, held: float | None = None) -> None:
+        with self._condition:
+            self.in_use -= 1
+            if held is not None:
+                self.hold_latency.observe(held)
+            self._condition.notify()
+
+    def stats(self) -> Dict:
+        with self._condition:
+            return {
+                "name": self.name,
+                "size": self.pool_size,
+                "in_use": self.in_use,
+                "idle": self.pool_size - self.in_use,
+                "waiters": self.waiters,
+                "max_waiters": self.max_waiters,
+                "acquired": self.acquired,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "acquire_latency_seconds": self.latency.snapshot(),
+                "hold_seconds": self.hold_latency.snapshot()
+            }
@@ -0,0 +1,94 @@
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.config import settings
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s|\?")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_TRANSACTION_CONTROL = ("SAVEPOINT", "RELEASE", "ROLLBACK")
+
+
+class QueryBudgetExceeded(Exception):
+
+    def __init__(self, route: str, violations: List[str]):
+        super().__init__(f"Query guard tripped on {route}: {'; '.join(violations)}")
+        self.route = route
+        self.violations = violations
+
+
+def normalize(sql: str) -> str:
+    return " ".join(sql.split())
+
+
+def fingerprint(sql: str) -> str:
+    shape = _STRING.sub("?", normalize(sql))
+    shape = _NUMBER.sub("?", shape)
+    shape = _PLACEHOLDER.sub("?", shape)
+    return _LIST.sub("(?+)", shape)
+
+
+def _parse_budgets(entries: Sequence[str]) -> Dict[str, int]:
+    budgets = {}
+    for entry in entries:
+        route, _, limit = entry.rpartition("=")
+        if not route or not limit.strip().isdigit():
+            raise RuntimeError(f"Invalid CPL_QUERY_BUDGETS entry '{entry}', expected 'METHOD /path=N'.")
+        budgets[" ".join(route.split())] = int(limit)
+    return budgets
+
+
+class QueryGuard:
+
+    budgets: Dict[str, int] = _parse_budgets(settings.QUERY_BUDGETS)
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.statements = 0
+        self.violations: List[str] = []
+        self._exact: Counter = Counter()
+        self._shapes: Counter = Counter()
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        path = getattr(route, "path", None) or self.scope.get("path", "")
+        return f"{self.scope.get('method', '')} {path}"
+
+    def budget(self) -> int:
+        return self.budgets.get(self.route, settings.QUERY_BUDGET)
+
+    def _flag(self, violation: str) -> None:
+        self.violations.append(violation)
+
+    def observe(self, sql: str, params: Optional[Any] = None) -> None:
+        shape = fingerprint(sql)
+        if shape.upper().startswith(_TRANSACTION_CONTROL):
+            return
+
+        self.statements += 1
+        key = (normalize(sql), repr(params))
+        self._exact[key] += 1
+        if self._exact[key] == 2:
+            self._flag(f"duplicate statement: {shape}")
+
+        self._shapes[shape] += 1
+        if self._shapes[shape] == settings.QUERY_REPEAT_THRESHOLD:
+            self._flag(f"{settings.QUERY_REPEAT_THRESHOLD} statements of the same shape (N+1): {shape}")
+
+        budget = self.budget()
+        if budget and self.statements == budget + 1:
+            self._flag(f"query budget of {budget} exceeded")
+
+    def check(self) -> None:
+        if self.violations:
+            raise QueryBudgetExceeded(self.route, self.violations)
+
+    def summary(self) -> Dict:
+        return {
+            "route": self.route,
+            "budget": self.budget() or None,
+            "violations": self.violations
+        }
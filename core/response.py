@@ -1,11 +1,72 @@
-from typing import Generic, TypeVar, Optional
+import functools
+import inspect
+from typing import Any, Callable, Generic, TypeVar, Optional, List
+
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
-from pydantic.generics import GenericModel
+
+from core.config import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 T = TypeVar("T")
 
 
-class ApiResponse(GenericModel, Generic[T]):
+class ApiResponse(BaseModel, Generic[T]):
     success: bool = True
     message: Optional[str] = None
     data: Optional[T] = None
+
+
+class PagedApiResponse(ApiResponse[List[T]], Generic[T]):
+    next_cursor: Optional[str] = None
+
+
+class FastJSONResponse(JSONResponse):
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+        return super().render(content)
+
+
+def _to_response(result: Any, kwargs: dict) -> Any:
+    if isinstance(result, Response):
+        return result
+
+    response = FastJSONResponse(result)
+
+    for value in kwargs.values():
+        if isinstance(value, Response):
+            if value.status_code:
+                response.status_code = value.status_code
+            for key, header in value.headers.items():
+                if key != "content-length":
+                    response.headers[key] = header
+
+    return response
+
+
+def fast_response(endpoint: Callable) -> Callable:
+    if not settings.FAST_RESPONSES:
+        return endpoint
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            return _to_response(await endpoint(*args, **kwargs), kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        return _to_response(endpoint(*args, **kwargs), kwargs)
+
+    return wrapper
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence
+
+import mysql.connector
+
+from core.config import settings
+
+
+class StatementRegistry:
+
+    total_prepared = 0
+    total_reused = 0
+
+    def __init__(self, connection, max_statements: int = settings.DB_STATEMENT_CACHE_SIZE):
+        self.connection = connection
+        self.connection_id = connection.connection_id
+        self.max_statements = max_statements
+        self.prepared = 0
+        self.reused = 0
+        self._cursors: OrderedDict = OrderedDict()
+
+    @classmethod
+    def for_connection(cls, connection) -> "StatementRegistry":
+        registry = getattr(connection, "_cpl_statements", None)
+        if registry is None or registry.connection_id != connection.connection_id:
+            registry = cls(connection)
+            connection._cpl_statements = registry
+        return registry
+
+    def _cursor(self, query: str, dictionary: bool):
+        key = (query, dictionary)
+        entry = self._cursors.get(key)
+
+        if entry is not None:
+            self._cursors.move_to_end(key)
+            self.reused += 1
+            StatementRegistry.total_reused += 1
+            return entry
+
+        cursor = self.connection.cursor(prepared=True, dictionary=dictionary)
+        self._cursors[key] = (query, cursor)
+        self.prepared += 1
+        StatementRegistry.total_prepared += 1
+
+        while len(self._cursors) > self.max_statements:
+            _, (_, evicted) = self._cursors.popitem(last=False)
+            self._close(evicted)
+
+        return query, cursor
+
+    @staticmethod
+    def _close(cursor) -> None:
+        try:
+            cursor.close()
+        except mysql.connector.Error:
+            pass
+
+    def fetch_all(self, query: str, params: Sequence[Any] = (), dictionary: bool = False) -> List:
+        key_query, cursor = self._cursor(query, dictionary)
+        try:
+            cursor.execute(key_query, tuple(params))
+            return cursor.fetchall()
+        except mysql.connector.Error:
+            entry = self._cursors.pop((query, dictionary), None)
+            if entry is not None:
+                self._close(entry[1])
+            raise
+
+    def fetch_one(self, query: str, params: Sequence[Any] = (), dictionary: bool = False) -> Optional[Any]:
+        rows = self.fetch_all(query, params, dictionary)
+        return rows[0] if rows else None
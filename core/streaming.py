@@ -0,0 +1,66 @@
+import json
+from itertools import islice
+from typing import AsyncIterator, Callable, Iterator, Mapping, Optional
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import iterate_in_threadpool
+from pydantic import BaseModel
+
+from core.config import settings
+from core.database import read_session, session_scope
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_stream(request: Request, stream: bool) -> bool:
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _chunks(items: Iterator[BaseModel]) -> Iterator[list]:
+    while True:
+        chunk = list(islice(items, settings.STREAM_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _ndjson(items: Iterator[BaseModel]) -> Iterator[bytes]:
+    for chunk in _chunks(items):
+        yield b"".join(item.model_dump_json().encode() + b"\n" for item in chunk)
+
+
+def _json_array(items: Iterator[BaseModel], message: str) -> Iterator[bytes]:
+    yield b'{"success":true,"message":' + json.dumps(message).encode() + b',"data":['
+
+    first = True
+    for chunk in _chunks(items):
+        encoded = b",".join(item.model_dump_json().encode() for item in chunk)
+        yield encoded if first else b"," + encoded
+        first = False
+
+    yield b"]}"
+
+
+def stream_response(
+    request: Request,
+    message: str,
+    produce: Callable[[], Iterator[BaseModel]],
+    headers: Optional[Mapping[str, str]] = None
+) -> StreamingResponse:
+    ndjson = NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+    session = read_session(request)
+
+    async def body() -> AsyncIterator[bytes]:
+        async with session_scope(session):
+            items = produce()
+            async for chunk in iterate_in_threadpool(_ndjson(items) if ndjson else _json_array(items, message)):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=NDJSON_MEDIA_TYPE if ndjson else "application/json",
+        headers={key: value for key, value in (headers or {}).items() if key != "content-length"},
+        background=BackgroundTask(session.close)
+    )
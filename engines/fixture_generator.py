@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+BYE = None
+
+
+def round_robin(team_ids: List[int], double: bool = False) -> List[List[Tuple[int, int]]]:
+    teams: List[Optional[int]] = list(team_ids)
+    if len(teams) % 2:
+        teams.append(BYE)
+
+    half = len(teams) // 2
+    rounds = []
+
+    for round_index in range(len(teams) - 1):
+        pairings = []
+        for slot in range(half):
+            home, away = teams[slot], teams[-1 - slot]
+            if home is BYE or away is BYE:
+                continue
+            if slot == 0 and round_index % 2:
+                home, away = away, home
+            pairings.append((home, away))
+        rounds.append(pairings)
+
+        teams = [teams[0], teams[-1]] + teams[1:-1]
+
+    if double:
+        rounds += [[(away, home) for home, away in pairings] for pairings in rounds]
+
+    return rounds
+
+
+def round_dates(start_date: date, end_date: date, rounds: int) -> List[date]:
+    if rounds <= 1:
+        return [start_date] * rounds
+
+    span = (end_date - start_date).days
+    return [start_date + timedelta(days=index * span // (rounds - 1)) for index in range(rounds)]
+
+
+def schedule(
+    team_ids: List[int],
+    start_date: date,
+    end_date: date,
+    first_order: int,
+    double: bool = False
+) -> List[Tuple[int, int, date, int]]:
+    rounds = round_robin(team_ids, double)
+    dates = round_dates(start_date, end_date, len(rounds))
+
+    fixtures = []
+    order = first_order
+    for pairings, scheduled_date in zip(rounds, dates):
+        for home, away in pairings:
+            fixtures.append((home, away, scheduled_date, order))
+            order += 1
+
+    return fixtures
@@ -0,0 +1,163 @@
+import time
+from threading import Lock
+from typing import Optional, Dict, Tuple, List
+
+from core.config import settings
+from enums.match_outcome import MatchOutcome
+from enums.match_status import MatchStatus
+from schemas.stats_schema import HeadToHeadResponse
+
+
+class HeadToHeadMatrix:
+
+    def __init__(self):
+        self.pairs: Dict[Tuple[int, int], List[int]] = {}
+
+    @classmethod
+    def from_matches(cls, rows) -> "HeadToHeadMatrix":
+        matrix = cls()
+
+        for row in rows:
+            matrix.apply(row)
+
+        return matrix
+
+    @staticmethod
+    def row_from_match(match) -> Optional[dict]:
+        if match is None:
+            return None
+
+        return {
+            "Team1": match.team1,
+            "Team2": match.team2,
+            "Status": match.status,
+            "NetPoints": match.net_points,
+            "Outcome": match.outcome
+        }
+
+    def apply(self, row, sign: int = 1) -> None:
+        if row["Status"] != MatchStatus.Played.value:
+            return
+
+        team1_id, team2_id = row["Team1"], row["Team2"]
+        if team1_id is None or team2_id is None:
+            return
+
+        forward = self.pairs.setdefault((team1_id, team2_id), [0, 0, 0])
+        reverse = self.pairs.setdefault((team2_id, team1_id), [0, 0, 0])
+
+        forward[0] += sign
+        reverse[0] += sign
+
+        net_points = row["NetPoints"] or 0
+
+        if row["Outcome"] == MatchOutcome.Team1Win.value:
+            winner, loser = forward, reverse
+        elif row["Outcome"] == MatchOutcome.Team2Win.value:
+            winner, loser = reverse, forward
+        else:
+            return
+
+        winner[1] += sign
+        winner[2] += sign * net_points
+        loser[2] -= sign * net_points
+
+    def copy(self) -> "HeadToHeadMatrix":
+        matrix = HeadToHeadMatrix()
+        matrix.pairs = {pair: list(totals) for pair, totals in self.pairs.items()}
+        return matrix
+
+    def apply_change(self, before: Optional[dict], after: Optional[dict]) -> None:
+        if before is not None:
+            self.apply(before, sign=-1)
+        if after is not None:
+            self.apply(after)
+
+    def get(self, team1_id: int, team2_id: int) -> HeadToHeadResponse:
+        matches, team1_wins, team1_net_points = self.pairs.get((team1_id, team2_id), (0, 0, 0))
+        _, team2_wins, team2_net_points = self.pairs.get((team2_id, team1_id), (0, 0, 0))
+
+        return HeadToHeadResponse(
+            team1_id=team1_id,
+            team2_id=team2_id,
+            matches_played=matches,
+            team1_wins=team1_wins,
+            team2_wins=team2_wins,
+            team1_net_points=team1_net_points,
+            team2_net_points=team2_net_points
+        )
+
+    def all_pairs(self) -> List[HeadToHeadResponse]:
+        return [
+            self.get(team1_id, team2_id)
+            for (team1_id, team2_id), (matches, _, _) in sorted(self.pairs.items())
+            if matches > 0
+        ]
+
+
+class HeadToHeadMatrixCache:
+
+    _entry: Optional[Tuple[float, HeadToHeadMatrix]] = None
+    _generation = 0
+    _lock = Lock()
+    ttl_seconds: float = settings.HEAD_TO_HEAD_CACHE_TTL
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get(cls) -> Optional[HeadToHeadMatrix]:
+        with cls._lock:
+            if cls._entry is None:
+                cls.misses += 1
+                return None
+
+            expires_at, matrix = cls._entry
+            if expires_at < time.monotonic():
+                cls._entry = None
+                cls.misses += 1
+                return None
+
+            cls.hits += 1
+            return matrix
+
+    @classmethod
+    def generation(cls) -> int:
+        with cls._lock:
+            return cls._generation
+
+    @classmethod
+    def set(cls, matrix: HeadToHeadMatrix, generation: int) -> None:
+        with cls._lock:
+            if generation == cls._generation:
+                cls._entry = (time.monotonic() + cls.ttl_seconds, matrix)
+
+    @classmethod
+    def apply_match_change(cls, before, after) -> None:
+        with cls._lock:
+            cls._generation += 1
+            if cls._entry is None:
+                return
+
+            expires_at, matrix = cls._entry
+            updated = matrix.copy()
+            updated.apply_change(
+                HeadToHeadMatrix.row_from_match(before),
+                HeadToHeadMatrix.row_from_match(after)
+            )
+            cls._entry = (expires_at, updated)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        with cls._lock:
+            cls._generation += 1
+            cls._entry = None
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            return {
+                "name": "head_to_head_matrix",
+                "entries": 0 if cls._entry is None else 1,
+                "hits": cls.hits,
+                "misses": cls.misses
+            }
@@ -0,0 +1,328 @@
+import time
+from bisect import insort
+from threading import Lock
+from typing import Optional, Dict, Tuple, List
+
+from core.config import settings
+from enums.match_category import MatchCategory
+from enums.match_outcome import MatchOutcome
+from enums.match_status import MatchStatus
+from schemas.season_schema import (
+    LeagueTableResponse,
+    LeagueTableStanding
+)
+
+POINTS_PER_WIN = 2
+
+
+class TeamStanding:
+
+    __slots__ = ("team_id", "team_name", "matches_played", "wins", "net_points", "head_to_head_wins")
+
+    def __init__(self, team_id: int, team_name: str):
+        self.team_id = team_id
+        self.team_name = team_name
+        self.matches_played = 0
+        self.wins = 0
+        self.net_points = 0
+        self.head_to_head_wins = 0
+
+    @property
+    def points(self) -> int:
+        return self.wins * POINTS_PER_WIN
+
+    def sort_key(self):
+        return (
+            -self.points,
+            -self.head_to_head_wins,
+            -self.net_points,
+            -self.wins,
+            self.team_name,
+            self.team_id
+        )
+
+
+class SeasonStandings:
+
+    def __init__(self):
+        self.teams: Dict[int, TeamStanding] = {}
+        self.fixtures: Dict[int, int] = {}
+        self.wins_against: Dict[Tuple[int, int], int] = {}
+        self.winner_id: Optional[int] = None
+        self.ranking: List[TeamStanding] = []
+
+    @classmethod
+    def from_matches(cls, rows) -> "SeasonStandings":
+        standings = cls()
+
+        for row in rows:
+            standings.add_fixture(row)
+            standings.apply(row)
+
+        standings.rank()
+        return standings
+
+    @staticmethod
+    def row_from_match(match) -> Optional[dict]:
+        if match is None:
+            return None
+
+        return {
+            "Team1": match.team1,
+            "Team2": match.team2,
+            "Category": match.category,
+            "Status": match.status,
+            "NetPoints": match.net_points,
+            "Outcome": match.outcome
+        }
+
+    def add_fixture(self, row) -> None:
+        if row["Category"] != MatchCategory.League.value:
+            return
+
+        for side in ("Team1", "Team2"):
+            team_id = row[side]
+            if team_id is None:
+                continue
+            if team_id not in self.teams:
+                self.teams[team_id] = TeamStanding(team_id, row[f"{side}Name"])
+            self.fixtures[team_id] = self.fixtures.get(team_id, 0) + 1
+
+    def remove_fixture(self, row) -> None:
+        if row["Category"] != MatchCategory.League.value:
+            return
+
+        for side in ("Team1", "Team2"):
+            team_id = row[side]
+            if team_id is None:
+                continue
+            self.fixtures[team_id] -= 1
+            if self.fixtures[team_id] == 0:
+                del self.fixtures[team_id]
+                self.ranking.remove(self.teams.pop(team_id))
+
+    def apply(self, row, sign: int = 1) -> None:
+        result = self.match_result(row)
+        if result is None:
+            return
+
+        category, winner_id, loser_id, net_points = result
+
+        if category == MatchCategory.Final.value:
+            if sign > 0:
+                self.winner_id = winner_id
+            elif self.winner_id == winner_id:
+                self.winner_id = None
+            return
+
+        winner = self.teams[winner_id]
+        loser = self.teams[loser_id]
+
+        winner.matches_played += sign
+        loser.matches_played += sign
+        winner.wins += sign
+        winner.net_points += sign * net_points
+        loser.net_points -= sign * net_points
+
+        key = (winner_id, loser_id)
+        self.wins_against[key] = self.wins_against.get(key, 0) + sign
+
+    def knows(self, row) -> bool:
+        result = self.match_result(row)
+
+        if row["Category"] == MatchCategory.Final.value:
+            return result is None or self.winner_id == result[1]
+
+        if row["Category"] != MatchCategory.League.value:
+            return True
+
+        for side in ("Team1", "Team2"):
+            team_id = row[side]
+            if team_id is not None and (team_id not in self.teams or not self.fixtures.get(team_id)):
+                return False
+
+        return result is None or self.wins_against.get((result[1], result[2]), 0) > 0
+
+    def apply_change(self, before: Optional[dict], after: Optional[dict]) -> bool:
+        if before is not None and not self.knows(before):
+            return False
+
+        if after is not None and after["Category"] == MatchCategory.League.value:
+            for side in ("Team1", "Team2"):
+                if after[side] is not None and after[side] not in self.teams:
+                    return False
+
+        touched = set()
+        for row in (before, after):
+            if row is not None and row["Category"] == MatchCategory.League.value:
+                touched.update(team_id for team_id in (row["Team1"], row["Team2"]) if team_id is not None)
+
+        affected_points = {self.teams[team_id].points for team_id in touched}
+
+        if before is not None:
+            self.apply(before, sign=-1)
+        if after is not None:
+            self.add_fixture(after)
+        if before is not None:
+            self.remove_fixture(before)
+        if after is not None:
+            self.apply(after)
+
+        touched &= self.teams.keys()
+        affected_points.update(self.teams[team_id].points for team_id in touched)
+
+        self.rerank(affected_points)
+        return True
+
+    @staticmethod
+    def match_result(row):
+        if row["Status"] != MatchStatus.Played.value:
+            return None
+
+        if row["Category"] not in (MatchCategory.League.value, MatchCategory.Final.value):
+            return None
+
+        if row["Team1"] is None or row["Team2"] is None:
+            return None
+
+        if row["Outcome"] == MatchOutcome.Team1Win.value:
+            winner_id, loser_id = row["Team1"], row["Team2"]
+        elif row["Outcome"] == MatchOutcome.Team2Win.value:
+            winner_id, loser_id = row["Team2"], row["Team1"]
+        else:
+            return None
+
+        return row["Category"], winner_id, loser_id, row["NetPoints"] or 0
+
+    def refresh_head_to_head(self, teams: List[TeamStanding]) -> None:
+        for team in teams:
+            team.head_to_head_wins = sum(
+                self.wins_against.get((team.team_id, other.team_id), 0)
+                for other in teams
+                if other.team_id != team.team_id
+            )
+
+    def rank(self) -> None:
+        groups: Dict[int, List[TeamStanding]] = {}
+        for team in self.teams.values():
+            groups.setdefault(team.points, []).append(team)
+
+        for group in groups.values():
+            self.refresh_head_to_head(group)
+
+        self.ranking = sorted(self.teams.values(), key=TeamStanding.sort_key)
+
+    def rerank(self, affected_points: set) -> None:
+        moved = [team for team in self.teams.values() if team.points in affected_points]
+
+        groups: Dict[int, List[TeamStanding]] = {}
+        for team in moved:
+            groups.setdefault(team.points, []).append(team)
+
+        for group in groups.values():
+            self.refresh_head_to_head(group)
+
+        moved_ids = {team.team_id for team in moved}
+        self.ranking = [team for team in self.ranking if team.team_id not in moved_ids]
+
+        for team in moved:
+            insort(self.ranking, team, key=TeamStanding.sort_key)
+
+    def to_response(self, season_status: int) -> LeagueTableResponse:
+        return LeagueTableResponse(
+            winner_id=self.winner_id if self.winner_id in self.teams else None,
+            season_status=season_status,
+            standings=[
+                LeagueTableStanding(
+                    team_id=team.team_id,
+                    team_name=team.team_name,
+                    matches_played=team.matches_played,
+                    wins=team.wins,
+                    points=team.points,
+                    net_points=team.net_points,
+                    head_to_head_wins=team.head_to_head_wins
+                )
+                for team in self.ranking
+            ]
+        )
+
+
+class StandingsStore:
+
+    _entries: Dict[int, Tuple[float, SeasonStandings]] = {}
+    _generation = 0
+    _lock = Lock()
+    ttl_seconds: float = settings.LEAGUE_TABLE_CACHE_TTL
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get_table(cls, season_id: int, season_status: int) -> Optional[LeagueTableResponse]:
+        with cls._lock:
+            entry = cls._entries.get(season_id)
+            if entry is None:
+                cls.misses += 1
+                return None
+
+            expires_at, standings = entry
+            if expires_at < time.monotonic():
+                del cls._entries[season_id]
+                cls.misses += 1
+                return None
+
+            cls.hits += 1
+            return standings.to_response(season_status)
+
+    @classmethod
+    def generation(cls) -> int:
+        with cls._lock:
+            return cls._generation
+
+    @classmethod
+    def set(cls, season_id: int, standings: SeasonStandings, generation: int) -> None:
+        with cls._lock:
+            if generation == cls._generation:
+                cls._entries[season_id] = (time.monotonic() + cls.ttl_seconds, standings)
+
+    @classmethod
+    def apply_match_change(cls, season_id: int, before, after) -> None:
+        with cls._lock:
+            cls._generation += 1
+            entry = cls._entries.get(season_id)
+            if entry is None:
+                return
+
+            _, standings = entry
+            try:
+                applied = standings.apply_change(
+                    SeasonStandings.row_from_match(before),
+                    SeasonStandings.row_from_match(after)
+                )
+            except Exception:
+                del cls._entries[season_id]
+                raise
+
+            if not applied:
+                del cls._entries[season_id]
+
+    @classmethod
+    def invalidate(cls, season_id: int) -> None:
+        with cls._lock:
+            cls._generation += 1
+            cls._entries.pop(season_id, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._generation += 1
+            cls._entries.clear()
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            return {
+                "name": "standings",
+                "entries": len(cls._entries),
+                "hits": cls.hits,
+                "misses": cls.misses
+            }
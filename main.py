@@ -2,9 +2,12 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 
-from core.database import Database
+from core.database import Database, CONSISTENCY_HEADER
+from core.async_database import AsyncDatabase
 from core.config import settings
 from core.exceptions import add_exception_handlers
+from core.consistency import consistency_middleware
+from core.instrumentation import InstrumentationMiddleware, SERVER_TIMING_HEADER
 from routes.season_routes import router as season_router
 from routes.team_routes import router as team_router
 from routes.player_routes import router as player_router
@@ -12,21 +15,36 @@ from routes.country_routes import router as country_router
 from routes.stats_routes import router as stats_router
 from routes.roster_routes import router as roster_router
 from routes.match_routes import router as match_router
+from routes.health_routes import router as health_router
+from routes.metrics_routes import router as metrics_router
+from routes.async_match_routes import router as async_match_router
+from routes.async_season_routes import router as async_season_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     Database.initialize()
+    if settings.DB_ASYNC:
+        await AsyncDatabase.initialize()
     yield
+    if settings.DB_ASYNC:
+        await AsyncDatabase.close()
 
 app = FastAPI(lifespan=lifespan)
 add_exception_handlers(app)
+app.middleware("http")(consistency_middleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.APP_ALLOWED_HOSTS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[CONSISTENCY_HEADER, SERVER_TIMING_HEADER],
 )
+app.add_middleware(InstrumentationMiddleware)
+
+if settings.DB_ASYNC:
+    app.include_router(async_season_router)
+    app.include_router(async_match_router)
 
 app.include_router(season_router)
 app.include_router(team_router)
@@ -34,4 +52,8 @@ app.include_router(player_router)
 app.include_router(country_router)
 app.include_router(stats_router)
 app.include_router(roster_router)
-app.include_router(match_router)
\ No newline at end of file
+app.include_router(match_router)
+app.include_router(health_router)
+
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
@@ -0,0 +1,8 @@
+-- Enforce unique country names and ISO codes among live rows (MySQL 8.0.13+).
+-- Voided rows map to NULL, so a soft-deleted country does not block its name
+-- or codes from being reused. CountryService turns violations (1062) into 400s.
+
+ALTER TABLE tblCountries
+    ADD UNIQUE KEY UX_Countries_Name ((IF(Void = 0, Name, NULL))),
+    ADD UNIQUE KEY UX_Countries_IsoCode2 ((IF(Void = 0, IsoCode2, NULL))),
+    ADD UNIQUE KEY UX_Countries_IsoCode3 ((IF(Void = 0, IsoCode3, NULL)));
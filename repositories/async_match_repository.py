@@ -0,0 +1,32 @@
+from typing import Optional
+import aiomysql
+
+from repositories.match_repository import MatchRepository
+from core.pagination import Page
+from core.metrics import instrument_repository
+from core.async_database import AsyncSessionScoped
+from schemas.match_schema import MatchResponse
+
+
+@instrument_repository
+class AsyncMatchRepository(AsyncSessionScoped):
+
+    async def get_by_id(self, match_id: int) -> Optional[MatchResponse]:
+        query = """
+            SELECT *
+            FROM tblMatches
+            WHERE Id = %s AND Void = 0
+        """
+
+        async with self.db.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, (match_id,))
+            return MatchRepository._map(await cursor.fetchone())
+
+    async def get_all(self, season_id: int = None, after: str = None, limit: int = None) -> Page[MatchResponse]:
+        query, params = MatchRepository._page_query(season_id, after, limit)
+
+        async with self.db.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, params)
+            rows = await cursor.fetchall()
+
+        return MatchRepository._to_page(rows, limit)
@@ -0,0 +1,43 @@
+from typing import Optional, List
+import aiomysql
+
+from core.metrics import instrument_repository
+from core.async_database import AsyncSessionScoped
+from repositories.season_repository import SeasonRepository
+from schemas.season_schema import (
+    SeasonResponse,
+    LeagueTableResponse
+)
+
+
+@instrument_repository
+class AsyncSeasonRepository(AsyncSessionScoped):
+
+    async def get_by_id(self, season_id: int) -> Optional[SeasonResponse]:
+        query = """
+            SELECT Id, Name, StartDate, EndDate, Status
+            FROM tblSeasons
+            WHERE Id = %s AND Void = 0
+        """
+
+        async with self.db.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, (season_id,))
+            row = await cursor.fetchone()
+
+        return SeasonRepository._map_row_to_schema(row)
+
+    async def get_league_matches(self, season_id: int) -> List[dict]:
+        async with self.db.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(SeasonRepository.LEAGUE_MATCHES_QUERY, (season_id,))
+            return await cursor.fetchall()
+
+    async def get_league_table(self, season_id: int) -> LeagueTableResponse:
+        async with self.db.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.callproc("usp_GetLeagueTable", (season_id,))
+            league_rows = await cursor.fetchall()
+
+            status_row = None
+            if await cursor.nextset():
+                status_row = await cursor.fetchone()
+
+        return SeasonRepository._map_league_table(league_rows, status_row)
@@ -1,4 +1,8 @@
-from typing import List, Optional
+from typing import Optional
+from core.cache import TTLCache
+from core.pagination import Page, page_limit, encode_cursor, decode_cursor
+from core.metrics import instrument_repository
+from core.database import SessionScoped
 from schemas.country_schema import (
     CountryCreateRequest,
     CountryUpdateRequest,
@@ -6,22 +10,50 @@ from schemas.country_schema import (
 )
 
 
-class CountryRepository:
+@instrument_repository
+class CountryRepository(SessionScoped):
 
-    def __init__(self, db):
-        self.db = db
+    cache = TTLCache("countries")
 
-    def get_all(self) -> List[CountryResponse]:
-        cursor = self.db.cursor(dictionary=True)
-        cursor.execute("""
+    @classmethod
+    def _invalidate(cls, country_id: int) -> None:
+        cls.cache.invalidate(("id", country_id))
+        cls.cache.invalidate_prefix("all")
+
+    def get_all(self, after: str = None, limit: int = None) -> Page[CountryResponse]:
+        return self.cache.get_or_load(
+            ("all", after, page_limit(limit)),
+            lambda: self._fetch_all(after, limit)
+        )
+
+    def get_by_id(self, country_id: int, cached: bool = True) -> Optional[CountryResponse]:
+        if not cached:
+            return self._fetch_by_id(country_id)
+        return self.cache.get_or_load(("id", country_id), lambda: self._fetch_by_id(country_id))
+
+    def _fetch_all(self, after: str = None, limit: int = None) -> Page[CountryResponse]:
+        query = """
             SELECT Id, Name, IsoCode2, IsoCode3,
                    Capital, PhoneCode, Continent
             FROM tblCountries
             WHERE Void = 0
-        """)
+        """
+        params = []
+
+        if after is not None:
+            (last_id,) = decode_cursor(after, 1)
+            query += " AND Id > %s"
+            params.append(last_id)
+
+        size = page_limit(limit)
+        query += " ORDER BY Id ASC LIMIT %s"
+        params.append(size + 1)
+
+        cursor = self.db.cursor(dictionary=True)
+        cursor.execute(query, tuple(params))
         rows = cursor.fetchall()
 
-        return [
+        items = [
             CountryResponse(
                 id=row["Id"],
                 name=row["Name"],
@@ -31,18 +63,19 @@ class CountryRepository:
                 phone_code=row["PhoneCode"],
                 continent=row["Continent"]
             )
-            for row in rows
+            for row in rows[:size]
         ]
 
-    def get_by_id(self, country_id: int) -> Optional[CountryResponse]:
-        cursor = self.db.cursor(dictionary=True)
-        cursor.execute("""
+        next_cursor = encode_cursor(items[-1].id) if len(rows) > size else None
+        return Page[CountryResponse](items=items, next_cursor=next_cursor)
+
+    def _fetch_by_id(self, country_id: int) -> Optional[CountryResponse]:
+        row = self.db.fetch_one("""
             SELECT Id, Name, IsoCode2, IsoCode3,
                    Capital, PhoneCode, Continent
             FROM tblCountries
             WHERE Id = %s AND Void = 0
-        """, (country_id,))
-        row = cursor.fetchone()
+        """, (country_id,), dictionary=True)
 
         if not row:
             return None
@@ -58,36 +91,28 @@ class CountryRepository:
         )
 
     def exists_by_id(self, country_id: int) -> bool:
-        cursor = self.db.cursor()
-        cursor.execute(
+        return self.db.fetch_one(
             "SELECT 1 FROM tblCountries WHERE Id = %s AND Void = 0 LIMIT 1",
             (country_id,)
-        )
-        return cursor.fetchone() is not None
+        ) is not None
 
     def exists_by_name(self, name: str) -> bool:
-        cursor = self.db.cursor()
-        cursor.execute(
+        return self.db.fetch_one(
             "SELECT 1 FROM tblCountries WHERE Name = %s AND Void = 0 LIMIT 1",
             (name,)
-        )
-        return cursor.fetchone() is not None
+        ) is not None
 
     def exists_by_iso2(self, iso_code2: str) -> bool:
-        cursor = self.db.cursor()
-        cursor.execute(
+        return self.db.fetch_one(
             "SELECT 1 FROM tblCountries WHERE IsoCode2 = %s AND Void = 0 LIMIT 1",
             (iso_code2,)
-        )
-        return cursor.fetchone() is not None
+        ) is not None
 
     def exists_by_iso3(self, iso_code3: str) -> bool:
-        cursor = self.db.cursor()
-        cursor.execute(
+        return self.db.fetch_one(
             "SELECT 1 FROM tblCountries WHERE IsoCode3 = %s AND Void = 0 LIMIT 1",
             (iso_code3,)
-        )
-        return cursor.fetchone() is not None
+        ) is not None
 
     def create(self, request: CountryCreateRequest) -> CountryResponse:
         cursor = self.db.cursor()
@@ -107,16 +132,22 @@ class CountryRepository:
             request.continent
         ))
 
-        self.db.commit()
         country_id = cursor.lastrowid
+        self.db.after_commit(lambda: self._invalidate(country_id))
 
-        return self.get_by_id(country_id)
+        return CountryResponse(id=country_id, **request.model_dump())
 
-    def update(self, country_id: int, request: CountryUpdateRequest) -> Optional[CountryResponse]:
+    def update(
+        self,
+        country_id: int,
+        request: CountryUpdateRequest,
+        existing: Optional[CountryResponse] = None
+    ) -> Optional[CountryResponse]:
+        existing = existing or self._fetch_by_id(country_id)
         update_data = request.model_dump(exclude_unset=True)
 
-        if not update_data:
-            return self.get_by_id(country_id)
+        if not existing or not update_data:
+            return existing
 
         field_mapping = {
             "name": "Name",
@@ -136,7 +167,7 @@ class CountryRepository:
                 values.append(value)
 
         if not fields:
-            return self.get_by_id(country_id)
+            return existing
 
         query = f"""
             UPDATE tblCountries
@@ -148,9 +179,14 @@ class CountryRepository:
 
         cursor = self.db.cursor()
         cursor.execute(query, tuple(values))
-        self.db.commit()
+        self.db.after_commit(lambda: self._invalidate(country_id))
+
+        if cursor.rowcount == 0:
+            return self._fetch_by_id(country_id)
 
-        return self.get_by_id(country_id)
+        return existing.model_copy(
+            update={key: value for key, value in update_data.items() if key in field_mapping}
+        )
 
     def delete(self, country_id: int) -> bool:
         cursor = self.db.cursor()
@@ -159,6 +195,6 @@ class CountryRepository:
             SET Void = 1
             WHERE Id = %s AND Void = 0
         """, (country_id,))
-        self.db.commit()
+        self.db.after_commit(lambda: self._invalidate(country_id))
 
         return cursor.rowcount > 0
\ No newline at end of file
@@ -1,5 +1,12 @@
-from typing import Optional, List
+from typing import Optional, List, Iterator
+from core.config import settings
+from core.pagination import Page, page_limit, encode_cursor, decode_cursor
+from core.column_defaults import ColumnDefaults
+from core.metrics import instrument_repository
+from core.database import SessionScoped
 from enums.match_category import MatchCategory
+from enums.match_outcome import MatchOutcome
+from enums.match_status import MatchStatus
 from schemas.match_schema import (
     MatchCreateRequest,
     MatchUpdateRequest,
@@ -8,10 +15,8 @@ from schemas.match_schema import (
 )
 
 
-class MatchRepository:
-
-    def __init__(self, db):
-        self.db = db
+@instrument_repository
+class MatchRepository(SessionScoped):
 
     @staticmethod
     def _map(row) -> Optional[MatchResponse]:
@@ -41,7 +46,7 @@ class MatchRepository:
             order=row["Order"],
             toss_outcome=row["TossOutcome"]
         )
-        
+
     def create(self, request: MatchCreateRequest) -> MatchResponse:
         query = """
             INSERT INTO tblMatches (
@@ -62,6 +67,7 @@ class MatchRepository:
         """
 
         if request.category == MatchCategory.Final:
+            self.lock_season(request.season_id)
             query1 = """
                 SELECT 1
                 FROM tblMatches
@@ -71,9 +77,7 @@ class MatchRepository:
                 LIMIT 1
             """
 
-            cursor = self.db.cursor()
-            cursor.execute(query1, (request.season_id, request.category.value))
-            row = cursor.fetchone()
+            row = self.db.fetch_one(query1, (request.season_id, request.category.value))
             if row is not None:
                 raise ValueError("Final match already exists")
 
@@ -97,11 +101,116 @@ class MatchRepository:
             )
         )
 
-        self.db.commit()
-
         match_id = cursor.lastrowid
-        return self.get_by_id(match_id)
+
+        toss_outcome = ColumnDefaults.get_int(self.db, "tblMatches", "TossOutcome")
+        if request.order is None or toss_outcome is None:
+            return self.get_by_id(match_id)
+
+        return MatchResponse(
+            id=match_id,
+            team1=request.team1,
+            team2=request.team2,
+            scheduled_date=request.scheduled_date,
+            duration=request.duration,
+            extra=request.extra,
+            golden_strike=bool(request.golden_strike),
+            category=request.category.value,
+            status=request.status.value,
+            season_id=request.season_id,
+            net_points=request.net_points,
+            outcome=request.outcome.value,
+            order=request.order,
+            toss_outcome=toss_outcome
+        )
     
+    def lock_season(self, season_id: int) -> Optional[int]:
+        row = self.db.fetch_one("""
+            SELECT Status
+            FROM tblSeasons
+            WHERE Id = %s AND Void = 0
+            FOR UPDATE
+        """, (season_id,))
+        return int(row[0]) if row else None
+
+    def get_season_team_ids(self, season_id: int) -> List[int]:
+        query = """
+            SELECT DISTINCT pst.TeamId
+            FROM tblPlayersSeasonsTeams pst
+            JOIN tblTeams t ON t.Id = pst.TeamId AND t.Void = 0
+            WHERE pst.SeasonId = %s
+              AND pst.Void = 0
+            ORDER BY pst.TeamId
+        """
+
+        cursor = self.db.cursor()
+        cursor.execute(query, (season_id,))
+        return [row[0] for row in cursor.fetchall()]
+
+    def create_fixtures(self, season_id: int, fixtures) -> List[MatchResponse]:
+        if not fixtures:
+            return []
+
+        query = """
+            INSERT INTO tblMatches (
+                Team1,
+                Team2,
+                ScheduledDate,
+                GoldenStrike,
+                Category,
+                Status,
+                `Order`,
+                SeasonId,
+                Outcome
+            )
+            VALUES (%s, %s, %s, 0, %s, %s, %s, %s, %s)
+        """
+
+        cursor = self.db.cursor()
+        for start in range(0, len(fixtures), settings.FIXTURE_BATCH_SIZE):
+            batch = fixtures[start:start + settings.FIXTURE_BATCH_SIZE]
+            cursor.executemany(
+                query,
+                [
+                    (
+                        team1,
+                        team2,
+                        scheduled_date,
+                        MatchCategory.League.value,
+                        MatchStatus.Scheduled.value,
+                        order,
+                        season_id,
+                        MatchOutcome.NotDecided.value
+                    )
+                    for team1, team2, scheduled_date, order in batch
+                ]
+            )
+
+        inserted = {(order, team1, team2) for team1, team2, _, order in fixtures}
+        orders = sorted({order for order, _, _ in inserted})
+        query = f"""
+            SELECT *
+            FROM tblMatches
+            WHERE SeasonId = %s
+            AND Void = 0
+            AND `Order` IN ({", ".join(["%s"] * len(orders))})
+            ORDER BY `Order` ASC, Id ASC
+        """
+
+        cursor = self.db.cursor(dictionary=True)
+        cursor.execute(query, (season_id, *orders))
+
+        latest = {}
+        for row in cursor.fetchall():
+            key = (row["Order"], row["Team1"], row["Team2"])
+            if key in inserted:
+                latest[key] = row
+
+        if len(latest) != len(inserted):
+            raise RuntimeError("Inserted fixtures could not be read back")
+
+        return [self._map(latest[key]) for key in sorted(latest)]
+
     def get_by_id(self, match_id: int) -> Optional[MatchResponse]:
         query = """
             SELECT *
@@ -109,33 +218,87 @@ class MatchRepository:
             WHERE Id = %s AND Void = 0
         """
 
-        cursor = self.db.cursor(dictionary=True)
-        cursor.execute(query, (match_id,))
-        return self._map(cursor.fetchone())
+        return self._map(self.db.fetch_one(query, (match_id,), dictionary=True))
 
-    def get_all(self, season_id: int = None) -> List[MatchResponse]:
+    @staticmethod
+    def _page_query(season_id: int = None, after: str = None, limit: int = None):
         query = """
             SELECT *
             FROM tblMatches
             WHERE Void = 0
         """
+        params = []
 
         if season_id is not None:
-            query += f" AND SeasonId = {season_id}"
+            query += " AND SeasonId = %s"
+            params.append(season_id)
+
+        if after is not None:
+            order, match_id = decode_cursor(after, 2)
+            query += " AND (`Order` > %s OR (`Order` = %s AND Id > %s))"
+            params.extend([order, order, match_id])
+
+        query += " ORDER BY `Order` ASC, Id ASC LIMIT %s"
+        params.append(page_limit(limit) + 1)
+
+        return query, tuple(params)
 
-        query += " ORDER BY `Order` ASC"
+    @classmethod
+    def _to_page(cls, rows, limit: int = None) -> Page[MatchResponse]:
+        size = page_limit(limit)
+        items = [cls._map(row) for row in rows[:size]]
+
+        next_cursor = None
+        if len(rows) > size:
+            last = items[-1]
+            next_cursor = encode_cursor(last.order, last.id)
+
+        return Page[MatchResponse](items=items, next_cursor=next_cursor)
+
+    def get_all(self, season_id: int = None, after: str = None, limit: int = None) -> Page[MatchResponse]:
+        query, params = self._page_query(season_id, after, limit)
 
         cursor = self.db.cursor(dictionary=True)
-        cursor.execute(query)
+        cursor.execute(query, params)
         rows = cursor.fetchall()
 
-        return [self._map(row) for row in rows]
+        return self._to_page(rows, limit)
+
+    def iter_all(self, season_id: int = None) -> Iterator[MatchResponse]:
+        query = """
+            SELECT *
+            FROM tblMatches
+            WHERE Void = 0
+        """
+        params = []
+
+        if season_id is not None:
+            query += " AND SeasonId = %s"
+            params.append(season_id)
+
+        query += " ORDER BY `Order` ASC, Id ASC"
 
-    def update(self, match_id: int, request: MatchUpdateRequest) -> Optional[MatchResponse]:
+        cursor = self.db.cursor(dictionary=True)
+        cursor.execute(query, tuple(params))
+
+        while True:
+            rows = cursor.fetchmany(settings.STREAM_CHUNK_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield self._map(row)
+
+    def update(
+        self,
+        match_id: int,
+        request: MatchUpdateRequest,
+        existing: Optional[MatchResponse] = None
+    ) -> Optional[MatchResponse]:
+        existing = existing or self.get_by_id(match_id)
         update_data = request.model_dump(exclude_unset=True)
 
-        if not update_data:
-            return self.get_by_id(match_id)
+        if not existing or not update_data or existing.status == MatchStatus.Played.value:
+            return existing
 
         field_mapping = {
             "team1": "Team1",
@@ -168,9 +331,12 @@ class MatchRepository:
 
         cursor = self.db.cursor()
         cursor.execute(query, tuple(values))
-        self.db.commit()
 
-        return self.get_by_id(match_id)
+        if cursor.rowcount == 0:
+            return self.get_by_id(match_id)
+
+        changes = {key: value for key, value in update_data.items() if key in field_mapping}
+        return MatchResponse.model_validate({**existing.model_dump(), **changes})
 
     def soft_delete(self, match_id: int) -> bool:
         query = """
@@ -181,7 +347,6 @@ class MatchRepository:
 
         cursor = self.db.cursor()
         cursor.execute(query, (match_id,))
-        self.db.commit()
 
         return cursor.rowcount > 0
     
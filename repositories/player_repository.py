@@ -1,4 +1,9 @@
-from typing import Optional, List
+from typing import Optional, Iterator
+from core.config import settings
+from core.cache import TTLCache
+from core.pagination import Page, page_limit, encode_cursor, decode_cursor
+from core.metrics import instrument_repository
+from core.database import SessionScoped
 from schemas.player_schema import (
     PlayerCreateRequest,
     PlayerUpdateRequest,
@@ -6,22 +11,50 @@ from schemas.player_schema import (
 )
 
 
-class PlayerRepository:
+@instrument_repository
+class PlayerRepository(SessionScoped):
 
-    def __init__(self, db):
-        self.db = db
+    cache = TTLCache("players")
 
-    def get_all(self) -> List[PlayerResponse]:
-        cursor = self.db.cursor(dictionary=True)
-        cursor.execute("""
+    @classmethod
+    def _invalidate(cls, player_id: int) -> None:
+        cls.cache.invalidate(("id", player_id))
+        cls.cache.invalidate_prefix("all")
+
+    def get_all(self, after: str = None, limit: int = None) -> Page[PlayerResponse]:
+        return self.cache.get_or_load(
+            ("all", after, page_limit(limit)),
+            lambda: self._fetch_all(after, limit)
+        )
+
+    def get_by_id(self, player_id: int, cached: bool = True) -> Optional[PlayerResponse]:
+        if not cached:
+            return self._fetch_by_id(player_id)
+        return self.cache.get_or_load(("id", player_id), lambda: self._fetch_by_id(player_id))
+
+    def _fetch_all(self, after: str = None, limit: int = None) -> Page[PlayerResponse]:
+        query = """
             SELECT Id, FirstName, LastName, DateOfBirth,
                    AvatarUrl, NationalityId
             FROM tblPlayers
             WHERE Void = 0
-        """)
+        """
+        params = []
+
+        if after is not None:
+            (last_id,) = decode_cursor(after, 1)
+            query += " AND Id > %s"
+            params.append(last_id)
+
+        size = page_limit(limit)
+        query += " ORDER BY Id ASC LIMIT %s"
+        params.append(size + 1)
+
+        cursor = self.db.cursor(dictionary=True)
+        cursor.execute(query, tuple(params))
         rows = cursor.fetchall()
 
-        return [
+        items = [
             PlayerResponse(
                 id=row["Id"],
                 first_name=row["FirstName"],
@@ -30,18 +63,43 @@ class PlayerRepository:
                 avatar_url=row["AvatarUrl"],
                 nationality_id=row["NationalityId"]
             )
-            for row in rows
+            for row in rows[:size]
         ]
 
-    def get_by_id(self, player_id: int) -> Optional[PlayerResponse]:
+        next_cursor = encode_cursor(items[-1].id) if len(rows) > size else None
+        return Page[PlayerResponse](items=items, next_cursor=next_cursor)
+
+    def iter_all(self) -> Iterator[PlayerResponse]:
         cursor = self.db.cursor(dictionary=True)
         cursor.execute("""
+            SELECT Id, FirstName, LastName, DateOfBirth,
+                   AvatarUrl, NationalityId
+            FROM tblPlayers
+            WHERE Void = 0
+            ORDER BY Id ASC
+        """)
+
+        while True:
+            rows = cursor.fetchmany(settings.STREAM_CHUNK_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield PlayerResponse(
+                    id=row["Id"],
+                    first_name=row["FirstName"],
+                    last_name=row["LastName"],
+                    date_of_birth=row["DateOfBirth"],
+                    avatar_url=row["AvatarUrl"],
+                    nationality_id=row["NationalityId"]
+                )
+
+    def _fetch_by_id(self, player_id: int) -> Optional[PlayerResponse]:
+        row = self.db.fetch_one("""
             SELECT Id, FirstName, LastName, DateOfBirth,
                    AvatarUrl, NationalityId
             FROM tblPlayers
             WHERE Id = %s AND Void = 0
-        """, (player_id,))
-        row = cursor.fetchone()
+        """, (player_id,), dictionary=True)
 
         if not row:
             return None
@@ -72,16 +130,29 @@ class PlayerRepository:
             request.nationality_id
         ))
 
-        self.db.commit()
         player_id = cursor.lastrowid
+        self.db.after_commit(lambda: self._invalidate(player_id))
 
-        return self.get_by_id(player_id)
+        return PlayerResponse(
+            id=player_id,
+            first_name=request.first_name,
+            last_name=request.last_name,
+            date_of_birth=request.date_of_birth,
+            avatar_url=str(request.avatar_url),
+            nationality_id=request.nationality_id
+        )
 
-    def update(self, player_id: int, request: PlayerUpdateRequest) -> Optional[PlayerResponse]:
+    def update(
+        self,
+        player_id: int,
+        request: PlayerUpdateRequest,
+        existing: Optional[PlayerResponse] = None
+    ) -> Optional[PlayerResponse]:
+        existing = existing or self._fetch_by_id(player_id)
         update_data = request.model_dump(exclude_unset=True)
 
-        if not update_data:
-            return self.get_by_id(player_id)
+        if not existing or not update_data:
+            return existing
 
         field_mapping = {
             "first_name": "FirstName",
@@ -93,14 +164,16 @@ class PlayerRepository:
 
         fields = []
         values = []
+        changes = {}
 
         for key, value in update_data.items():
             if key in field_mapping:
                 fields.append(f"{field_mapping[key]} = %s")
                 values.append(str(value) if key == "avatar_url" else value)
+                changes[key] = values[-1]
 
         if not fields:
-            return self.get_by_id(player_id)
+            return existing
 
         query = f"""
             UPDATE tblPlayers
@@ -112,9 +185,12 @@ class PlayerRepository:
 
         cursor = self.db.cursor()
         cursor.execute(query, tuple(values))
-        self.db.commit()
+        self.db.after_commit(lambda: self._invalidate(player_id))
+
+        if cursor.rowcount == 0:
+            return self._fetch_by_id(player_id)
 
-        return self.get_by_id(player_id)
+        return existing.model_copy(update=changes)
 
     def delete(self, player_id: int) -> bool:
         cursor = self.db.cursor()
@@ -123,6 +199,6 @@ class PlayerRepository:
             SET Void = 1
             WHERE Id = %s AND Void = 0
         """, (player_id,))
-        self.db.commit()
+        self.db.after_commit(lambda: self._invalidate(player_id))
 
         return cursor.rowcount > 0
\ No newline at end of file
@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Optional, List, Dict, Set, Tuple
+from core.metrics import instrument_repository
+from core.database import SessionScoped
 
 from schemas.roster_schema import (
     RosterResponse,
@@ -14,10 +16,8 @@ from schemas.roster_schema import (
 )
 
 
-class RosterRepository:
-
-    def __init__(self, db):
-        self.db = db
+@instrument_repository
+class RosterRepository(SessionScoped):
 
     def assign_player(self, season_id: int, team_id: int, player_id: int) -> RosterResponse:
         cursor = self.db.cursor()
@@ -27,10 +27,125 @@ class RosterRepository:
             [season_id, team_id, player_id]
         )
 
-        self.db.commit()
-
         return self.get_by_player_season(player_id, season_id)
 
+    @staticmethod
+    def _placeholders(values) -> str:
+        return ", ".join(["%s"] * len(values))
+
+    def get_season_status(self, season_id: int, lock: bool = False) -> Optional[int]:
+        query = "SELECT Status FROM tblSeasons WHERE Id = %s AND Void = 0"
+        if lock:
+            query += " FOR UPDATE"
+
+        cursor = self.db.cursor()
+        cursor.execute(query, (season_id,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def get_existing_ids(self, table: str, ids: Set[int]) -> Set[int]:
+        if not ids:
+            return set()
+
+        ids = list(ids)
+        cursor = self.db.cursor()
+        cursor.execute(
+            f"SELECT Id FROM {table} WHERE Void = 0 AND Id IN ({self._placeholders(ids)})",
+            tuple(ids)
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+    def get_assigned_players(self, season_id: int, player_ids: Set[int]) -> Dict[int, int]:
+        if not player_ids:
+            return {}
+
+        player_ids = list(player_ids)
+        query = f"""
+            SELECT PlayerId, TeamId
+            FROM tblPlayersSeasonsTeams
+            WHERE SeasonId = %s
+              AND Void = 0
+              AND PlayerId IN ({self._placeholders(player_ids)})
+            FOR UPDATE
+        """
+
+        cursor = self.db.cursor()
+        cursor.execute(query, (season_id, *player_ids))
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def assign_players(self, season_id: int, assignments: List[Tuple[int, int]]) -> Dict[int, RosterResponse]:
+        if not assignments:
+            return {}
+
+        cursor = self.db.cursor()
+        cursor.executemany(
+            """
+                INSERT INTO tblPlayersSeasonsTeams (PlayerId, SeasonId, TeamId)
+                VALUES (%s, %s, %s)
+            """,
+            [(player_id, season_id, team_id) for team_id, player_id in assignments]
+        )
+
+        player_ids = [player_id for _, player_id in assignments]
+        query = f"""
+            SELECT Id, PlayerId, SeasonId, TeamId
+            FROM tblPlayersSeasonsTeams
+            WHERE SeasonId = %s
+              AND Void = 0
+              AND PlayerId IN ({self._placeholders(player_ids)})
+        """
+
+        cursor = self.db.cursor(dictionary=True)
+        cursor.execute(query, (season_id, *player_ids))
+
+        return {
+            row["PlayerId"]: RosterResponse(
+                id=row["Id"],
+                player_id=row["PlayerId"],
+                season_id=row["SeasonId"],
+                team_id=row["TeamId"]
+            )
+            for row in cursor.fetchall()
+        }
+
+    def clone_rosters(
+        self,
+        season_id: int,
+        source_season_id: int,
+        exclude_team_ids: List[int],
+        exclude_player_ids: List[int]
+    ) -> int:
+        query = """
+            INSERT INTO tblPlayersSeasonsTeams (PlayerId, SeasonId, TeamId)
+            SELECT pst.PlayerId, %s, pst.TeamId
+            FROM tblPlayersSeasonsTeams pst
+            JOIN tblPlayers p ON p.Id = pst.PlayerId AND p.Void = 0
+            JOIN tblTeams t ON t.Id = pst.TeamId AND t.Void = 0
+            WHERE pst.SeasonId = %s
+              AND pst.Void = 0
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM tblPlayersSeasonsTeams cur
+                  WHERE cur.SeasonId = %s
+                    AND cur.PlayerId = pst.PlayerId
+                    AND cur.Void = 0
+              )
+        """
+        params = [season_id, source_season_id, season_id]
+
+        if exclude_team_ids:
+            query += f" AND pst.TeamId NOT IN ({self._placeholders(exclude_team_ids)})"
+            params.extend(exclude_team_ids)
+
+        if exclude_player_ids:
+            query += f" AND pst.PlayerId NOT IN ({self._placeholders(exclude_player_ids)})"
+            params.extend(exclude_player_ids)
+
+        cursor = self.db.cursor()
+        cursor.execute(query, tuple(params))
+
+        return cursor.rowcount
+
     def get_by_player_season(self, player_id: int, season_id: int) -> Optional[RosterResponse]:
         query = """
             SELECT Id, PlayerId, SeasonId, TeamId
@@ -40,9 +155,7 @@ class RosterRepository:
               AND Void = 0
         """
 
-        cursor = self.db.cursor(dictionary=True)
-        cursor.execute(query, (player_id, season_id))
-        row = cursor.fetchone()
+        row = self.db.fetch_one(query, (player_id, season_id), dictionary=True)
 
         if not row:
             return None
@@ -65,7 +178,6 @@ class RosterRepository:
 
         cursor = self.db.cursor()
         cursor.execute(query, (season_id, player_id))
-        self.db.commit()
 
         return cursor.rowcount > 0
     
@@ -131,9 +243,7 @@ class RosterRepository:
               AND p.Void = 0
         """
 
-        cursor = self.db.cursor(dictionary=True)
-        cursor.execute(query, (season_id, team_id))
-        rows = cursor.fetchall()
+        rows = self.db.fetch_all(query, (season_id, team_id), dictionary=True)
 
         players = [
             TeamRosterPlayer(
@@ -8,12 +8,31 @@ from schemas.season_schema import (
     LeagueTableStanding
 )
 from enums.season_status import SeasonStatus
+from core.cache import TTLCache
+from core.pagination import Page, page_limit, encode_cursor, decode_cursor
+from core.column_defaults import ColumnDefaults
+from core.metrics import instrument_repository
+from core.database import SessionScoped
 
 
-class SeasonRepository:
+@instrument_repository
+class SeasonRepository(SessionScoped):
 
-    def __init__(self, db):
-        self.db = db
+    LEAGUE_MATCHES_QUERY = """
+        SELECT m.Team1, m.Team2, m.Category, m.Status,
+               m.NetPoints, m.Outcome,
+               t1.Name AS Team1Name, t2.Name AS Team2Name
+        FROM tblMatches m
+        LEFT JOIN tblTeams t1 ON t1.Id = m.Team1
+        LEFT JOIN tblTeams t2 ON t2.Id = m.Team2
+        WHERE m.SeasonId = %s AND m.Void = 0
+    """
+
+    cache = TTLCache("seasons")
+
+    @classmethod
+    def invalidate(cls, season_id: int) -> None:
+        cls.cache.invalidate(("id", season_id))
 
     @staticmethod
     def _map_row_to_schema(row) -> Optional[SeasonResponse]:
@@ -45,40 +64,72 @@ class SeasonRepository:
         )
 
         season_id = cursor.lastrowid
-        return self.get_by_id(season_id)
 
-    def get_by_id(self, season_id: int) -> Optional[SeasonResponse]:
+        status = ColumnDefaults.get_int(self.db, "tblSeasons", "Status")
+        if status is None:
+            return self._fetch_by_id(season_id)
+
+        return SeasonResponse(
+            id=season_id,
+            name=request.name,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            status=SeasonStatus(status)
+        )
+
+    def get_by_id(self, season_id: int, cached: bool = True) -> Optional[SeasonResponse]:
+        if not cached:
+            return self._fetch_by_id(season_id)
+        return self.cache.get_or_load(("id", season_id), lambda: self._fetch_by_id(season_id))
+
+    def _fetch_by_id(self, season_id: int) -> Optional[SeasonResponse]:
         query = """
             SELECT Id, Name, StartDate, EndDate, Status
             FROM tblSeasons
             WHERE Id = %s AND Void = 0
         """
 
-        cursor = self.db.cursor(dictionary=True)
-        cursor.execute(query, (season_id,))
-        row = cursor.fetchone()
+        row = self.db.fetch_one(query, (season_id,), dictionary=True)
 
         return self._map_row_to_schema(row)
 
-    def get_all(self) -> List[SeasonResponse]:
+    def get_all(self, after: str = None, limit: int = None) -> Page[SeasonResponse]:
         query = """
             SELECT Id, Name, StartDate, EndDate, Status
             FROM tblSeasons
             WHERE Void = 0
-            ORDER BY Id DESC
         """
+        params = []
+
+        if after is not None:
+            (last_id,) = decode_cursor(after, 1)
+            query += " AND Id < %s"
+            params.append(last_id)
+
+        size = page_limit(limit)
+        query += " ORDER BY Id DESC LIMIT %s"
+        params.append(size + 1)
 
         cursor = self.db.cursor(dictionary=True)
-        cursor.execute(query)
+        cursor.execute(query, tuple(params))
         rows = cursor.fetchall()
 
-        return [self._map_row_to_schema(row) for row in rows]
+        items = [self._map_row_to_schema(row) for row in rows[:size]]
+        next_cursor = encode_cursor(items[-1].id) if len(rows) > size else None
 
-    def update(self, season_id: int, request: SeasonUpdateRequest) -> Optional[SeasonResponse]:
+        return Page[SeasonResponse](items=items, next_cursor=next_cursor)
+
+    def update(
+        self,
+        season_id: int,
+        request: SeasonUpdateRequest,
+        existing: Optional[SeasonResponse] = None
+    ) -> Optional[SeasonResponse]:
+        existing = existing or self._fetch_by_id(season_id)
         update_data = request.model_dump(exclude_unset=True)
 
-        if not update_data:
-            return self.get_by_id(season_id)
+        if not existing or not update_data:
+            return existing
 
         field_mapping = {
             "name": "Name",
@@ -92,10 +143,10 @@ class SeasonRepository:
         for key, value in update_data.items():
             if key in field_mapping:
                 fields.append(f"{field_mapping[key]} = %s")
-                values.append(str(value) if key == "logo_url" else value)
+                values.append(value)
 
         if not fields:
-            return self.get_by_id(season_id)
+            return existing
 
         query = f"""
             UPDATE tblSeasons
@@ -107,9 +158,13 @@ class SeasonRepository:
 
         cursor = self.db.cursor()
         cursor.execute(query, tuple(values))
-        self.db.commit()
+        self.db.after_commit(lambda: self.invalidate(season_id))
+
+        if cursor.rowcount == 0:
+            return self._fetch_by_id(season_id)
 
-        return self.get_by_id(season_id)
+        changes = {key: value for key, value in update_data.items() if key in field_mapping}
+        return SeasonResponse.model_validate({**existing.model_dump(), **changes})
 
     def soft_delete(self, season_id: int) -> bool:
         query = """
@@ -120,6 +175,7 @@ class SeasonRepository:
 
         cursor = self.db.cursor()
         cursor.execute(query, (season_id,))
+        self.db.after_commit(lambda: self.invalidate(season_id))
 
         return cursor.rowcount > 0
 
@@ -131,50 +187,60 @@ class SeasonRepository:
             LIMIT 1
         """
 
-        cursor = self.db.cursor()
-        cursor.execute(query, (name,))
-        return cursor.fetchone() is not None
+        return self.db.fetch_one(query, (name,)) is not None
     
-    def get_league_table(self, season_id: int) -> LeagueTableResponse:
-        cursor = self.db.cursor(dictionary=True)
-        cursor.callproc("usp_GetLeagueTable", [season_id])
+    def get_league_matches(self, season_id: int) -> List[dict]:
+        rows = self.db.fetch_all(self.LEAGUE_MATCHES_QUERY, (season_id,), dictionary=True)
+        self.db.release()
+        return rows
 
+    @staticmethod
+    def _map_league_table(league_rows, status_row) -> LeagueTableResponse:
         result = LeagueTableResponse(
             standings=[],
             season_status=1
         )
 
+        for row in league_rows or []:
+            is_winner = bool(row.get("IsWinner", 0))
+            result.standings.append(
+                LeagueTableStanding(
+                    team_id=row["TeamId"],
+                    team_name=row["TeamName"],
+                    matches_played=row.get("MatchesPlayed", 0),
+                    wins=row.get("Wins", 0),
+                    points=row.get("Points", 0),
+                    net_points=row.get("TotalNetPoints", 0),
+                    head_to_head_wins=row.get("HeadToHeadWins", 0)
+                )
+            )
+            if is_winner:
+                result.winner_id = int(row["TeamId"])
+
+        if status_row:
+            result.season_status = int(status_row.get("SeasonStatus"))
+
+        return result
+
+    def get_league_table(self, season_id: int) -> LeagueTableResponse:
+        cursor = self.db.cursor(dictionary=True)
+        cursor.callproc("usp_GetLeagueTable", [season_id])
+
         result_sets = cursor.stored_results()
 
+        league_rows = []
+        status_row = None
+
         try:
             league_result = next(result_sets)
             league_rows = league_result.fetchall()
-
-            for row in league_rows:
-                is_winner = bool(row.get("IsWinner", 0))
-                result.standings.append(
-                    LeagueTableStanding(
-                        team_id=row["TeamId"],
-                        team_name=row["TeamName"],
-                        matches_played=row.get("MatchesPlayed", 0),
-                        wins=row.get("Wins", 0),
-                        points=row.get("Points", 0),
-                        net_points=row.get("TotalNetPoints", 0),
-                        head_to_head_wins=row.get("HeadToHeadWins", 0)
-                    )
-                )
-                if is_winner:
-                    result.winner_id = int(row["TeamId"])
         except StopIteration:
             pass
 
         try:
             status_result = next(result_sets)
             status_row = status_result.fetchone()
-
-            if status_row:
-                result.season_status = int(status_row.get("SeasonStatus"))
         except StopIteration:
             pass
 
-        return result
+        return self._map_league_table(league_rows, status_row)
@@ -1,12 +1,47 @@
+from typing import List
+
+from core.config import settings
+from core.metrics import instrument_repository
+from core.database import SessionScoped
+from engines.head_to_head_matrix import HeadToHeadMatrix, HeadToHeadMatrixCache
 from schemas.stats_schema import HeadToHeadResponse
 
 
-class StatsRepository:
+@instrument_repository
+class StatsRepository(SessionScoped):
+
+    def get_head_to_head_matrix(self) -> HeadToHeadMatrix:
+        generation = HeadToHeadMatrixCache.generation()
+        matrix = HeadToHeadMatrixCache.get()
+        if matrix is not None:
+            return matrix
 
-    def __init__(self, db):
-        self.db = db
+        query = """
+            SELECT Team1, Team2, Status, NetPoints, Outcome
+            FROM tblMatches
+            WHERE Void = 0
+              AND Status = 3
+              AND Team1 IS NOT NULL
+              AND Team2 IS NOT NULL
+        """
+
+        cursor = self.db.cursor(dictionary=True)
+        cursor.execute(query)
+        rows = cursor.fetchall()
+        self.db.release()
+
+        matrix = HeadToHeadMatrix.from_matches(rows)
+        HeadToHeadMatrixCache.set(matrix, generation)
+        return matrix
+
+    def get_head_to_head_pairs(self, pairs: List[tuple]) -> List[HeadToHeadResponse]:
+        matrix = self.get_head_to_head_matrix()
+        return [matrix.get(team1_id, team2_id) for team1_id, team2_id in pairs]
 
     def get_head_to_head(self, team1_id: int, team2_id: int) -> HeadToHeadResponse:
+        if settings.HEAD_TO_HEAD_SOURCE == "matrix":
+            return self.get_head_to_head_matrix().get(team1_id, team2_id)
+
         cursor = self.db.cursor(dictionary=True)
 
         cursor.callproc("usp_GetLifetimeHeadToHead", [team1_id, team2_id])
@@ -1,4 +1,7 @@
 from typing import Optional, List
+from core.cache import TTLCache
+from core.metrics import instrument_repository
+from core.database import SessionScoped
 from schemas.team_schema import (
     TeamCreateRequest,
     TeamUpdateRequest,
@@ -6,12 +9,24 @@ from schemas.team_schema import (
 )
 
 
-class TeamRepository:
+@instrument_repository
+class TeamRepository(SessionScoped):
 
-    def __init__(self, db):
-        self.db = db
+    cache = TTLCache("teams")
+
+    @classmethod
+    def _invalidate(cls, team_id: int) -> None:
+        cls.cache.invalidate("all", ("id", team_id))
 
     def get_all(self) -> List[TeamResponse]:
+        return list(self.cache.get_or_load("all", self._fetch_all))
+
+    def get_by_id(self, team_id: int, cached: bool = True) -> Optional[TeamResponse]:
+        if not cached:
+            return self._fetch_by_id(team_id)
+        return self.cache.get_or_load(("id", team_id), lambda: self._fetch_by_id(team_id))
+
+    def _fetch_all(self) -> List[TeamResponse]:
         cursor = self.db.cursor(dictionary=True)
         cursor.execute("""
             SELECT Id, Name, Slogan, LogoUrl
@@ -30,14 +45,12 @@ class TeamRepository:
             for row in rows
         ]
 
-    def get_by_id(self, team_id: int) -> Optional[TeamResponse]:
-        cursor = self.db.cursor(dictionary=True)
-        cursor.execute("""
+    def _fetch_by_id(self, team_id: int) -> Optional[TeamResponse]:
+        row = self.db.fetch_one("""
             SELECT Id, Name, Slogan, LogoUrl
             FROM tblTeams
             WHERE Id = %s AND Void = 0
-        """, (team_id,))
-        row = cursor.fetchone()
+        """, (team_id,), dictionary=True)
 
         if not row:
             return None
@@ -63,16 +76,27 @@ class TeamRepository:
             request.logo_url
         ))
 
-        self.db.commit()
         team_id = cursor.lastrowid
+        self.db.after_commit(lambda: self._invalidate(team_id))
 
-        return self.get_by_id(team_id)
+        return TeamResponse(
+            id=team_id,
+            name=request.name,
+            slogan=request.slogan,
+            logo_url=request.logo_url
+        )
 
-    def update(self, team_id: int, request: TeamUpdateRequest) -> Optional[TeamResponse]:
+    def update(
+        self,
+        team_id: int,
+        request: TeamUpdateRequest,
+        existing: Optional[TeamResponse] = None
+    ) -> Optional[TeamResponse]:
+        existing = existing or self._fetch_by_id(team_id)
         update_data = request.model_dump(exclude_unset=True)
 
-        if not update_data:
-            return self.get_by_id(team_id)
+        if not existing or not update_data:
+            return existing
 
         field_mapping = {
             "name": "Name",
@@ -89,7 +113,7 @@ class TeamRepository:
                 values.append(value)
 
         if not fields:
-            return self.get_by_id(team_id)
+            return existing
 
         query = f"""
             UPDATE tblTeams
@@ -101,9 +125,14 @@ class TeamRepository:
 
         cursor = self.db.cursor()
         cursor.execute(query, tuple(values))
-        self.db.commit()
+        self.db.after_commit(lambda: self._invalidate(team_id))
 
-        return self.get_by_id(team_id)
+        if cursor.rowcount == 0:
+            return self._fetch_by_id(team_id)
+
+        return existing.model_copy(
+            update={key: value for key, value in update_data.items() if key in field_mapping}
+        )
 
     def delete(self, team_id: int) -> bool:
         cursor = self.db.cursor()
@@ -112,6 +141,6 @@ class TeamRepository:
             SET Void = 1
             WHERE Id = %s AND Void = 0
         """, (team_id,))
-        self.db.commit()
+        self.db.after_commit(lambda: self._invalidate(team_id))
 
         return cursor.rowcount > 0
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query, Request
+from core.async_database import get_async_db
+from core.container import container
+from core.config import settings
+from core.response import ApiResponse, PagedApiResponse, fast_response
+from core.streaming import wants_stream, stream_response
+from core.conditional import conditional_response
+from controllers.async_match_controller import AsyncMatchController
+from schemas.match_schema import MatchResponse
+
+
+router = APIRouter(
+    prefix="/matches",
+    tags=["Matches"],
+    include_in_schema=False
+)
+
+
+async def get_controller(db=Depends(get_async_db, scope="function")) -> AsyncMatchController:
+    return container.async_matches
+
+
+@router.get("", response_model=PagedApiResponse[MatchResponse])
+@fast_response
+async def get_all_async(
+    request: Request,
+    seasonId: int = None,
+    cursor: str = None,
+    limit: int = Query(None, ge=1, le=settings.PAGE_MAX_LIMIT),
+    stream: bool = False,
+    controller: AsyncMatchController = Depends(get_controller)
+):
+    if wants_stream(request, stream):
+        return stream_response(
+            request,
+            "Matches fetched successfully",
+            lambda: container.matches.iter_all(season_id=seasonId),
+            headers={"Vary": "Accept"}
+        )
+
+    page = await controller.get_all(season_id=seasonId, after=cursor, limit=limit)
+
+    return conditional_response(request, PagedApiResponse(
+        success=True,
+        message="Matches fetched successfully",
+        data=page.items,
+        next_cursor=page.next_cursor
+    ), vary="Accept")
+
+
+@router.get("/{match_id:int}", response_model=ApiResponse[MatchResponse])
+@fast_response
+async def get_by_id_async(match_id: int, controller: AsyncMatchController = Depends(get_controller)):
+    return ApiResponse(
+        success=True,
+        message="Match fetched successfully",
+        data=await controller.get_by_id(match_id)
+    )
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, Request
+
+from core.async_database import get_async_db
+from core.container import container
+from core.response import ApiResponse, fast_response
+from core.conditional import conditional_response
+from controllers.async_season_controller import AsyncSeasonController
+from schemas.season_schema import (
+    SeasonResponse,
+    LeagueTableResponse
+)
+
+router = APIRouter(prefix="/seasons", tags=["Seasons"], include_in_schema=False)
+
+
+async def get_controller(db=Depends(get_async_db, scope="function")) -> AsyncSeasonController:
+    return container.async_seasons
+
+
+@router.get("/{season_id:int}", response_model=ApiResponse[SeasonResponse])
+@fast_response
+async def get_season_async(
+    season_id: int,
+    controller: AsyncSeasonController = Depends(get_controller)
+):
+    result = await controller.get_by_id(season_id)
+
+    return ApiResponse(
+        success=True,
+        message="Season fetched successfully",
+        data=result
+    )
+
+
+@router.get(
+    "/{season_id:int}/league-table",
+    response_model=ApiResponse[LeagueTableResponse]
+)
+@fast_response
+async def get_league_table_async(
+    season_id: int,
+    request: Request,
+    controller: AsyncSeasonController = Depends(get_controller)
+):
+    result = await controller.get_league_table(season_id)
+
+    return conditional_response(request, ApiResponse(
+        success=True,
+        message="League table fetched successfully",
+        data=result
+    ))
@@ -1,16 +1,15 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Query
 
-from repositories.country_repository import CountryRepository
-from services.country_service import CountryService
 from controllers.country_controller import CountryController
 from schemas.country_schema import (
     CountryCreateRequest,
     CountryUpdateRequest,
     CountryResponse
 )
-from core.database import get_db
-from core.response import ApiResponse
+from core.container import container
+from core.database import get_db, get_read_db
+from core.config import settings
+from core.response import ApiResponse, PagedApiResponse, fast_response
 
 
 router = APIRouter(
@@ -19,27 +18,36 @@ router = APIRouter(
 )
 
 
-def get_controller(db=Depends(get_db)) -> CountryController:
-    repository = CountryRepository(db)
-    service = CountryService(repository)
-    return CountryController(service)
+async def get_controller(db=Depends(get_db, scope="function")) -> CountryController:
+    return container.countries
 
 
-@router.get("/", response_model=ApiResponse[List[CountryResponse]])
-def get_all(controller: CountryController = Depends(get_controller)):
-    result = controller.get_all()
+async def get_read_controller(db=Depends(get_read_db, scope="function")) -> CountryController:
+    return container.countries
 
-    return ApiResponse(
+
+@router.get("/", response_model=PagedApiResponse[CountryResponse])
+@fast_response
+def get_all(
+    cursor: str = None,
+    limit: int = Query(None, ge=1, le=settings.PAGE_MAX_LIMIT),
+    controller: CountryController = Depends(get_read_controller)
+):
+    result = controller.get_all(after=cursor, limit=limit)
+
+    return PagedApiResponse(
         success=True,
         message="Countries fetched successfully",
-        data=result
+        data=result.items,
+        next_cursor=result.next_cursor
     )
 
 
 @router.get("/{country_id}", response_model=ApiResponse[CountryResponse])
+@fast_response
 def get_by_id(
     country_id: int,
-    controller: CountryController = Depends(get_controller)
+    controller: CountryController = Depends(get_read_controller)
 ):
     result = controller.get_by_id(country_id)
 
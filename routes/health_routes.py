@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+
+from core.database import Database
+from core.response import ApiResponse
+
+
+router = APIRouter(
+    prefix="/health",
+    tags=["Health"]
+)
+
+
+@router.get("/pool", response_model=ApiResponse[dict])
+def get_pool_stats():
+    stats = Database.stats()
+
+    return ApiResponse(
+        success=stats is not None,
+        message="Pool stats fetched successfully" if stats else "Database pool is not initialized",
+        data=stats
+    )
@@ -1,15 +1,18 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 from typing import List
-from core.database import get_db
-from core.response import ApiResponse
-from repositories.match_repository import MatchRepository
-from services.match_service import MatchService
+from core.container import container
+from core.database import get_db, get_read_db
+from core.config import settings
+from core.response import ApiResponse, PagedApiResponse, fast_response
+from core.streaming import wants_stream, stream_response
+from core.conditional import conditional_response
 from controllers.match_controller import MatchController
 from schemas.match_schema import (
     MatchCreateRequest,
     MatchUpdateRequest,
     MatchResponse,
-    MatchOrderResponse
+    MatchOrderResponse,
+    FixtureGenerateRequest
 )
 
 
@@ -19,10 +22,12 @@ router = APIRouter(
 )
 
 
-def get_controller(db=Depends(get_db)) -> MatchController:
-    repository = MatchRepository(db)
-    service = MatchService(repository)
-    return MatchController(service)
+async def get_controller(db=Depends(get_db, scope="function")) -> MatchController:
+    return container.matches
+
+
+async def get_read_controller(db=Depends(get_read_db, scope="function")) -> MatchController:
+    return container.matches
 
 
 @router.post("", response_model=ApiResponse[MatchResponse])
@@ -35,17 +40,47 @@ def create(request: MatchCreateRequest, controller: MatchController = Depends(ge
 
 
 
-@router.get("", response_model=ApiResponse[List[MatchResponse]])
-def get_all(seasonId: int = None, controller: MatchController = Depends(get_controller)):
+@router.post("/fixtures", response_model=ApiResponse[List[MatchResponse]])
+def generate_fixtures(request: FixtureGenerateRequest, controller: MatchController = Depends(get_controller)):
     return ApiResponse(
         success=True,
-        message="Matches fetched successfully",
-        data=controller.get_all(season_id=seasonId)
+        message="Fixtures generated successfully",
+        data=controller.generate_fixtures(request)
     )
 
 
 
+@router.get("", response_model=PagedApiResponse[MatchResponse])
+@fast_response
+def get_all(
+    request: Request,
+    seasonId: int = None,
+    cursor: str = None,
+    limit: int = Query(None, ge=1, le=settings.PAGE_MAX_LIMIT),
+    stream: bool = False,
+    controller: MatchController = Depends(get_read_controller)
+):
+    if wants_stream(request, stream):
+        return stream_response(
+            request,
+            "Matches fetched successfully",
+            lambda: controller.iter_all(season_id=seasonId),
+            headers={"Vary": "Accept"}
+        )
+
+    page = controller.get_all(season_id=seasonId, after=cursor, limit=limit)
+
+    return conditional_response(request, PagedApiResponse(
+        success=True,
+        message="Matches fetched successfully",
+        data=page.items,
+        next_cursor=page.next_cursor
+    ), vary="Accept")
+
+
+
 @router.get("/next-order", response_model=ApiResponse[MatchOrderResponse])
+@fast_response
 def get_next_match_order(seasonId: int, controller: MatchController = Depends(get_controller)):
     return ApiResponse(
         success=True,
@@ -56,7 +91,8 @@ def get_next_match_order(seasonId: int, controller: MatchController = Depends(ge
 
 
 @router.get("/{match_id}", response_model=ApiResponse[MatchResponse])
-def get_by_id(match_id: int, controller: MatchController = Depends(get_controller)):
+@fast_response
+def get_by_id(match_id: int, controller: MatchController = Depends(get_read_controller)):
     return ApiResponse(
         success=True,
         message="Match fetched successfully",
@@ -0,0 +1,91 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from core.cache import TTLCache
+from core.database import Database
+from core.metrics import CONTENT_TYPE, METRICS, render_histogram, render_samples
+from core.statements import StatementRegistry
+from engines.head_to_head_matrix import HeadToHeadMatrixCache
+from engines.standings_engine import StandingsStore
+
+
+router = APIRouter(
+    tags=["Metrics"]
+)
+
+POOL_GAUGES = (
+    ("size", "Configured pool size."),
+    ("in_use", "Connections currently checked out."),
+    ("idle", "Connections currently available."),
+    ("waiters", "Requests waiting for a connection.")
+)
+POOL_COUNTERS = (
+    ("acquired", "Connections handed out."),
+    ("rejected", "Acquires rejected because the wait queue was full."),
+    ("timeouts", "Acquires that timed out in the wait queue.")
+)
+
+
+def _pool_lines() -> list:
+    stats = Database.stats()
+    if stats is None:
+        return []
+
+    pools = [stats["primary"], *stats["replicas"]]
+    lines = []
+    for key, help_text in POOL_GAUGES:
+        lines += render_samples(
+            f"cpl_db_pool_{key}", help_text, "gauge", ("pool",),
+            [((pool["name"],), pool[key]) for pool in pools]
+        )
+    for key, help_text in POOL_COUNTERS:
+        lines += render_samples(
+            f"cpl_db_pool_{key}_total", help_text, "counter", ("pool",),
+            [((pool["name"],), pool[key]) for pool in pools]
+        )
+    lines += render_histogram(
+        "cpl_db_pool_acquire_duration_seconds", "Time spent waiting for a pooled connection.", ("pool",),
+        {(pool["name"],): pool["acquire_latency_seconds"] for pool in pools}
+    )
+    lines += render_histogram(
+        "cpl_db_pool_hold_duration_seconds", "Time a pooled connection stayed checked out.", ("pool",),
+        {(pool["name"],): pool["hold_seconds"] for pool in pools}
+    )
+    return lines
+
+
+def _cache_lines() -> list:
+    caches = [cache.stats() for cache in TTLCache.registry.values()]
+    caches += [StandingsStore.stats(), HeadToHeadMatrixCache.stats()]
+    caches.append({
+        "name": "prepared_statements",
+        "entries": None,
+        "hits": StatementRegistry.total_reused,
+        "misses": StatementRegistry.total_prepared
+    })
+
+    def ratio(cache: dict) -> float:
+        lookups = cache["hits"] + cache["misses"]
+        return cache["hits"] / lookups if lookups else 0.0
+
+    return (
+        render_samples("cpl_cache_hits_total", "Cache lookups served from memory.", "counter", ("cache",),
+                       [((cache["name"],), cache["hits"]) for cache in caches])
+        + render_samples("cpl_cache_misses_total", "Cache lookups that went to the database.", "counter", ("cache",),
+                         [((cache["name"],), cache["misses"]) for cache in caches])
+        + render_samples("cpl_cache_hit_ratio", "Share of cache lookups served from memory.", "gauge", ("cache",),
+                         [((cache["name"],), round(ratio(cache), 6)) for cache in caches])
+        + render_samples("cpl_cache_entries", "Entries currently held.", "gauge", ("cache",),
+                         [((cache["name"],), cache["entries"]) for cache in caches if cache["entries"] is not None])
+    )
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    lines = []
+    for metric in METRICS:
+        lines += metric.render()
+    lines += _pool_lines()
+    lines += _cache_lines()
+
+    return Response("\n".join(lines) + "\n", media_type=CONTENT_TYPE)
@@ -1,18 +1,16 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Query, Request
 
-from repositories.player_repository import PlayerRepository
-from services.player_service import PlayerService
 from controllers.player_controller import PlayerController
-from repositories.country_repository import CountryRepository
-from services.country_service import CountryService
 from schemas.player_schema import (
     PlayerCreateRequest,
     PlayerUpdateRequest,
     PlayerResponse
 )
-from core.database import get_db
-from core.response import ApiResponse
+from core.container import container
+from core.database import get_db, get_read_db
+from core.config import settings
+from core.response import ApiResponse, PagedApiResponse, fast_response
+from core.streaming import wants_stream, stream_response
 
 
 router = APIRouter(
@@ -21,29 +19,45 @@ router = APIRouter(
 )
 
 
-def get_controller(db=Depends(get_db)) -> PlayerController:
-    player_repository = PlayerRepository(db)
-    country_repository = CountryRepository(db)
-    country_service = CountryService(country_repository)
-    service = PlayerService(player_repository, country_service)
-    return PlayerController(service)
+async def get_controller(db=Depends(get_db, scope="function")) -> PlayerController:
+    return container.players
 
 
-@router.get("/", response_model=ApiResponse[List[PlayerResponse]])
-def get_all(controller: PlayerController = Depends(get_controller)):
-    result = controller.get_all()
+async def get_read_controller(db=Depends(get_read_db, scope="function")) -> PlayerController:
+    return container.players
 
-    return ApiResponse(
+
+@router.get("/", response_model=PagedApiResponse[PlayerResponse])
+@fast_response
+def get_all(
+    request: Request,
+    cursor: str = None,
+    limit: int = Query(None, ge=1, le=settings.PAGE_MAX_LIMIT),
+    stream: bool = False,
+    controller: PlayerController = Depends(get_read_controller)
+):
+    if wants_stream(request, stream):
+        return stream_response(
+            request,
+            "Players fetched successfully",
+            lambda: controller.iter_all()
+        )
+
+    result = controller.get_all(after=cursor, limit=limit)
+
+    return PagedApiResponse(
         success=True,
         message="Players fetched successfully",
-        data=result
+        data=result.items,
+        next_cursor=result.next_cursor
     )
 
 
 @router.get("/{player_id}", response_model=ApiResponse[PlayerResponse])
+@fast_response
 def get_by_id(
     player_id: int,
-    controller: PlayerController = Depends(get_controller)
+    controller: PlayerController = Depends(get_read_controller)
 ):
     result = controller.get_by_id(player_id)
 
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
-from core.database import get_db
-from core.response import ApiResponse
-from repositories.roster_repository import RosterRepository
-from services.roster_service import RosterService
+from core.container import container
+from core.database import get_db, get_read_db
+from core.response import ApiResponse, fast_response
+from core.conditional import conditional_response
 from controllers.roster_controller import RosterController
 from schemas.roster_schema import (
     RosterAssignRequest,
+    RosterBulkAssignRequest,
+    RosterBulkAssignResponse,
+    RosterCloneRequest,
     RosterResponse,
     TeamRosterResponse,
     PlayerSeasonHistoryResponse,
@@ -22,10 +25,12 @@ router = APIRouter(
 )
 
 
-def get_controller(db=Depends(get_db)) -> RosterController:
-    repository = RosterRepository(db)
-    service = RosterService(repository)
-    return RosterController(service)
+async def get_controller(db=Depends(get_db, scope="function")) -> RosterController:
+    return container.rosters
+
+
+async def get_read_controller(db=Depends(get_read_db, scope="function")) -> RosterController:
+    return container.rosters
 
 
 @router.post(
@@ -48,6 +53,40 @@ def assign_player(
         data=result
     )
 
+@router.post(
+    "/assign/bulk",
+    response_model=ApiResponse[RosterBulkAssignResponse]
+)
+def assign_players(
+    request: RosterBulkAssignRequest,
+    controller: RosterController = Depends(get_controller)
+):
+    result = controller.assign_players(request)
+
+    return ApiResponse(
+        success=result.failed == 0,
+        message=f"{result.assigned} of {len(result.results)} players assigned",
+        data=result
+    )
+
+@router.post(
+    "/season/{season_id}/clone-from/{source_season_id}",
+    response_model=ApiResponse[SeasonTeamPlayersHistoryResponse]
+)
+def clone_rosters(
+    season_id: int,
+    source_season_id: int,
+    request: RosterCloneRequest = None,
+    controller: RosterController = Depends(get_controller)
+):
+    result = controller.clone_rosters(season_id, source_season_id, request or RosterCloneRequest())
+
+    return ApiResponse(
+        success=True,
+        message="Season rosters cloned successfully",
+        data=result
+    )
+
 @router.delete("/remove", response_model=ApiResponse[bool])
 def remove_player(
     request: RemovePlayerRequest,
@@ -68,10 +107,11 @@ def remove_player(
     "/team/{team_id}",
     response_model=ApiResponse[TeamRosterResponse]
 )
+@fast_response
 def get_team_roster(
     team_id: int,
     seasonId: int,
-    controller=Depends(get_controller)
+    controller=Depends(get_read_controller)
 ):
     result = controller.get_team_roster(seasonId, team_id)
 
@@ -85,9 +125,10 @@ def get_team_roster(
     "/player/{player_id}",
     response_model=ApiResponse[PlayerSeasonHistoryResponse]
 )
+@fast_response
 def get_player_history(
     player_id: int,
-    controller=Depends(get_controller)
+    controller=Depends(get_read_controller)
 ):
     result = controller.get_player_history(player_id)
 
@@ -101,30 +142,34 @@ def get_player_history(
     "/season/{season_id}",
     response_model=ApiResponse[SeasonRosterResponse]
 )
+@fast_response
 def get_season_rosters(
     season_id: int,
-    controller=Depends(get_controller)
+    request: Request,
+    controller=Depends(get_read_controller)
 ):
     result = controller.get_season_rosters(season_id)
 
-    return ApiResponse(
+    return conditional_response(request, ApiResponse(
         success=True,
         message="Season rosters fetched successfully",
         data=result
-    )
+    ))
 
 @router.get(
     "/season/{season_id}/teams",
     response_model=ApiResponse[SeasonTeamPlayersHistoryResponse]
 )
+@fast_response
 def get_season_team_players_history(
     season_id: int,
-    controller=Depends(get_controller)
+    request: Request,
+    controller=Depends(get_read_controller)
 ):
     result = controller.get_season_team_players_history(season_id)
 
-    return ApiResponse(
+    return conditional_response(request, ApiResponse(
         success=True,
         message="Season team players history fetched successfully",
         data=result
-    )
\ No newline at end of file
+    ))
\ No newline at end of file
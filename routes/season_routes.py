@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Query, Request
 
-from core.database import get_db
-from core.response import ApiResponse
+from core.container import container
+from core.database import get_db, get_read_db
+from core.config import settings
+from core.response import ApiResponse, PagedApiResponse, fast_response
+from core.conditional import conditional_response
 from controllers.season_controller import SeasonController
 from schemas.season_schema import (
     SeasonCreateRequest,
@@ -14,12 +16,19 @@ from schemas.season_schema import (
 router = APIRouter(prefix="/seasons", tags=["Seasons"])
 
 
+async def get_controller(db=Depends(get_db, scope="function")) -> SeasonController:
+    return container.seasons
+
+
+async def get_read_controller(db=Depends(get_read_db, scope="function")) -> SeasonController:
+    return container.seasons
+
+
 @router.post("/", response_model=ApiResponse[SeasonResponse])
 def create_season(
     request: SeasonCreateRequest,
-    db=Depends(get_db)
+    controller: SeasonController = Depends(get_controller)
 ):
-    controller = SeasonController(db)
     result = controller.create(request)
 
     return ApiResponse(
@@ -30,11 +39,11 @@ def create_season(
 
 
 @router.get("/{season_id}", response_model=ApiResponse[SeasonResponse])
+@fast_response
 def get_season(
     season_id: int,
-    db=Depends(get_db)
+    controller: SeasonController = Depends(get_read_controller)
 ):
-    controller = SeasonController(db)
     result = controller.get_by_id(season_id)
 
     return ApiResponse(
@@ -44,17 +53,20 @@ def get_season(
     )
 
 
-@router.get("/", response_model=ApiResponse[List[SeasonResponse]])
+@router.get("/", response_model=PagedApiResponse[SeasonResponse])
+@fast_response
 def get_all_seasons(
-    db=Depends(get_db)
+    cursor: str = None,
+    limit: int = Query(None, ge=1, le=settings.PAGE_MAX_LIMIT),
+    controller: SeasonController = Depends(get_read_controller)
 ):
-    controller = SeasonController(db)
-    result = controller.get_all()
+    result = controller.get_all(after=cursor, limit=limit)
 
-    return ApiResponse(
+    return PagedApiResponse(
         success=True,
         message="Seasons fetched successfully",
-        data=result
+        data=result.items,
+        next_cursor=result.next_cursor
     )
 
 
@@ -62,9 +74,8 @@ def get_all_seasons(
 def update_season(
     season_id: int,
     request: SeasonUpdateRequest,
-    db=Depends(get_db)
+    controller: SeasonController = Depends(get_controller)
 ):
-    controller = SeasonController(db)
     result = controller.update(season_id, request)
 
     return ApiResponse(
@@ -77,9 +88,8 @@ def update_season(
 @router.delete("/{season_id}", response_model=ApiResponse[bool])
 def delete_season(
     season_id: int,
-    db=Depends(get_db)
+    controller: SeasonController = Depends(get_controller)
 ):
-    controller = SeasonController(db)
     result = controller.delete(season_id)
 
     return ApiResponse(
@@ -93,15 +103,16 @@ def delete_season(
     "/{season_id}/league-table",
     response_model=ApiResponse[LeagueTableResponse]
 )
+@fast_response
 def get_league_table(
     season_id: int,
-    db=Depends(get_db)
+    request: Request,
+    controller: SeasonController = Depends(get_read_controller)
 ):
-    controller = SeasonController(db)
     result = controller.get_league_table(season_id)
 
-    return ApiResponse(
+    return conditional_response(request, ApiResponse(
         success=True,
         message="League table fetched successfully",
         data=result
-    )
+    ))
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends
+from typing import List
 
-from core.database import get_db
-from core.response import ApiResponse
-from repositories.stats_repository import StatsRepository
-from services.stats_service import StatsService
+from core.container import container
+from core.database import get_read_db
+from core.response import ApiResponse, fast_response
 from controllers.stats_controller import StatsController
-from schemas.stats_schema import HeadToHeadResponse
+from schemas.stats_schema import HeadToHeadResponse, HeadToHeadBatchRequest
 
 
 router = APIRouter(
@@ -14,20 +14,19 @@ router = APIRouter(
 )
 
 
-def get_controller(db=Depends(get_db)) -> StatsController:
-    repository = StatsRepository(db)
-    service = StatsService(repository)
-    return StatsController(service)
+async def get_read_controller(db=Depends(get_read_db, scope="function")) -> StatsController:
+    return container.stats
 
 
 @router.get(
     "/head-to-head",
     response_model=ApiResponse[HeadToHeadResponse]
 )
+@fast_response
 def get_head_to_head(
     team1Id: int,
     team2Id: int,
-    controller: StatsController = Depends(get_controller)
+    controller: StatsController = Depends(get_read_controller)
 ):
     result = controller.get_head_to_head(team1Id, team2Id)
 
@@ -36,3 +35,38 @@ def get_head_to_head(
         message="Head to head stats fetched successfully",
         data=result
     )
+
+
+@router.get(
+    "/head-to-head/matrix",
+    response_model=ApiResponse[List[HeadToHeadResponse]]
+)
+@fast_response
+def get_head_to_head_matrix(
+    controller: StatsController = Depends(get_read_controller)
+):
+    result = controller.get_head_to_head_matrix()
+
+    return ApiResponse(
+        success=True,
+        message="Head to head matrix fetched successfully",
+        data=result
+    )
+
+
+@router.post(
+    "/head-to-head/batch",
+    response_model=ApiResponse[List[HeadToHeadResponse]]
+)
+@fast_response
+def get_head_to_head_batch(
+    request: HeadToHeadBatchRequest,
+    controller: StatsController = Depends(get_read_controller)
+):
+    result = controller.get_head_to_head_batch(request.pairs)
+
+    return ApiResponse(
+        success=True,
+        message="Head to head stats fetched successfully",
+        data=result
+    )
@@ -6,11 +6,10 @@ from schemas.team_schema import (
     TeamUpdateRequest,
     TeamResponse
 )
-from services.team_service import TeamService
-from repositories.team_repository import TeamRepository
 from controllers.team_controller import TeamController
-from core.database import get_db
-from core.response import ApiResponse
+from core.container import container
+from core.database import get_db, get_read_db
+from core.response import ApiResponse, fast_response
 
 
 router = APIRouter(
@@ -19,14 +18,17 @@ router = APIRouter(
 )
 
 
-def get_controller(db=Depends(get_db)) -> TeamController:
-    repository = TeamRepository(db)
-    service = TeamService(repository)
-    return TeamController(service)
+async def get_controller(db=Depends(get_db, scope="function")) -> TeamController:
+    return container.teams
+
+
+async def get_read_controller(db=Depends(get_read_db, scope="function")) -> TeamController:
+    return container.teams
 
 
 @router.get("/", response_model=ApiResponse[List[TeamResponse]])
-def get_all(controller: TeamController = Depends(get_controller)):
+@fast_response
+def get_all(controller: TeamController = Depends(get_read_controller)):
     result = controller.get_all()
 
     return ApiResponse(
@@ -37,9 +39,10 @@ def get_all(controller: TeamController = Depends(get_controller)):
 
 
 @router.get("/{team_id}", response_model=ApiResponse[TeamResponse])
+@fast_response
 def get_by_id(
     team_id: int,
-    controller: TeamController = Depends(get_controller)
+    controller: TeamController = Depends(get_read_controller)
 ):
     result = controller.get_by_id(team_id)
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, model_validator
-from typing import Optional
+from typing import Optional, List
 from datetime import date
 
 from enums.match_category import MatchCategory
@@ -58,4 +58,20 @@ class MatchResponse(BaseModel):
     toss_outcome: int
 
 class MatchOrderResponse(BaseModel):
-    order: int
\ No newline at end of file
+    order: int
+
+
+class FixtureGenerateRequest(BaseModel):
+    season_id: int
+    start_date: date
+    end_date: date
+    double_round_robin: bool = False
+    team_ids: Optional[List[int]] = Field(default=None, min_length=2)
+
+    @model_validator(mode="after")
+    def validate_range(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date cannot be before start_date")
+        if self.team_ids is not None and len(set(self.team_ids)) != len(self.team_ids):
+            raise ValueError("team_ids cannot contain duplicates")
+        return self
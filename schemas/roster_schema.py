@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -24,6 +24,36 @@ class RosterResponse(BaseModel):
     team_id: int
 
 
+class RosterBulkAssignItem(BaseModel):
+    team_id: int
+    player_id: int
+
+
+class RosterBulkAssignRequest(BaseModel):
+    season_id: int
+    assignments: List[RosterBulkAssignItem] = Field(min_length=1, max_length=500)
+
+
+class RosterBulkAssignResult(BaseModel):
+    team_id: int
+    player_id: int
+    success: bool
+    error: Optional[str] = None
+    roster: Optional[RosterResponse] = None
+
+
+class RosterBulkAssignResponse(BaseModel):
+    season_id: int
+    assigned: int
+    failed: int
+    results: List[RosterBulkAssignResult]
+
+
+class RosterCloneRequest(BaseModel):
+    exclude_team_ids: List[int] = []
+    exclude_player_ids: List[int] = []
+
+
 class RemovePlayerRequest(BaseModel):
     season_id: int
     player_id: int
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing import List
 
 
 class HeadToHeadResponse(BaseModel):
@@ -9,3 +10,12 @@ class HeadToHeadResponse(BaseModel):
     team2_wins: int
     team1_net_points: int
     team2_net_points: int
+
+
+class HeadToHeadPair(BaseModel):
+    team1_id: int
+    team2_id: int
+
+
+class HeadToHeadBatchRequest(BaseModel):
+    pairs: List[HeadToHeadPair] = Field(..., min_length=1, max_length=1000)
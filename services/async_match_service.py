@@ -0,0 +1,21 @@
+from fastapi import HTTPException
+
+from core.pagination import Page
+
+from repositories.async_match_repository import AsyncMatchRepository
+from schemas.match_schema import MatchResponse
+
+
+class AsyncMatchService:
+
+    def __init__(self, repository: AsyncMatchRepository):
+        self.repository = repository
+
+    async def get_by_id(self, match_id: int) -> MatchResponse:
+        match = await self.repository.get_by_id(match_id)
+        if not match:
+            raise HTTPException(status_code=404, detail="Match not found")
+        return match
+
+    async def get_all(self, season_id: int = None, after: str = None, limit: int = None) -> Page[MatchResponse]:
+        return await self.repository.get_all(season_id=season_id, after=after, limit=limit)
@@ -0,0 +1,56 @@
+import logging
+from fastapi import HTTPException
+
+from core.config import settings
+from engines.standings_engine import SeasonStandings, StandingsStore
+
+from repositories.async_season_repository import AsyncSeasonRepository
+from schemas.season_schema import (
+    SeasonResponse,
+    LeagueTableResponse
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSeasonService:
+
+    def __init__(self, repository: AsyncSeasonRepository):
+        self.repository = repository
+
+    async def get_season(self, season_id: int) -> SeasonResponse:
+        season = await self.repository.get_by_id(season_id)
+
+        if not season:
+            raise HTTPException(status_code=404, detail="Season not found")
+
+        return season
+
+    async def get_league_table(self, season_id: int) -> LeagueTableResponse:
+        if season_id <= 0:
+            raise ValueError("Invalid season id")
+
+        season = await self.repository.get_by_id(season_id)
+        if not season:
+            raise ValueError("Season not found")
+
+        if settings.LEAGUE_TABLE_SOURCE == "procedure":
+            return await self.repository.get_league_table(season_id)
+
+        generation = StandingsStore.generation()
+        table = StandingsStore.get_table(season_id, season.status.value)
+        if table is None:
+            standings = SeasonStandings.from_matches(await self.repository.get_league_matches(season_id))
+            StandingsStore.set(season_id, standings, generation)
+            table = standings.to_response(season.status.value)
+
+        if settings.LEAGUE_TABLE_SOURCE == "parity":
+            expected = await self.repository.get_league_table(season_id)
+            if expected != table:
+                logger.warning(
+                    "League table parity mismatch for season %s: procedure=%s engine=%s",
+                    season_id, expected.model_dump(), table.model_dump()
+                )
+            return expected
+
+        return table
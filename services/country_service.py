@@ -1,20 +1,29 @@
-from typing import List, Optional
+from typing import Callable, Optional
 from fastapi import HTTPException
+import mysql.connector
 from repositories.country_repository import CountryRepository
+from core.pagination import Page
 from schemas.country_schema import (
     CountryCreateRequest,
     CountryUpdateRequest,
     CountryResponse
 )
 
+DUPLICATE_ENTRY = 1062
+DUPLICATE_KEYS = {
+    "UX_Countries_Name": "Country name already exists.",
+    "UX_Countries_IsoCode2": "ISO Code2 already exists.",
+    "UX_Countries_IsoCode3": "ISO Code3 already exists."
+}
+
 
 class CountryService:
 
     def __init__(self, repository: CountryRepository):
         self.repository = repository
 
-    def get_all(self) -> List[CountryResponse]:
-        return self.repository.get_all()
+    def get_all(self, after: str = None, limit: int = None) -> Page[CountryResponse]:
+        return self.repository.get_all(after=after, limit=limit)
 
     def get_by_id(self, country_id: int) -> CountryResponse:
         country = self.repository.get_by_id(country_id)
@@ -45,10 +54,10 @@ class CountryService:
             continent=request.continent.strip() if request.continent else None
         )
 
-        return self.repository.create(normalized_request)
+        return self._save(lambda: self.repository.create(normalized_request))
 
     def update(self, country_id: int, request: CountryUpdateRequest) -> CountryResponse:
-        existing = self.repository.get_by_id(country_id)
+        existing = self.repository.get_by_id(country_id, cached=False)
         if not existing:
             raise HTTPException(status_code=404, detail="Country not found.")
 
@@ -86,7 +95,7 @@ class CountryService:
 
         normalized_request = CountryUpdateRequest(**update_data)
 
-        return self.repository.update(country_id, normalized_request)
+        return self._save(lambda: self.repository.update(country_id, normalized_request, existing))
 
     def delete(self, country_id: int) -> bool:
         existing = self.repository.get_by_id(country_id)
@@ -95,6 +104,19 @@ class CountryService:
 
         return self.repository.delete(country_id)
 
+    @staticmethod
+    def _save(write: Callable[[], CountryResponse]) -> CountryResponse:
+        try:
+            return write()
+        except mysql.connector.IntegrityError as error:
+            if error.errno != DUPLICATE_ENTRY:
+                raise
+            detail = next(
+                (detail for key, detail in DUPLICATE_KEYS.items() if key in str(error.msg)),
+                "Country already exists."
+            )
+            raise HTTPException(status_code=400, detail=detail)
+
     def validate_country_exists(self, country_id: int):
         if not self.repository.exists_by_id(country_id):
             raise HTTPException(status_code=400, detail="Invalid nationality_id.")
\ No newline at end of file
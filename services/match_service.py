@@ -1,11 +1,18 @@
-from typing import List
+from typing import List, Iterator, Optional
 from schemas.match_schema import (
     MatchCreateRequest,
     MatchUpdateRequest,
     MatchResponse,
-    MatchOrderResponse
+    MatchOrderResponse,
+    FixtureGenerateRequest
 )
 from repositories.match_repository import MatchRepository
+from repositories.season_repository import SeasonRepository
+from core.pagination import Page
+from engines.standings_engine import StandingsStore
+from enums.season_status import SeasonStatus
+from engines.head_to_head_matrix import HeadToHeadMatrixCache
+from engines.fixture_generator import schedule
 from fastapi import HTTPException
 
 
@@ -14,8 +21,51 @@ class MatchService:
     def __init__(self, repository: MatchRepository):
         self.repository = repository
 
+    def _after_commit(self, season_id: int, before: Optional[MatchResponse], after: Optional[MatchResponse]) -> None:
+        def apply() -> None:
+            SeasonRepository.invalidate(season_id)
+            StandingsStore.apply_match_change(season_id, before, after)
+            HeadToHeadMatrixCache.apply_match_change(before, after)
+
+        self.repository.db.after_commit(apply)
+
     def create(self, request: MatchCreateRequest) -> MatchResponse:
-        return self.repository.create(request)
+        match = self.repository.create(request)
+        self._after_commit(match.season_id, None, match)
+        return match
+
+    def generate_fixtures(self, request: FixtureGenerateRequest) -> List[MatchResponse]:
+        status = self.repository.lock_season(request.season_id)
+        if status is None:
+            raise HTTPException(status_code=404, detail="Season not found")
+        if status == SeasonStatus.Completed.value:
+            raise HTTPException(status_code=400, detail="Season already completed")
+
+        rostered = self.repository.get_season_team_ids(request.season_id)
+        team_ids = request.team_ids or rostered
+
+        unknown = sorted(set(team_ids) - set(rostered))
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Teams not rostered for this season: {', '.join(map(str, unknown))}"
+            )
+
+        if len(team_ids) < 2:
+            raise HTTPException(status_code=400, detail="At least two teams are required to generate fixtures")
+
+        first_order = self.repository.get_order(request.season_id).order
+        fixtures = schedule(
+            team_ids,
+            request.start_date,
+            request.end_date,
+            first_order,
+            double=request.double_round_robin
+        )
+
+        matches = self.repository.create_fixtures(request.season_id, fixtures)
+        self.repository.db.after_commit(lambda: StandingsStore.invalidate(request.season_id))
+        return matches
 
     def get_by_id(self, match_id: int) -> MatchResponse:
         match = self.repository.get_by_id(match_id)
@@ -23,18 +73,28 @@ class MatchService:
             raise HTTPException(status_code=404, detail="Match not found")
         return match
 
-    def get_all(self, season_id: int = None) -> List[MatchResponse]:
-        return self.repository.get_all(season_id=season_id)
+    def get_all(self, season_id: int = None, after: str = None, limit: int = None) -> Page[MatchResponse]:
+        return self.repository.get_all(season_id=season_id, after=after, limit=limit)
+
+    def iter_all(self, season_id: int = None) -> Iterator[MatchResponse]:
+        return self.repository.iter_all(season_id=season_id)
 
     def update(self, match_id: int, request: MatchUpdateRequest) -> MatchResponse:
-        match = self.repository.update(match_id, request)
+        existing = self.repository.get_by_id(match_id)
+        if not existing:
+            raise HTTPException(status_code=404, detail="Match not found")
+
+        match = self.repository.update(match_id, request, existing)
         if not match:
             raise HTTPException(status_code=404, detail="Match not found")
+        self._after_commit(match.season_id, existing, match)
         return match
 
     def delete(self, match_id: int) -> bool:
-        if not self.repository.soft_delete(match_id):
+        existing = self.repository.get_by_id(match_id)
+        if not existing or not self.repository.soft_delete(match_id):
             raise HTTPException(status_code=404, detail="Match not found")
+        self._after_commit(existing.season_id, existing, None)
         return True
     
     def get_next_match_order(self, season_id: int) -> MatchOrderResponse:
@@ -1,7 +1,8 @@
-from typing import List
+from typing import Iterator
 from datetime import date
 from fastapi import HTTPException
 from repositories.player_repository import PlayerRepository
+from core.pagination import Page
 from services.country_service import CountryService
 from schemas.player_schema import (
     PlayerCreateRequest,
@@ -20,8 +21,11 @@ class PlayerService:
         self.repository = repository
         self.country_service = country_service
 
-    def get_all(self) -> List[PlayerResponse]:
-        return self.repository.get_all()
+    def get_all(self, after: str = None, limit: int = None) -> Page[PlayerResponse]:
+        return self.repository.get_all(after=after, limit=limit)
+
+    def iter_all(self) -> Iterator[PlayerResponse]:
+        return self.repository.iter_all()
 
     def get_by_id(self, player_id: int) -> PlayerResponse:
         player = self.repository.get_by_id(player_id)
@@ -56,7 +60,7 @@ class PlayerService:
         return self.repository.create(normalized_request)
 
     def update(self, player_id: int, request: PlayerUpdateRequest) -> PlayerResponse:
-        existing = self.repository.get_by_id(player_id)
+        existing = self.repository.get_by_id(player_id, cached=False)
         if not existing:
             raise HTTPException(status_code=404, detail="Player not found.")
 
@@ -87,7 +91,7 @@ class PlayerService:
 
         normalized_request = PlayerUpdateRequest(**update_data)
 
-        return self.repository.update(player_id, normalized_request)
+        return self.repository.update(player_id, normalized_request, existing)
 
     def delete(self, player_id: int) -> bool:
         existing = self.repository.get_by_id(player_id)
@@ -1,7 +1,14 @@
 from fastapi import HTTPException
 import mysql.connector
 
+from enums.season_status import SeasonStatus
 from repositories.roster_repository import RosterRepository
+from schemas.roster_schema import (
+    RosterBulkAssignRequest,
+    RosterBulkAssignResponse,
+    RosterBulkAssignResult,
+    RosterCloneRequest
+)
 
 
 class RosterService:
@@ -32,6 +39,87 @@ class RosterService:
                 detail=str(e.msg)
             )
         
+    def assign_players(self, request: RosterBulkAssignRequest) -> RosterBulkAssignResponse:
+        # Rules copied from usp_AssignPlayerToTeam; the FOR UPDATE reads hold them until commit.
+        status = self.repository.get_season_status(request.season_id, lock=True)
+        if status is None:
+            raise HTTPException(status_code=404, detail="Season not found")
+        if status == SeasonStatus.Completed.value:
+            raise HTTPException(status_code=400, detail="Season already completed")
+
+        team_ids = {item.team_id for item in request.assignments}
+        player_ids = {item.player_id for item in request.assignments}
+
+        existing_teams = self.repository.get_existing_ids("tblTeams", team_ids)
+        existing_players = self.repository.get_existing_ids("tblPlayers", player_ids)
+        assigned = self.repository.get_assigned_players(request.season_id, player_ids)
+
+        results = []
+        accepted = []
+        seen = set()
+
+        for item in request.assignments:
+            error = None
+            if item.team_id not in existing_teams:
+                error = "Team not found"
+            elif item.player_id not in existing_players:
+                error = "Player not found"
+            elif item.player_id in assigned:
+                error = "Player already assigned to a team for this season"
+            elif item.player_id in seen:
+                error = "Player appears more than once in this request"
+
+            seen.add(item.player_id)
+            results.append(RosterBulkAssignResult(
+                team_id=item.team_id,
+                player_id=item.player_id,
+                success=error is None,
+                error=error
+            ))
+            if error is None:
+                accepted.append((item.team_id, item.player_id))
+
+        try:
+            rosters = self.repository.assign_players(request.season_id, accepted)
+        except mysql.connector.Error as e:
+            raise HTTPException(
+                status_code=400,
+                detail=str(e.msg)
+            )
+
+        for result in results:
+            if result.success:
+                result.roster = rosters.get(result.player_id)
+
+        return RosterBulkAssignResponse(
+            season_id=request.season_id,
+            assigned=len(accepted),
+            failed=len(results) - len(accepted),
+            results=results
+        )
+
+    def clone_rosters(self, season_id: int, source_season_id: int, request: RosterCloneRequest):
+        if season_id == source_season_id:
+            raise HTTPException(status_code=400, detail="Source and target season must differ")
+
+        status = self.repository.get_season_status(season_id)
+        if status is None:
+            raise HTTPException(status_code=404, detail="Season not found")
+        if status == SeasonStatus.Completed.value:
+            raise HTTPException(status_code=400, detail="Season already completed")
+
+        if self.repository.get_season_status(source_season_id) is None:
+            raise HTTPException(status_code=404, detail="Source season not found")
+
+        self.repository.clone_rosters(
+            season_id,
+            source_season_id,
+            request.exclude_team_ids,
+            request.exclude_player_ids
+        )
+
+        return self.repository.get_season_team_players_history(season_id)
+
     def remove_player(self, season_id: int, player_id: int):
         removed = self.repository.remove_player(season_id, player_id)
 
@@ -1,7 +1,11 @@
-from typing import List
+import logging
 
 from fastapi import HTTPException
 
+from core.config import settings
+from core.pagination import Page
+from engines.standings_engine import SeasonStandings, StandingsStore
+
 from schemas.season_schema import (
     SeasonCreateRequest,
     SeasonUpdateRequest,
@@ -10,6 +14,8 @@ from schemas.season_schema import (
 )
 from repositories.season_repository import SeasonRepository
 
+logger = logging.getLogger(__name__)
+
 
 class SeasonService:
 
@@ -34,11 +40,11 @@ class SeasonService:
 
         return season
 
-    def get_all_seasons(self) -> List[SeasonResponse]:
-        return self.repository.get_all()
+    def get_all_seasons(self, after: str = None, limit: int = None) -> Page[SeasonResponse]:
+        return self.repository.get_all(after=after, limit=limit)
 
     def update_season(self, season_id: int, request: SeasonUpdateRequest) -> SeasonResponse:
-        existing = self.repository.get_by_id(season_id)
+        existing = self.repository.get_by_id(season_id, cached=False)
 
         if not existing:
             raise HTTPException(status_code=404, detail="Season not found")
@@ -50,7 +56,7 @@ class SeasonService:
                 if update_data["end_date"] < update_data["start_date"]:
                     raise HTTPException(status_code=400, detail="End date cannot be before start date")
 
-        updated = self.repository.update(season_id, request)
+        updated = self.repository.update(season_id, request, existing)
 
         if not updated:
             raise HTTPException(status_code=404, detail="Season not found")
@@ -58,7 +64,7 @@ class SeasonService:
         return updated
 
     def delete_season(self, season_id: int) -> dict:
-        existing = self.repository.get_by_id(season_id)
+        existing = self.repository.get_by_id(season_id, cached=False)
 
         if not existing:
             raise HTTPException(status_code=404, detail="Season not found")
@@ -68,6 +74,8 @@ class SeasonService:
         if not deleted:
             raise HTTPException(status_code=400, detail="Failed to delete season")
 
+        self.repository.db.after_commit(lambda: StandingsStore.invalidate(season_id))
+
         return {"message": "Season deleted successfully"}
     
     def get_league_table(self, season_id: int) -> LeagueTableResponse:
@@ -78,4 +86,23 @@ class SeasonService:
         if not season:
             raise ValueError("Season not found")
 
-        return self.repository.get_league_table(season_id)
\ No newline at end of file
+        if settings.LEAGUE_TABLE_SOURCE == "procedure":
+            return self.repository.get_league_table(season_id)
+
+        generation = StandingsStore.generation()
+        table = StandingsStore.get_table(season_id, season.status.value)
+        if table is None:
+            standings = SeasonStandings.from_matches(self.repository.get_league_matches(season_id))
+            StandingsStore.set(season_id, standings, generation)
+            table = standings.to_response(season.status.value)
+
+        if settings.LEAGUE_TABLE_SOURCE == "parity":
+            expected = self.repository.get_league_table(season_id)
+            if expected != table:
+                logger.warning(
+                    "League table parity mismatch for season %s: procedure=%s engine=%s",
+                    season_id, expected.model_dump(), table.model_dump()
+                )
+            return expected
+
+        return table
\ No newline at end of file
@@ -1,5 +1,7 @@
 from fastapi import HTTPException
+from typing import List
 from repositories.stats_repository import StatsRepository
+from schemas.stats_schema import HeadToHeadResponse, HeadToHeadPair
 
 
 class StatsService:
@@ -15,3 +17,17 @@ class StatsService:
             )
 
         return self.repository.get_head_to_head(team1_id, team2_id)
+
+    def get_head_to_head_matrix(self) -> List[HeadToHeadResponse]:
+        return self.repository.get_head_to_head_matrix().all_pairs()
+
+    def get_head_to_head_batch(self, pairs: List[HeadToHeadPair]) -> List[HeadToHeadResponse]:
+        if any(pair.team1_id == pair.team2_id for pair in pairs):
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot compare a team with itself"
+            )
+
+        return self.repository.get_head_to_head_pairs(
+            [(pair.team1_id, pair.team2_id) for pair in pairs]
+        )
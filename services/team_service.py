@@ -1,5 +1,6 @@
 from typing import List, Optional
 from repositories.team_repository import TeamRepository
+from engines.standings_engine import StandingsStore
 from schemas.team_schema import (
     TeamCreateRequest,
     TeamUpdateRequest,
@@ -22,7 +23,11 @@ class TeamService:
         return self.repository.create(request)
 
     def update(self, team_id: int, request: TeamUpdateRequest) -> Optional[TeamResponse]:
-        return self.repository.update(team_id, request)
+        team = self.repository.update(team_id, request)
+        self.repository.db.after_commit(StandingsStore.clear)
+        return team
 
     def delete(self, team_id: int) -> bool:
-        return self.repository.delete(team_id)
+        deleted = self.repository.delete(team_id)
+        self.repository.db.after_commit(StandingsStore.clear)
+        return deleted
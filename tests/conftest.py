@@ -0,0 +1,74 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+for key, value in {
+    "CPL_APP_NAME": "cpl-test",
+    "CPL_APP_ENV": "dev",
+    "CPL_APP_HOST": "127.0.0.1",
+    "CPL_APP_PORT": "8000",
+    "CPL_APP_ALLOWED_HOSTS": "*",
+    "CPL_DB_HOST": "127.0.0.1",
+    "CPL_DB_PORT": "3306",
+    "CPL_DB_USER": "root",
+    "CPL_DB_PWD": "root",
+    "CPL_DB_NAME": "cpl_test",
+    "CPL_DB_POOL_SIZE": "1",
+    "CPL_METRICS_ENABLED": "1"
+}.items():
+    os.environ.setdefault(key, value)
+
+
+@pytest.fixture
+def database(monkeypatch):
+    from core.cache import TTLCache
+    from core.database import Database
+    from engines.head_to_head_matrix import HeadToHeadMatrixCache
+    from engines.standings_engine import StandingsStore
+    from tests.sqlite_db import SQLiteConnection
+
+    for cache in TTLCache.registry.values():
+        cache.clear()
+    StandingsStore.clear()
+    HeadToHeadMatrixCache.invalidate()
+
+    connection = SQLiteConnection()
+    monkeypatch.setattr(Database, "get_connection", classmethod(lambda cls: connection))
+    monkeypatch.setattr(Database, "get_read_connection", classmethod(lambda cls, token=None: connection))
+    return connection
+
+
+@pytest.fixture
+def query_guard(monkeypatch):
+    from core import instrumentation
+    from core.config import settings
+    from core.query_guard import QueryGuard
+
+    guards = []
+
+    class RecordingGuard(QueryGuard):
+
+        def __init__(self, scope: dict):
+            super().__init__(scope)
+            guards.append(self)
+
+    monkeypatch.setattr(settings, "QUERY_GUARD", "warn")
+    monkeypatch.setattr(instrumentation, "QueryGuard", RecordingGuard)
+    yield guards
+
+    for guard in guards:
+        guard.check()
+
+
+@pytest.fixture
+def client(database, query_guard):
+    from fastapi.testclient import TestClient
+
+    import main
+
+    return TestClient(main.app)
@@ -0,0 +1,142 @@
+import datetime
+import re
+import sqlite3
+
+import mysql.connector
+
+from core.instrumentation import instrument_cursor
+
+SCHEMA = """
+CREATE TABLE tblCountries (
+    Id INTEGER PRIMARY KEY, Name TEXT, IsoCode2 TEXT, IsoCode3 TEXT,
+    Capital TEXT, PhoneCode TEXT, Continent TEXT, Void INT DEFAULT 0
+);
+CREATE UNIQUE INDEX UX_Countries_Name ON tblCountries (Name COLLATE NOCASE) WHERE Void = 0;
+CREATE UNIQUE INDEX UX_Countries_IsoCode2 ON tblCountries (IsoCode2 COLLATE NOCASE) WHERE Void = 0;
+CREATE UNIQUE INDEX UX_Countries_IsoCode3 ON tblCountries (IsoCode3 COLLATE NOCASE) WHERE Void = 0;
+CREATE TABLE tblTeams (
+    Id INTEGER PRIMARY KEY, Name TEXT, Slogan TEXT, LogoUrl TEXT, Void INT DEFAULT 0
+);
+CREATE TABLE tblPlayers (
+    Id INTEGER PRIMARY KEY, FirstName TEXT, LastName TEXT, DateOfBirth DATE,
+    AvatarUrl TEXT, NationalityId INT, Void INT DEFAULT 0
+);
+CREATE TABLE tblSeasons (
+    Id INTEGER PRIMARY KEY, Name TEXT, StartDate DATE, EndDate DATE,
+    Status INT NOT NULL DEFAULT 1, Void INT DEFAULT 0
+);
+CREATE TABLE tblMatches (
+    Id INTEGER PRIMARY KEY, Team1 INT, Team2 INT, ScheduledDate DATE, Duration INT,
+    Extra INT, GoldenStrike INT NOT NULL DEFAULT 0, Category INT, Status INT,
+    `Order` INT, SeasonId INT, NetPoints INT, Outcome INT,
+    TossOutcome INT NOT NULL DEFAULT 0, Void INT DEFAULT 0
+);
+CREATE TABLE tblPlayersSeasonsTeams (
+    Id INTEGER PRIMARY KEY, PlayerId INT, SeasonId INT, TeamId INT, Void INT DEFAULT 0
+);
+"""
+
+sqlite3.register_adapter(datetime.date, lambda value: value.isoformat())
+sqlite3.register_converter("DATE", lambda value: datetime.date.fromisoformat(value.decode()))
+
+
+def _sql(query: str) -> str:
+    return query.replace(" FOR UPDATE", "").replace("%s", "?")
+
+
+def _duplicate_entry(connection: sqlite3.Connection, error: sqlite3.IntegrityError):
+    match = re.search(r"UNIQUE constraint failed: (\w+)\.(\w+)", str(error))
+    if match is None:
+        return mysql.connector.IntegrityError(msg=str(error))
+
+    table, column = match.groups()
+    for index in connection.execute(f"PRAGMA index_list({table})"):
+        columns = [row[2] for row in connection.execute(f"PRAGMA index_info({index[1]})")]
+        if columns == [column]:
+            return mysql.connector.IntegrityError(
+                msg=f"Duplicate entry for key '{table}.{index[1]}'",
+                errno=1062
+            )
+    return mysql.connector.IntegrityError(msg=str(error), errno=1062)
+
+
+class SQLiteCursor:
+
+    def __init__(self, connection: sqlite3.Connection, dictionary: bool):
+        self._connection = connection
+        self._cursor = connection.cursor()
+        self._dictionary = dictionary
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def execute(self, query: str, params=()):
+        try:
+            self._cursor.execute(_sql(query), tuple(params))
+        except sqlite3.IntegrityError as error:
+            raise _duplicate_entry(self._connection, error)
+
+    def executemany(self, query: str, rows):
+        try:
+            self._cursor.executemany(_sql(query), [tuple(row) for row in rows])
+        except sqlite3.IntegrityError as error:
+            raise _duplicate_entry(self._connection, error)
+
+    def _row(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return {column[0]: value for column, value in zip(self._cursor.description, row)}
+
+    def fetchone(self):
+        return self._row(self._cursor.fetchone())
+
+    def fetchall(self):
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    def fetchmany(self, size: int = 1):
+        return [self._row(row) for row in self._cursor.fetchmany(size)]
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+
+    def __init__(self):
+        self.raw = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+        self.raw.executescript(SCHEMA)
+
+    def cursor(self, dictionary: bool = False, **kwargs):
+        return instrument_cursor(SQLiteCursor(self.raw, dictionary))
+
+    def fetch_all(self, query: str, params=(), dictionary: bool = False) -> list:
+        if "information_schema.COLUMNS" in query:
+            return self._column_default(*params)
+
+        cursor = self.cursor(dictionary=dictionary)
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
+    def fetch_one(self, query: str, params=(), dictionary: bool = False):
+        rows = self.fetch_all(query, params, dictionary)
+        return rows[0] if rows else None
+
+    def _column_default(self, table: str, column: str) -> list:
+        for row in self.raw.execute(f"PRAGMA table_info({table})"):
+            if row[1] == column:
+                return [(row[4],)]
+        return []
+
+    def commit(self):
+        self.raw.commit()
+
+    def rollback(self):
+        self.raw.rollback()
+
+    def close(self):
+        pass
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from core.async_database import AsyncDatabase, current_async_db, get_async_db
+from core.config import settings
+from core.pool import PoolSaturatedError
+
+
+class FakeConnection:
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+class FakePool:
+
+    def __init__(self, hang: bool = False):
+        self.hang = hang
+        self.acquired = []
+        self.released = []
+
+    async def acquire(self):
+        if self.hang:
+            await asyncio.sleep(60)
+        connection = FakeConnection()
+        self.acquired.append(connection)
+        return connection
+
+    def release(self, connection):
+        self.released.append(connection)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(AsyncDatabase, "_pool", pool)
+    return pool
+
+
+async def run_request(work=None):
+    dependency = get_async_db()
+    session = await dependency.__anext__()
+    assert current_async_db() is session
+    try:
+        if work is not None:
+            await work(session)
+    except Exception as error:
+        with pytest.raises(type(error)):
+            await dependency.athrow(error)
+    else:
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+
+    with pytest.raises(RuntimeError):
+        current_async_db()
+
+
+def test_unused_session_never_acquires(pool):
+    asyncio.run(run_request())
+
+    assert pool.acquired == []
+
+
+def test_session_commits_and_releases(pool):
+    async def work(session):
+        assert await session.connection() is await session.connection()
+
+    asyncio.run(run_request(work))
+
+    (connection,) = pool.acquired
+    assert (connection.commits, connection.rollbacks) == (1, 0)
+    assert pool.released == [connection]
+
+
+def test_failed_request_rolls_back_and_releases(pool):
+    async def work(session):
+        await session.connection()
+        raise ValueError("boom")
+
+    asyncio.run(run_request(work))
+
+    (connection,) = pool.acquired
+    assert (connection.commits, connection.rollbacks) == (0, 1)
+    assert pool.released == [connection]
+
+
+def test_uninitialized_pool_is_an_error(monkeypatch):
+    monkeypatch.setattr(AsyncDatabase, "_pool", None)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(AsyncDatabase.get_connection())
+
+
+def test_acquire_timeout_is_pool_saturation(monkeypatch):
+    monkeypatch.setattr(AsyncDatabase, "_pool", FakePool(hang=True))
+    monkeypatch.setattr(settings, "DB_POOL_ACQUIRE_TIMEOUT", 0.01)
+
+    with pytest.raises(PoolSaturatedError) as error:
+        asyncio.run(AsyncDatabase.get_connection())
+
+    assert error.value.retry_after == settings.DB_POOL_RETRY_AFTER
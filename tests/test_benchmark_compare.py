@@ -0,0 +1,82 @@
+import json
+
+from benchmarks.compare import budget_for, compare, main
+
+
+def row(route="/teams/", method="GET", concurrency=1, **overrides):
+    return {
+        "method": method,
+        "route": route,
+        "concurrency": concurrency,
+        "p50_ms": 10.0,
+        "p90_ms": 11.0,
+        "p99_ms": 20.0,
+        "throughput_rps": 100.0,
+        "sql_statements": 1.0,
+        "alloc_peak_kib": 50.0,
+        "errors": 0,
+        **overrides
+    }
+
+
+def report(*rows, **meta):
+    return {"meta": {"scale": "small", "settings": {}, "requests": 500, **meta}, "results": list(rows)}
+
+
+def metrics(findings):
+    return [finding.metric for finding in findings]
+
+
+def test_changes_within_budget_pass():
+    findings, missing, warnings = compare(
+        report(row()),
+        report(row(p50_ms=10.9, p99_ms=24.0, throughput_rps=91.0, alloc_peak_kib=54.0)),
+        {}
+    )
+
+    assert (findings, missing, warnings) == ([], [], [])
+
+
+def test_regressions_are_reported_per_metric():
+    findings, _, _ = compare(
+        report(row()),
+        report(row(p50_ms=11.5, p99_ms=26.0, throughput_rps=80.0, sql_statements=2.0, alloc_peak_kib=60.0, errors=1)),
+        {}
+    )
+
+    assert metrics(findings) == ["p50_ms", "p99_ms", "throughput_rps", "sql_statements", "alloc_peak_kib", "errors"]
+    assert findings[0].change == "+15.0%"
+
+
+def test_route_budgets_override_the_default():
+    budgets = {"default": {"p50_pct": 0.05}, "routes": {"/teams/": {"p50_pct": 0.2}, "PATCH /teams/": {"p50_pct": 0.3}}}
+
+    assert budget_for(budgets, "GET", "/players/")["p50_pct"] == 0.05
+    assert budget_for(budgets, "GET", "/teams/")["p50_pct"] == 0.2
+    assert budget_for(budgets, "PATCH", "/teams/")["p50_pct"] == 0.3
+    assert compare(report(row()), report(row(p50_ms=11.5)), budgets)[0] == []
+
+
+def test_missing_routes_and_mismatched_runs_are_flagged():
+    findings, missing, warnings = compare(
+        report(row(), row(route="/players/")),
+        report(row(), requests=100),
+        {}
+    )
+
+    assert findings == []
+    assert missing == [("GET", "/players/", 1)]
+    assert warnings == ["runs differ in requests: 500 vs 100"]
+
+
+def test_exit_status(tmp_path, capsys):
+    baseline, candidate, slower = tmp_path / "base.json", tmp_path / "head.json", tmp_path / "slow.json"
+    baseline.write_text(json.dumps(report(row(), row(route="/players/"))))
+    candidate.write_text(json.dumps(report(row())))
+    slower.write_text(json.dumps(report(row(p50_ms=15.0), row(route="/players/"))))
+
+    assert main([str(baseline), str(baseline), "--quiet"]) == 0
+    assert main([str(baseline), str(candidate), "--quiet"]) == 1
+    assert main([str(baseline), str(candidate), "--quiet", "--allow-missing"]) == 0
+    assert main([str(baseline), str(slower), "--quiet"]) == 1
+    assert "GET /teams/ c=1: p50_ms 10 -> 15" in capsys.readouterr().out
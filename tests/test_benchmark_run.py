@@ -0,0 +1,54 @@
+import asyncio
+
+import httpx
+
+from benchmarks.run import Scenario, measure, percentile, target
+from benchmarks.stand_in import SCHEMA_PATH, split_statements
+
+
+def test_schema_splits_into_tables_and_procedures():
+    statements = list(split_statements(SCHEMA_PATH.read_text()))
+    heads = [" ".join(statement.split()[:3]) for statement in statements]
+
+    assert heads == [
+        "CREATE TABLE tblCountries",
+        "CREATE TABLE tblTeams",
+        "CREATE TABLE tblPlayers",
+        "CREATE TABLE tblSeasons",
+        "CREATE TABLE tblMatches",
+        "CREATE TABLE tblPlayersSeasonsTeams",
+        "CREATE PROCEDURE usp_GetLeagueTable(IN",
+        "CREATE PROCEDURE usp_GetLifetimeHeadToHead(IN",
+        "CREATE PROCEDURE usp_AssignPlayerToTeam(IN"
+    ]
+    assert all(statement.rstrip().endswith("END") for statement in statements[6:])
+
+
+def test_split_statements_honours_delimiters():
+    script = "-- comment\nSELECT 1;\n\nDELIMITER $$\nBEGIN\n  SELECT 2;\nEND $$\nDELIMITER ;\nSELECT 3;\n"
+
+    assert list(split_statements(script)) == ["SELECT 1", "BEGIN\n  SELECT 2;\nEND", "SELECT 3"]
+
+
+def test_target_and_percentile():
+    scenario = Scenario("matches", "GET", "/matches", "seasonId={season_id}&limit=100")
+
+    assert target(scenario, {"season_id": 3}) == "/matches?seasonId=3&limit=100"
+    assert target(Scenario("team", "GET", "/teams/{team_id}"), {"team_id": 5}) == "/teams/5"
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 3.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.99) == 4.0
+
+
+def test_measure_reports_latency_and_sql_from_server_timing(database):
+    import main
+
+    async def run():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await measure(client, Scenario("matches", "GET", "/matches"), "/matches?seasonId=1", 2, 6)
+
+    result = asyncio.run(run())
+
+    assert (result["requests"], result["errors"], result["concurrency"]) == (6, 0, 2)
+    assert result["sql_statements"] == 1
+    assert 0 < result["p50_ms"] <= result["p99_ms"] <= result["max_ms"]
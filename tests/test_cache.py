@@ -0,0 +1,40 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from core.cache import TTLCache
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class Listing(BaseModel):
+    items: List[Item]
+
+
+def test_missing_rows_are_not_cached():
+    cache = TTLCache("test-missing", max_entries=4, ttl_seconds=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_load(1, loader) is None
+    assert cache.get_or_load(1, loader) is None
+    assert len(calls) == 2
+
+
+def test_cached_models_are_not_shared():
+    cache = TTLCache("test-shared", max_entries=4, ttl_seconds=60)
+    first = cache.get_or_load("page", lambda: Listing(items=[Item(id=1, name="a")]))
+    first.items[0].name = "changed"
+    first.items.append(Item(id=2, name="b"))
+
+    second = cache.get_or_load("page", lambda: None)
+
+    assert second == Listing(items=[Item(id=1, name="a")])
+    assert second is not first
+    assert cache.hits == 1
@@ -0,0 +1,96 @@
+from fastapi import Request
+
+from core.conditional import conditional_response, etag
+from core.response import ApiResponse
+from core.streaming import NDJSON_MEDIA_TYPE
+
+
+def make_request(**headers) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/matches",
+        "headers": [(key.replace("_", "-").encode(), value.encode()) for key, value in headers.items()]
+    })
+
+
+def seed_match(database, season_id=1, order=1):
+    database.raw.execute(
+        "INSERT INTO tblMatches (Team1, Team2, ScheduledDate, Category, Status, `Order`, SeasonId, Outcome)"
+        " VALUES (1, 2, '2024-01-01', 1, 1, ?, ?, 3)",
+        (order, season_id)
+    )
+    database.raw.commit()
+
+
+def test_etag_is_derived_from_the_body():
+    content = ApiResponse(success=True, message="ok", data=[1, 2])
+
+    response = conditional_response(make_request(), content, vary="Accept")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag(response.body)
+    assert response.headers["Vary"] == "Accept"
+    assert etag(response.body) != etag(conditional_response(make_request(), ApiResponse(data=[1])).body)
+
+
+def test_matching_validator_is_not_modified():
+    content = ApiResponse(success=True, message="ok", data=[1, 2])
+    tag = conditional_response(make_request(), content).headers["ETag"]
+
+    for if_none_match in (tag, f'"other", W/{tag}', "*"):
+        not_modified = conditional_response(make_request(if_none_match=if_none_match), content, vary="Accept")
+        assert not_modified.status_code == 304
+        assert not_modified.body == b""
+        assert not_modified.headers["ETag"] == tag
+        assert not_modified.headers["Vary"] == "Accept"
+
+    assert conditional_response(make_request(if_none_match='"other"'), content).status_code == 200
+
+
+def test_etag_changes_with_writes_made_outside_this_process(client, database):
+    seed_match(database)
+    first = client.get("/matches", params={"seasonId": 1})
+    tag = first.headers["ETag"]
+
+    assert client.get("/matches", params={"seasonId": 1}, headers={"If-None-Match": tag}).status_code == 304
+
+    database.raw.execute("UPDATE tblMatches SET Duration = 42")
+    database.raw.commit()
+
+    changed = client.get("/matches", params={"seasonId": 1}, headers={"If-None-Match": tag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != tag
+    assert changed.json()["data"][0]["duration"] == 42
+
+
+def test_pages_get_their_own_etags(client, database):
+    for order in (1, 2):
+        seed_match(database, order=order)
+
+    first = client.get("/matches", params={"seasonId": 1, "limit": 1})
+    second = client.get("/matches", params={"seasonId": 1, "limit": 1, "cursor": first.json()["next_cursor"]})
+
+    assert first.json()["data"] != second.json()["data"]
+    assert first.headers["ETag"] != second.headers["ETag"]
+    assert client.get(
+        "/matches",
+        params={"seasonId": 1, "limit": 1, "cursor": first.json()["next_cursor"]},
+        headers={"If-None-Match": first.headers["ETag"]}
+    ).status_code == 200
+
+
+def test_streamed_matches_vary_on_accept_without_an_etag(client, database):
+    seed_match(database)
+    tag = client.get("/matches", params={"seasonId": 1}).headers["ETag"]
+
+    response = client.get(
+        "/matches",
+        params={"seasonId": 1},
+        headers={"Accept": NDJSON_MEDIA_TYPE, "If-None-Match": tag}
+    )
+
+    assert response.status_code == 200
+    assert "Accept" in [value.strip() for value in response.headers["Vary"].split(",")]
+    assert "ETag" not in response.headers
+    assert len(response.text.splitlines()) == 1
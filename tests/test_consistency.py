@@ -0,0 +1,78 @@
+import time
+
+from core.database import Database, UnitOfWork
+from core.pool import PoolSaturatedError
+
+
+class FakeConnection:
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class SaturatedPool:
+
+    def acquire(self):
+        raise PoolSaturatedError("cpl_replica_0", "wait queue is full", 1)
+
+
+def test_only_recent_tokens_pin_reads_to_the_primary():
+    assert not Database.requires_primary(None)
+    assert Database.requires_primary(Database.write_token())
+    assert not Database.requires_primary(int((time.time() - 3600) * 1000))
+
+
+def test_saturated_replica_falls_back_to_the_primary(monkeypatch):
+    primary = FakeConnection()
+    monkeypatch.setattr(Database, "_replicas", [SaturatedPool()])
+    monkeypatch.setattr(Database, "get_connection", classmethod(lambda cls: primary))
+
+    assert Database.get_read_connection() is primary
+
+
+def test_only_committed_write_sessions_count_as_writes():
+    untouched = UnitOfWork(FakeConnection)
+    with untouched.transaction():
+        pass
+    assert not untouched.wrote
+
+    reader = UnitOfWork(FakeConnection, read_only=True)
+    with reader.transaction():
+        reader.connection
+    assert not reader.wrote
+
+    writer = UnitOfWork(FakeConnection)
+    with writer.transaction():
+        writer.connection
+    assert writer.wrote
+
+    failed = UnitOfWork(FakeConnection)
+    try:
+        with failed.transaction():
+            failed.connection
+            raise ValueError()
+    except ValueError:
+        pass
+    assert not failed.wrote
+
+
+def test_failing_after_commit_callback_does_not_stop_the_others(caplog):
+    calls = []
+
+    def broken():
+        raise RuntimeError("cache is down")
+
+    uow = UnitOfWork(FakeConnection)
+    with uow.transaction():
+        uow.connection
+        uow.after_commit(broken)
+        uow.after_commit(lambda: calls.append("bumped"))
+
+    assert calls == ["bumped"]
+    assert "After-commit callback" in caplog.text
@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+
+from core.container import container
+from core.database import UnitOfWork, _current
+from repositories.country_repository import CountryRepository
+from services.country_service import CountryService
+
+
+def repositories():
+    return [
+        controller.service.repository
+        for controller in vars(container).values()
+    ]
+
+
+def test_services_share_one_graph():
+    assert container.players.service.country_service is container.countries.service
+
+
+def test_requests_do_not_build_controllers(client, database, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("built per request")
+
+    monkeypatch.setattr(CountryService, "__init__", fail)
+    monkeypatch.setattr(CountryRepository, "__init__", fail)
+
+    created = client.post("/countries/", json={"name": "India", "iso_code2": "IN", "iso_code3": "IND"})
+
+    assert created.status_code == 200
+    assert client.get(f"/countries/{created.json()['data']['id']}").status_code == 200
+
+
+def test_repositories_hold_no_request_state(client, database):
+    client.post("/countries/", json={"name": "India", "iso_code2": "IN", "iso_code3": "IND"})
+    client.get("/countries/")
+
+    assert all(vars(repository) == {} for repository in repositories())
+
+
+def test_session_is_bound_per_context():
+    repository = container.countries.service.repository
+    with pytest.raises(RuntimeError):
+        repository.db
+
+    barrier = threading.Barrier(2)
+    seen = {}
+
+    def request(name):
+        uow = UnitOfWork(lambda: None)
+        _current.set(uow)
+        barrier.wait()
+        seen[name] = repository.db is uow
+
+    threads = [threading.Thread(target=request, args=(name,)) for name in ("first", "second")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {"first": True, "second": True}
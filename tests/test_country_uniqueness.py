@@ -0,0 +1,54 @@
+import pytest
+
+from repositories.country_repository import CountryRepository
+
+
+def create(client, **overrides):
+    return client.post("/countries/", json={
+        "name": "India",
+        "iso_code2": "IN",
+        "iso_code3": "IND",
+        **overrides
+    })
+
+
+@pytest.fixture
+def unchecked(monkeypatch):
+    for method in ("exists_by_name", "exists_by_iso2", "exists_by_iso3"):
+        monkeypatch.setattr(CountryRepository, method, lambda self, value: False)
+
+
+@pytest.mark.parametrize("overrides, detail", [
+    ({"iso_code2": "XX", "iso_code3": "XXX"}, "Country name already exists."),
+    ({"name": "Bharat", "iso_code3": "XXX"}, "ISO Code2 already exists."),
+    ({"name": "Bharat", "iso_code2": "XX"}, "ISO Code3 already exists.")
+])
+def test_duplicate_key_on_create_is_a_bad_request(client, unchecked, overrides, detail):
+    assert create(client).status_code == 200
+
+    response = create(client, **overrides)
+
+    assert response.status_code == 400
+    assert response.json()["message"] == detail
+
+
+def test_duplicate_key_on_update_is_a_bad_request(client, unchecked):
+    assert create(client).status_code == 200
+    country_id = create(client, name="Nepal", iso_code2="NP", iso_code3="NPL").json()["data"]["id"]
+
+    response = client.patch(f"/countries/{country_id}", json={"iso_code2": "IN"})
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "ISO Code2 already exists."
+    assert client.get(f"/countries/{country_id}").json()["data"]["iso_code2"] == "NP"
+
+
+def test_voided_country_does_not_hold_its_keys(client, database):
+    country_id = create(client).json()["data"]["id"]
+    database.raw.execute("UPDATE tblCountries SET Void = 1 WHERE Id = ?", (country_id,))
+    database.raw.commit()
+
+    response = create(client)
+
+    assert response.status_code == 200
+    assert response.json()["data"]["id"] != country_id
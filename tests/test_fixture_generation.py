@@ -0,0 +1,75 @@
+from enums.season_status import SeasonStatus
+
+
+def seed_season(database, teams=4, status=SeasonStatus.Scheduled.value):
+    raw = database.raw
+    season_id = raw.execute(
+        "INSERT INTO tblSeasons (Name, StartDate, EndDate, Status) VALUES ('2024', '2024-01-01', '2024-03-31', ?)",
+        (status,)
+    ).lastrowid
+    for index in range(teams):
+        team_id = raw.execute("INSERT INTO tblTeams (Name) VALUES (?)", (f"Team {index}",)).lastrowid
+        raw.execute(
+            "INSERT INTO tblPlayersSeasonsTeams (PlayerId, SeasonId, TeamId) VALUES (?, ?, ?)",
+            (index + 1, season_id, team_id)
+        )
+    raw.commit()
+    return season_id
+
+
+def generate(client, season_id, **extra):
+    return client.post("/matches/fixtures", json={
+        "season_id": season_id,
+        "start_date": "2024-01-01",
+        "end_date": "2024-03-31",
+        **extra
+    })
+
+
+def test_fixtures_are_read_back_from_the_stored_rows(client, database):
+    season_id = seed_season(database)
+    database.raw.execute(
+        "INSERT INTO tblMatches (Team1, Team2, ScheduledDate, Category, Status, `Order`, SeasonId, Outcome)"
+        " VALUES (1, 2, '2023-12-30', 6, 1, 1, ?, 3)",
+        (season_id,)
+    )
+    database.raw.commit()
+
+    response = generate(client, season_id)
+
+    assert response.status_code == 200
+    fixtures = response.json()["data"]
+    assert len(fixtures) == 6
+    assert [fixture["order"] for fixture in fixtures] == list(range(2, 8))
+
+    for fixture in fixtures:
+        stored = client.get(f"/matches/{fixture['id']}").json()["data"]
+        assert stored == fixture
+
+    pairs = {frozenset((fixture["team1"], fixture["team2"])) for fixture in fixtures}
+    assert len(pairs) == 6
+
+
+def test_double_round_robin_plays_every_pair_twice(client, database):
+    season_id = seed_season(database, teams=3)
+
+    fixtures = generate(client, season_id, double_round_robin=True).json()["data"]
+
+    assert len(fixtures) == 6
+    assert {(fixture["team1"], fixture["team2"]) for fixture in fixtures} == {
+        (1, 2), (2, 1), (1, 3), (3, 1), (2, 3), (3, 2)
+    }
+
+
+def test_fixtures_need_an_open_season_and_rostered_teams(client, database):
+    season_id = seed_season(database)
+    completed_id = seed_season(database, teams=0, status=SeasonStatus.Completed.value)
+
+    assert generate(client, 999).status_code == 404
+    assert generate(client, completed_id).status_code == 400
+
+    response = generate(client, season_id, team_ids=[1, 2, 99])
+    assert response.status_code == 400
+    assert "99" in response.json()["message"]
+
+    assert database.fetch_one("SELECT COUNT(*) FROM tblMatches")[0] == 0
@@ -0,0 +1,158 @@
+import random
+
+from engines.head_to_head_matrix import HeadToHeadMatrix, HeadToHeadMatrixCache
+from enums.match_outcome import MatchOutcome
+from enums.match_status import MatchStatus
+from schemas.match_schema import MatchResponse
+
+
+def row(team1, team2, outcome=MatchOutcome.Team1Win, net_points=0, status=MatchStatus.Played) -> dict:
+    return {
+        "Team1": team1,
+        "Team2": team2,
+        "Status": status.value,
+        "NetPoints": net_points,
+        "Outcome": outcome.value
+    }
+
+
+def response(match_id, team1, team2, outcome=MatchOutcome.Team1Win, net_points=0, status=MatchStatus.Played):
+    return MatchResponse(
+        id=match_id,
+        team1=team1,
+        team2=team2,
+        scheduled_date="2024-01-01",
+        duration=None,
+        extra=None,
+        golden_strike=False,
+        category=1,
+        status=status.value,
+        season_id=1,
+        net_points=net_points,
+        outcome=outcome.value,
+        order=match_id,
+        toss_outcome=0
+    )
+
+
+def test_pairs_are_counted_from_both_sides():
+    matrix = HeadToHeadMatrix.from_matches([
+        row(1, 2, MatchOutcome.Team1Win, 3),
+        row(2, 1, MatchOutcome.Team1Win, 5),
+        row(1, 2, MatchOutcome.NotDecided),
+        row(1, 3, status=MatchStatus.Scheduled)
+    ])
+
+    result = matrix.get(1, 2)
+    assert (result.matches_played, result.team1_wins, result.team2_wins) == (3, 1, 1)
+    assert (result.team1_net_points, result.team2_net_points) == (-2, 2)
+    assert matrix.get(1, 3).matches_played == 0
+    assert [(pair.team1_id, pair.team2_id) for pair in matrix.all_pairs()] == [(1, 2), (2, 1)]
+
+
+def test_incremental_changes_match_a_rebuild():
+    generator = random.Random(7)
+    outcomes = list(MatchOutcome)
+    statuses = list(MatchStatus)
+    rows = {}
+    matrix = HeadToHeadMatrix()
+
+    for _ in range(500):
+        match_id = generator.randint(1, 40)
+        before = rows.get(match_id)
+        team1, team2 = generator.sample(range(1, 7), 2)
+        after = None if generator.random() < 0.1 else row(
+            team1,
+            team2,
+            generator.choice(outcomes),
+            generator.randint(0, 9),
+            generator.choice(statuses)
+        )
+
+        matrix.apply_change(before, after)
+        if after is None:
+            rows.pop(match_id, None)
+        else:
+            rows[match_id] = after
+
+    rebuilt = HeadToHeadMatrix.from_matches(rows.values())
+    assert matrix.all_pairs() == rebuilt.all_pairs()
+
+
+def test_cached_matrix_is_never_mutated_in_place():
+    HeadToHeadMatrixCache.invalidate()
+    HeadToHeadMatrixCache.set(HeadToHeadMatrix.from_matches([row(1, 2)]), HeadToHeadMatrixCache.generation())
+    snapshot = HeadToHeadMatrixCache.get()
+
+    HeadToHeadMatrixCache.apply_match_change(None, response(2, 1, 2))
+
+    assert snapshot.get(1, 2).matches_played == 1
+    assert HeadToHeadMatrixCache.get().get(1, 2).matches_played == 2
+
+
+def test_matrix_loaded_across_a_write_is_not_cached():
+    HeadToHeadMatrixCache.invalidate()
+    generation = HeadToHeadMatrixCache.generation()
+    stale = HeadToHeadMatrix.from_matches([row(1, 2)])
+
+    HeadToHeadMatrixCache.apply_match_change(None, response(2, 1, 2))
+    HeadToHeadMatrixCache.set(stale, generation)
+
+    assert HeadToHeadMatrixCache.get() is None
+
+
+def seed_matches(database):
+    for team1, team2, status, outcome, net_points in (
+        (1, 2, 3, 1, 4),
+        (2, 1, 3, 2, 6),
+        (1, 3, 3, 2, 1),
+        (2, 3, 2, 3, 0)
+    ):
+        database.raw.execute(
+            "INSERT INTO tblMatches (Team1, Team2, ScheduledDate, Category, Status, `Order`, SeasonId, NetPoints, Outcome)"
+            " VALUES (?, ?, '2024-01-01', 1, ?, 1, 1, ?, ?)",
+            (team1, team2, status, net_points, outcome)
+        )
+    database.raw.commit()
+
+
+def test_batch_endpoint_reads_pairs_from_the_matrix(client, database):
+    seed_matches(database)
+
+    response = client.post("/stats/head-to-head/batch", json={"pairs": [
+        {"team1_id": 1, "team2_id": 2},
+        {"team1_id": 3, "team2_id": 1},
+        {"team1_id": 5, "team2_id": 6}
+    ]})
+
+    assert response.status_code == 200
+    assert [
+        (pair["matches_played"], pair["team1_wins"], pair["team2_wins"], pair["team1_net_points"])
+        for pair in response.json()["data"]
+    ] == [(2, 2, 0, 10), (1, 1, 0, 1), (0, 0, 0, 0)]
+
+    matrix = client.get("/stats/head-to-head/matrix").json()["data"]
+    assert len(matrix) == 4
+
+
+def test_batch_endpoint_rejects_self_pairs(client, database):
+    response = client.post("/stats/head-to-head/batch", json={"pairs": [{"team1_id": 1, "team2_id": 1}]})
+
+    assert response.status_code == 400
+
+
+def test_match_writes_update_the_cached_matrix(client, database):
+    seed_matches(database)
+    pairs = {"pairs": [{"team1_id": 2, "team2_id": 3}]}
+    assert client.post("/stats/head-to-head/batch", json=pairs).json()["data"][0]["matches_played"] == 0
+
+    misses = HeadToHeadMatrixCache.misses
+    response = client.patch("/matches/4", json={"status": 3, "outcome": 1, "net_points": 3})
+    assert response.status_code == 200
+
+    cached = client.post("/stats/head-to-head/batch", json=pairs).json()["data"][0]
+    assert HeadToHeadMatrixCache.misses == misses
+    assert (cached["team1_wins"], cached["team1_net_points"]) == (1, 3)
+
+    HeadToHeadMatrixCache.invalidate()
+    assert client.post("/stats/head-to-head/batch", json=pairs).json()["data"][0] == cached
@@ -0,0 +1,41 @@
+import json
+import logging
+
+from core import instrumentation
+from core.config import settings
+
+
+def log_records(caplog):
+    return [json.loads(record.getMessage()) for record in caplog.records if record.name == "cpl.sql"]
+
+
+def test_server_timing_counts_statements(client, database):
+    response = client.get("/countries/")
+
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert 'desc="1 statements, 0 rows, 0 procedures"' in timing
+    assert "app;dur=" in timing and "total;dur=" in timing
+
+
+def test_log_record_includes_sql_in_debug_mode(client, database, caplog, monkeypatch):
+    database.raw.execute("INSERT INTO tblCountries (Name, IsoCode2, IsoCode3) VALUES ('India', 'IN', 'IND')")
+    database.raw.commit()
+    request_metrics = instrumentation.RequestMetrics
+    monkeypatch.setattr(instrumentation, "RequestMetrics", lambda scope: request_metrics(scope, debug=True))
+
+    with caplog.at_level(logging.INFO, logger="cpl.sql"):
+        client.get("/countries/")
+
+    (record,) = log_records(caplog)
+    assert (record["method"], record["path"], record["status"]) == ("GET", "/countries/", 200)
+    assert (record["statements"], record["rows"]) == (1, 1)
+    (statement,) = record["sql"]
+    assert statement["sql"].startswith("SELECT Id, Name, IsoCode2, IsoCode3")
+    assert statement["rows"] == 1
+
+
+def test_server_timing_can_be_disabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_TIMING", False)
+
+    assert "Server-Timing" not in client.get("/countries/").headers
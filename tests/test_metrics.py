@@ -0,0 +1,51 @@
+import re
+
+from core.config import Settings
+from core.metrics import render_samples
+
+
+def series(text, name):
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+def test_metrics_are_opt_in(monkeypatch):
+    monkeypatch.delenv("CPL_METRICS_ENABLED", raising=False)
+
+    assert Settings().METRICS_ENABLED is False
+
+
+def test_request_latency_is_labelled_by_route_template(client, database):
+    client.get("/countries/")
+    client.get("/countries/7")
+    client.get("/no-such-route")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    counts = series(response.text, "cpl_http_request_duration_seconds_count")
+    for labels in (
+        'method="GET",route="/countries/",status="200"',
+        'method="GET",route="/countries/{country_id}",status="404"',
+        'method="GET",route="unmatched",status="404"'
+    ):
+        assert any(line.startswith(f"cpl_http_request_duration_seconds_count{{{labels}}} ") for line in counts)
+    assert not any("/countries/7" in line or "no-such-route" in line for line in counts)
+
+
+def test_repository_and_cache_series_are_labelled(client, database):
+    client.get("/countries/")
+    client.get("/countries/")
+
+    text = client.get("/metrics").text
+
+    assert series(text, 'cpl_repository_duration_seconds_count{method="CountryRepository.get_all"}')
+    assert re.search(r'^cpl_cache_hits_total\{cache="countries"\} [1-9]', text, re.MULTILINE)
+    assert re.search(r'^cpl_cache_hit_ratio\{cache="standings"\} ', text, re.MULTILINE)
+    assert "# TYPE cpl_http_requests_in_flight gauge" in text
+
+
+def test_label_values_are_escaped():
+    lines = render_samples("cpl_test", "Test.", "gauge", ("name",), [(('say "hi"\\\n',), 1)])
+
+    assert lines[-1] == 'cpl_test{name="say \\"hi\\"\\\\\\n"} 1'
@@ -0,0 +1,51 @@
+import pytest
+
+from core.config import settings
+from core.pagination import encode_cursor
+
+
+def seed_countries(database, count):
+    database.raw.executemany(
+        "INSERT INTO tblCountries (Name, IsoCode2, IsoCode3) VALUES (?, ?, ?)",
+        [(f"Country {index}", f"C{index}", f"CC{index}") for index in range(count)]
+    )
+    database.raw.commit()
+
+
+def test_pages_walk_every_row_once(client, database):
+    seed_countries(database, 5)
+
+    ids, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/countries/", params=params).json()
+        ids += [country["id"] for country in body["data"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert ids == [1, 2, 3, 4, 5]
+
+
+def test_default_limit_applies(client, database, monkeypatch):
+    monkeypatch.setattr(settings, "PAGE_DEFAULT_LIMIT", 3)
+    seed_countries(database, 4)
+
+    body = client.get("/countries/").json()
+
+    assert len(body["data"]) == 3
+    assert body["next_cursor"] == encode_cursor(3)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("1"), encode_cursor(1, 2)])
+def test_invalid_cursor_is_a_bad_request(client, cursor):
+    response = client.get("/countries/", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "Invalid cursor."
+
+
+def test_limit_above_the_cap_is_rejected(client):
+    response = client.get("/countries/", params={"limit": settings.PAGE_MAX_LIMIT + 1})
+
+    assert response.status_code == 422
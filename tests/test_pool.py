@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core import pool as pool_module
+from core.database import Database
+from core.pool import ConnectionPoolManager, PoolSaturatedError
+from tests.sqlite_db import SQLiteConnection
+
+
+class FakeMySQLPool:
+
+    def __init__(self, pool_name, pool_size, pool_reset_session, **connect_args):
+        self.pool_size = pool_size
+
+    def get_connection(self):
+        return SQLiteConnection()
+
+
+@pytest.fixture(autouse=True)
+def fake_mysql_pool(monkeypatch):
+    monkeypatch.setattr(pool_module.pooling, "MySQLConnectionPool", FakeMySQLPool)
+
+
+def manager(max_waiters=0, acquire_timeout=0.05):
+    return ConnectionPoolManager(
+        "cpl_test_pool",
+        pool_size=1,
+        max_waiters=max_waiters,
+        acquire_timeout=acquire_timeout,
+        retry_after=7
+    )
+
+
+def test_full_wait_queue_is_rejected():
+    pool = manager()
+    connection = pool.acquire()
+
+    with pytest.raises(PoolSaturatedError, match="wait queue is full"):
+        pool.acquire()
+
+    connection.close()
+    pool.acquire().close()
+    stats = pool.stats()
+    assert (stats["acquired"], stats["rejected"], stats["in_use"]) == (2, 1, 0)
+    assert stats["hold_seconds"]["count"] == 2
+
+
+def test_waiter_times_out():
+    pool = manager(max_waiters=1)
+    connection = pool.acquire()
+
+    with pytest.raises(PoolSaturatedError, match="acquire timed out"):
+        pool.acquire()
+
+    connection.close()
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_waiter_gets_the_released_connection():
+    pool = manager(max_waiters=1, acquire_timeout=5)
+    connection = pool.acquire()
+    acquired = []
+
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    waiter.start()
+    while pool.stats()["waiters"] == 0:
+        time.sleep(0.001)
+    connection.close()
+    waiter.join()
+
+    assert len(acquired) == 1
+    acquired[0].close()
+    assert pool.stats()["in_use"] == 0
+
+
+def test_saturated_pool_is_a_503_with_retry_after(monkeypatch):
+    import main
+
+    pool = manager()
+    monkeypatch.setattr(Database, "_pool", pool)
+    monkeypatch.setattr(Database, "_replicas", [])
+    held = pool.acquire()
+
+    response = TestClient(main.app).post("/countries/", json={"name": "India", "iso_code2": "IN", "iso_code3": "IND"})
+
+    held.close()
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+    assert response.json()["data"] == "wait queue is full"
@@ -0,0 +1,69 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from core.config import settings
+from core.query_guard import QueryBudgetExceeded, QueryGuard, fingerprint
+
+SCOPE = {"method": "GET", "path": "/countries/"}
+
+
+def test_fingerprint_collapses_literals_and_lists():
+    assert fingerprint("SELECT *  FROM t WHERE Id IN (%s, %s, %s) AND Name = 'x' LIMIT 10") == (
+        "SELECT * FROM t WHERE Id IN (?+) AND Name = ? LIMIT ?"
+    )
+
+
+def test_guard_records_violations_without_raising(monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_REPEAT_THRESHOLD", 3)
+    monkeypatch.setattr(QueryGuard, "budgets", {"GET /countries/": 2})
+    guard = QueryGuard(SCOPE)
+
+    guard.observe("SAVEPOINT sp1")
+    for country_id in (1, 1, 2):
+        guard.observe("SELECT * FROM tblCountries WHERE Id = %s", (country_id,))
+
+    assert guard.statements == 3
+    assert guard.violations == [
+        "duplicate statement: SELECT * FROM tblCountries WHERE Id = ?",
+        "3 statements of the same shape (N+1): SELECT * FROM tblCountries WHERE Id = ?",
+        "query budget of 2 exceeded"
+    ]
+    with pytest.raises(QueryBudgetExceeded):
+        guard.check()
+
+
+def test_runtime_guard_only_reports(database, monkeypatch):
+    import main
+
+    monkeypatch.setattr(settings, "QUERY_GUARD", "warn")
+    monkeypatch.setattr(QueryGuard, "budgets", {"POST /countries/": 1})
+
+    response = TestClient(main.app).post("/countries/", json={
+        "name": "India",
+        "iso_code2": "IN",
+        "iso_code3": "IND"
+    })
+
+    assert response.status_code == 200
+    assert response.headers["X-Query-Violations"] == "1"
+
+
+def test_fixture_collects_guards_for_every_request(client, query_guard, monkeypatch):
+    monkeypatch.setattr(QueryGuard, "budgets", {"GET /countries/{country_id}": 1, "GET /countries/": 1})
+
+    client.get("/countries/1")
+    client.get("/countries/")
+
+    assert [guard.route for guard in query_guard] == ["GET /countries/{country_id}", "GET /countries/"]
+    assert all(not guard.violations for guard in query_guard)
+
+
+def test_fixture_fails_requests_over_budget(client, query_guard, monkeypatch):
+    monkeypatch.setattr(QueryGuard, "budgets", {"POST /countries/": 1})
+
+    client.post("/countries/", json={"name": "India", "iso_code2": "IN", "iso_code3": "IND"})
+
+    (guard,) = query_guard
+    with pytest.raises(QueryBudgetExceeded, match="query budget of 1 exceeded"):
+        guard.check()
+    query_guard.clear()
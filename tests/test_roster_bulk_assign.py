@@ -0,0 +1,63 @@
+from enums.season_status import SeasonStatus
+
+
+def seed(database, status=SeasonStatus.Scheduled.value):
+    raw = database.raw
+    raw.execute("INSERT INTO tblSeasons (Name, Status) VALUES ('2024', ?)", (status,))
+    raw.executemany("INSERT INTO tblTeams (Name) VALUES (?)", [("Falcons",), ("Hawks",)])
+    raw.executemany(
+        "INSERT INTO tblPlayers (FirstName, LastName) VALUES (?, ?)",
+        [("Ana", "Rojas"), ("Eva", "Soto"), ("Ivo", "Lima")]
+    )
+    raw.execute("INSERT INTO tblPlayersSeasonsTeams (PlayerId, SeasonId, TeamId) VALUES (3, 1, 2)")
+    raw.commit()
+
+
+def assign(client, *assignments, season_id=1):
+    return client.post("/rosters/assign/bulk", json={
+        "season_id": season_id,
+        "assignments": [{"team_id": team_id, "player_id": player_id} for team_id, player_id in assignments]
+    })
+
+
+def test_all_assignments_succeed(client, database):
+    seed(database)
+
+    response = assign(client, (1, 1), (2, 2))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert body["data"]["assigned"] == 2
+    assert [result["roster"]["team_id"] for result in body["data"]["results"]] == [1, 2]
+
+
+def test_partial_failure_reports_each_item(client, database):
+    seed(database)
+
+    response = assign(client, (1, 1), (9, 2), (1, 9), (1, 3), (2, 1))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is False
+    assert body["message"] == "1 of 5 players assigned"
+    assert (body["data"]["assigned"], body["data"]["failed"]) == (1, 4)
+    assert [result["error"] for result in body["data"]["results"]] == [
+        None,
+        "Team not found",
+        "Player not found",
+        "Player already assigned to a team for this season",
+        "Player appears more than once in this request"
+    ]
+
+    stored = database.raw.execute(
+        "SELECT PlayerId, TeamId FROM tblPlayersSeasonsTeams WHERE SeasonId = 1 ORDER BY PlayerId"
+    ).fetchall()
+    assert stored == [(1, 1), (3, 2)]
+
+
+def test_completed_season_is_rejected(client, database):
+    seed(database, status=SeasonStatus.Completed.value)
+
+    assert assign(client, (1, 1)).status_code == 400
+    assert assign(client, (1, 1), season_id=9).status_code == 404
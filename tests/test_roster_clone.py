@@ -0,0 +1,66 @@
+from enums.season_status import SeasonStatus
+
+
+def seed(database, target_status=SeasonStatus.Scheduled.value):
+    raw = database.raw
+    raw.executemany(
+        "INSERT INTO tblSeasons (Name, Status) VALUES (?, ?)",
+        [("2023", SeasonStatus.Completed.value), ("2024", target_status)]
+    )
+    raw.executemany("INSERT INTO tblTeams (Name, Void) VALUES (?, ?)", [("Falcons", 0), ("Hawks", 0), ("Owls", 1)])
+    raw.executemany(
+        "INSERT INTO tblPlayers (FirstName, LastName) VALUES (?, ?)",
+        [("Ana", "Rojas"), ("Eva", "Soto"), ("Ivo", "Lima"), ("Leo", "Paz"), ("Mia", "Cruz")]
+    )
+    raw.executemany(
+        "INSERT INTO tblPlayersSeasonsTeams (PlayerId, SeasonId, TeamId) VALUES (?, ?, ?)",
+        [(1, 1, 1), (2, 1, 1), (3, 1, 2), (4, 1, 2), (5, 1, 3), (2, 2, 2)]
+    )
+    raw.commit()
+
+
+def rosters(database, season_id):
+    return database.raw.execute(
+        "SELECT PlayerId, TeamId FROM tblPlayersSeasonsTeams WHERE SeasonId = ? AND Void = 0 ORDER BY PlayerId",
+        (season_id,)
+    ).fetchall()
+
+
+def test_clone_copies_live_rosters_and_keeps_existing_assignments(client, database):
+    seed(database)
+
+    response = client.post("/rosters/season/2/clone-from/1", json={"exclude_player_ids": [4]})
+
+    assert response.status_code == 200
+    assert rosters(database, 2) == [(1, 1), (2, 2), (3, 2)]
+    teams = response.json()["data"]["teams"]
+    assert {team["team_id"]: sorted(player["player_id"] for player in team["players"]) for team in teams} == {
+        1: [1],
+        2: [2, 3]
+    }
+
+
+def test_clone_can_exclude_teams(client, database):
+    seed(database)
+
+    client.post("/rosters/season/2/clone-from/1", json={"exclude_team_ids": [1]})
+
+    assert rosters(database, 2) == [(2, 2), (3, 2), (4, 2)]
+
+
+def test_clone_is_idempotent(client, database):
+    seed(database)
+
+    client.post("/rosters/season/2/clone-from/1")
+    client.post("/rosters/season/2/clone-from/1")
+
+    assert rosters(database, 2) == [(1, 1), (2, 2), (3, 2), (4, 2)]
+
+
+def test_clone_validates_seasons(client, database):
+    seed(database)
+
+    assert client.post("/rosters/season/2/clone-from/2").status_code == 400
+    assert client.post("/rosters/season/1/clone-from/2").status_code == 400
+    assert client.post("/rosters/season/9/clone-from/1").status_code == 404
+    assert client.post("/rosters/season/2/clone-from/9").status_code == 404
@@ -0,0 +1,88 @@
+import random
+
+from enums.match_category import MatchCategory
+from enums.match_outcome import MatchOutcome
+from enums.match_status import MatchStatus
+from engines.standings_engine import SeasonStandings, StandingsStore
+from tests.test_standings_reference import TEAMS, match
+
+
+def table(standings: SeasonStandings):
+    return standings.to_response(2)
+
+
+def test_change_for_teams_missing_from_cached_table_is_refused():
+    standings = SeasonStandings.from_matches([match(1, 2, net_points=3)])
+
+    assert standings.apply_change(match(3, 4, net_points=2), None) is False
+    assert standings.apply_change(match(3, 4), match(3, 4, outcome=MatchOutcome.Team2Win)) is False
+    assert standings.apply_change(None, match(1, 5)) is False
+
+
+def test_change_for_result_missing_from_cached_table_is_refused():
+    standings = SeasonStandings.from_matches([
+        match(1, 2, status=MatchStatus.Scheduled, outcome=MatchOutcome.NotDecided)
+    ])
+
+    assert standings.apply_change(match(1, 2, net_points=4), None) is False
+    assert all(row.matches_played == 0 for row in table(standings).standings)
+
+
+def test_final_change_for_unknown_winner_is_refused():
+    standings = SeasonStandings.from_matches([match(1, 2)])
+
+    assert standings.apply_change(match(1, 2, category=MatchCategory.Final), None) is False
+
+
+def test_table_loaded_across_a_match_write_is_not_cached():
+    StandingsStore.clear()
+    generation = StandingsStore.generation()
+    stale = SeasonStandings.from_matches([match(1, 2)])
+
+    StandingsStore.apply_match_change(1, None, None)
+    StandingsStore.set(1, stale, generation)
+
+    assert StandingsStore.get_table(1, 2) is None
+
+    StandingsStore.set(1, stale, StandingsStore.generation())
+    assert StandingsStore.get_table(1, 2) == table(stale)
+
+
+def random_row(generator: random.Random, team_ids):
+    home, away = generator.sample(team_ids, 2)
+    return match(
+        home,
+        away,
+        outcome=generator.choice(list(MatchOutcome)),
+        net_points=generator.choice([None, 0, 2, 5]),
+        status=generator.choice(list(MatchStatus)),
+        category=generator.choice([MatchCategory.League] * 4 + [MatchCategory.Friendly, MatchCategory.Eliminator])
+    )
+
+
+def test_incremental_changes_match_a_rebuild():
+    generator = random.Random(7)
+    team_ids = sorted(TEAMS)
+
+    for _ in range(100):
+        rows = [random_row(generator, team_ids) for _ in range(12)]
+        standings = SeasonStandings.from_matches(rows)
+
+        for _ in range(10):
+            index = generator.randrange(len(rows) + 1)
+            before = rows[index] if index < len(rows) else None
+            after = None if before is not None and generator.random() < 0.3 else random_row(generator, team_ids)
+
+            if not standings.apply_change(before, after):
+                standings = None
+            if before is not None:
+                rows.pop(index)
+            if after is not None:
+                rows.append(after)
+
+            rebuilt = SeasonStandings.from_matches(rows)
+            if standings is None:
+                standings = rebuilt
+                continue
+
+            assert table(standings) == table(rebuilt)
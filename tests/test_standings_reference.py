@@ -0,0 +1,261 @@
+# The reference model and the stand-in procedure in benchmarks/schema.sql are
+# reimplementations; neither is the production usp_GetLeagueTable.
+import os
+import random
+
+import pytest
+
+from enums.match_category import MatchCategory
+from enums.match_outcome import MatchOutcome
+from enums.match_status import MatchStatus
+from enums.season_status import SeasonStatus
+from engines.standings_engine import SeasonStandings
+from repositories.season_repository import SeasonRepository
+
+TEAMS = {1: "Aces", 2: "Bulls", 3: "Comets", 4: "Dragons", 5: "Eagles", 6: "Falcons"}
+STAND_IN_DATABASE = os.getenv("CPL_STAND_IN_DB_NAME")
+STAND_IN_PREFIX = "cpl_test_"
+
+
+def match(
+    team1,
+    team2,
+    outcome=MatchOutcome.Team1Win,
+    net_points=0,
+    status=MatchStatus.Played,
+    category=MatchCategory.League
+) -> dict:
+    return {
+        "Team1": team1,
+        "Team2": team2,
+        "Category": category.value,
+        "Status": status.value,
+        "NetPoints": net_points,
+        "Outcome": outcome.value,
+        "Team1Name": TEAMS.get(team1),
+        "Team2Name": TEAMS.get(team2)
+    }
+
+
+def reference_rows(rows, season_status: int):
+    sides = []
+    for row in rows:
+        if row["Category"] != MatchCategory.League.value or row["Team1"] is None or row["Team2"] is None:
+            continue
+        won = row["Outcome"] == MatchOutcome.Team1Win.value
+        lost = row["Outcome"] == MatchOutcome.Team2Win.value
+        net = row["NetPoints"] or 0
+        sides.append((row["Team1"], row["Team2"], row["Status"], won, lost, net))
+        sides.append((row["Team2"], row["Team1"], row["Status"], lost, won, net))
+
+    results = {}
+    for team_id, opponent_id, status, won, lost, net in sides:
+        played, wins, net_points = results.get((team_id, opponent_id), (0, 0, 0))
+        if status == MatchStatus.Played.value:
+            played += int(won or lost)
+            wins += int(won)
+            net_points += net if won else -net if lost else 0
+        results[(team_id, opponent_id)] = (played, wins, net_points)
+
+    totals = {}
+    for (team_id, _), (played, wins, net_points) in results.items():
+        total = totals.get(team_id, (0, 0, 0))
+        totals[team_id] = (total[0] + played, total[1] + wins, total[2] + net_points)
+
+    champions = {
+        row["Team1"] if row["Outcome"] == MatchOutcome.Team1Win.value else row["Team2"]
+        for row in rows
+        if row["Category"] == MatchCategory.Final.value
+        and row["Status"] == MatchStatus.Played.value
+        and row["Outcome"] in (MatchOutcome.Team1Win.value, MatchOutcome.Team2Win.value)
+    }
+
+    league_rows = []
+    for team_id, (played, wins, net_points) in totals.items():
+        league_rows.append({
+            "TeamId": team_id,
+            "TeamName": TEAMS[team_id],
+            "MatchesPlayed": played,
+            "Wins": wins,
+            "Points": wins * 2,
+            "TotalNetPoints": net_points,
+            "HeadToHeadWins": sum(
+                result[1]
+                for (owner, opponent), result in results.items()
+                if owner == team_id and totals[opponent][1] == wins
+            ),
+            "IsWinner": int(team_id in champions)
+        })
+
+    league_rows.sort(key=lambda row: (
+        -row["Points"], -row["HeadToHeadWins"], -row["TotalNetPoints"], -row["Wins"], row["TeamName"], row["TeamId"]
+    ))
+    return league_rows, {"SeasonStatus": season_status}
+
+
+def stand_in_procedure_rows(rows, season_status: int):
+    from benchmarks import stand_in
+
+    connection = stand_in.connect(STAND_IN_DATABASE)
+    try:
+        cursor = connection.cursor()
+        for table in ("tblMatches", "tblTeams", "tblSeasons"):
+            cursor.execute(f"DELETE FROM {table}")
+        cursor.executemany("INSERT INTO tblTeams (Id, Name) VALUES (%s, %s)", list(TEAMS.items()))
+        cursor.execute("INSERT INTO tblSeasons (Id, Name, Status) VALUES (1, 'Reference', %s)", (season_status,))
+        cursor.executemany(
+            """
+            INSERT INTO tblMatches (Team1, Team2, ScheduledDate, Category, Status, `Order`, SeasonId, NetPoints, Outcome)
+            VALUES (%s, %s, '2024-01-01', %s, %s, %s, 1, %s, %s)
+            """,
+            [
+                (row["Team1"], row["Team2"], row["Category"], row["Status"], order, row["NetPoints"], row["Outcome"])
+                for order, row in enumerate(rows, start=1)
+            ]
+        )
+
+        cursor = connection.cursor(dictionary=True)
+        cursor.callproc("usp_GetLeagueTable", [1])
+        league_result, status_result = cursor.stored_results()
+        return league_result.fetchall(), status_result.fetchone()
+    finally:
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def stand_in_database():
+    if not STAND_IN_DATABASE:
+        pytest.skip("set CPL_STAND_IN_DB_NAME to run against the benchmark stand-in procedure on MySQL")
+    if not STAND_IN_DATABASE.startswith(STAND_IN_PREFIX):
+        pytest.fail(f"refusing to reset {STAND_IN_DATABASE!r}: the name must start with {STAND_IN_PREFIX!r}")
+
+    from benchmarks import stand_in
+
+    stand_in.reset_database(STAND_IN_DATABASE)
+    return STAND_IN_DATABASE
+
+
+CASES = {
+    "points_tie_broken_by_head_to_head": [
+        match(1, 2, net_points=1),
+        match(2, 3, net_points=9),
+        match(3, 1, net_points=9),
+        match(1, 4, net_points=2),
+        match(4, 2, net_points=3)
+    ],
+    "head_to_head_tie_falls_back_to_net_points_then_name": [
+        match(1, 2, net_points=4),
+        match(2, 1, net_points=4),
+        match(3, 4, net_points=4),
+        match(4, 3, net_points=4)
+    ],
+    "unplayed_and_not_decided_rows": [
+        match(1, 2, net_points=5),
+        match(1, 3, status=MatchStatus.Scheduled),
+        match(2, 3, status=MatchStatus.InProgress, net_points=7),
+        match(3, 1, outcome=MatchOutcome.NotDecided, net_points=4),
+        match(2, 3, outcome=MatchOutcome.NotDecided, status=MatchStatus.Scheduled)
+    ],
+    "friendly_and_playoff_rows_are_ignored": [
+        match(1, 2, net_points=3),
+        match(2, 1, category=MatchCategory.Friendly, net_points=20),
+        match(2, 5, category=MatchCategory.Friendly, net_points=20),
+        match(2, 1, category=MatchCategory.Eliminator, net_points=6),
+        match(1, 2, category=MatchCategory.Qualifier1, net_points=6),
+        match(None, None, category=MatchCategory.Qualifier2, status=MatchStatus.Scheduled,
+              outcome=MatchOutcome.NotDecided)
+    ],
+    "final_decides_winner": [
+        match(1, 2, net_points=3),
+        match(3, 2, net_points=1),
+        match(1, 3, net_points=2),
+        match(3, 2, category=MatchCategory.Final, outcome=MatchOutcome.Team1Win, net_points=5)
+    ],
+    "final_winner_outside_league_table": [
+        match(1, 2, net_points=3),
+        match(5, 6, category=MatchCategory.Final, net_points=2)
+    ],
+    "final_not_played_has_no_winner": [
+        match(1, 2, net_points=3),
+        match(None, None, category=MatchCategory.Final, status=MatchStatus.Scheduled,
+              outcome=MatchOutcome.NotDecided)
+    ],
+    "team_without_played_matches": [
+        match(1, 2, net_points=2),
+        match(3, 4, status=MatchStatus.Scheduled, outcome=MatchOutcome.NotDecided),
+        match(4, 3, status=MatchStatus.Scheduled, outcome=MatchOutcome.NotDecided)
+    ]
+}
+
+
+def random_season(seed: int):
+    generator = random.Random(seed)
+    team_ids = generator.sample(sorted(TEAMS), generator.randint(2, len(TEAMS)))
+    rows = []
+
+    for home in team_ids:
+        for away in team_ids:
+            if home == away or generator.random() < 0.3:
+                continue
+            rows.append(match(
+                home,
+                away,
+                outcome=generator.choice(list(MatchOutcome)),
+                net_points=generator.choice([None, 0, 1, 2, 3, 5, 8]),
+                status=generator.choice([MatchStatus.Played] * 3 + [MatchStatus.Scheduled, MatchStatus.InProgress]),
+                category=generator.choice([MatchCategory.League] * 5 + [MatchCategory.Friendly, MatchCategory.Eliminator])
+            ))
+
+    if len(team_ids) >= 2 and generator.random() < 0.5:
+        rows.append(match(team_ids[0], team_ids[1], category=MatchCategory.Final,
+                          outcome=generator.choice([MatchOutcome.Team1Win, MatchOutcome.Team2Win])))
+    return rows
+
+
+def engine_table(rows, season_status: int):
+    return SeasonStandings.from_matches(rows).to_response(season_status)
+
+
+def procedure_table(league_rows, status_row):
+    return SeasonRepository._map_league_table(league_rows, status_row)
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_engine_matches_reference_model(name):
+    rows = CASES[name]
+    status = SeasonStatus.InProgress.value
+
+    assert engine_table(rows, status) == procedure_table(*reference_rows(rows, status))
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_engine_matches_reference_model_on_random_seasons(seed):
+    rows = random_season(seed)
+    status = SeasonStatus.Completed.value
+
+    assert engine_table(rows, status) == procedure_table(*reference_rows(rows, status))
+
+
+def test_head_to_head_orders_teams_level_on_points():
+    table = engine_table(CASES["points_tie_broken_by_head_to_head"], SeasonStatus.InProgress.value)
+
+    assert [(row.team_id, row.points, row.head_to_head_wins) for row in table.standings] == [
+        (1, 4, 0), (2, 2, 1), (4, 2, 1), (3, 2, 0)
+    ]
+
+
+def test_final_winner_and_points_per_win():
+    table = engine_table(CASES["final_decides_winner"], SeasonStatus.Completed.value)
+
+    assert table.winner_id == 3
+    assert [(row.team_id, row.wins, row.points, row.net_points) for row in table.standings] == [
+        (1, 2, 4, 5), (3, 1, 2, -1), (2, 0, 0, -4)
+    ]
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_engine_matches_stand_in_procedure(name, stand_in_database):
+    rows = CASES[name]
+    status = SeasonStatus.InProgress.value
+
+    assert engine_table(rows, status) == procedure_table(*stand_in_procedure_rows(rows, status))
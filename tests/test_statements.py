@@ -0,0 +1,58 @@
+import mysql.connector
+
+from core.statements import StatementRegistry
+
+
+class FakeCursor:
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.closed = False
+
+    def execute(self, query, params):
+        if self.fail:
+            raise mysql.connector.Error("lost connection")
+
+    def fetchall(self):
+        return [(1,)]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+
+    connection_id = 7
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.cursors = []
+
+    def cursor(self, prepared=False, dictionary=False):
+        cursor = FakeCursor(self.fail)
+        self.cursors.append(cursor)
+        return cursor
+
+
+def test_failed_statement_is_evicted_and_closed():
+    connection = FakeConnection(fail=True)
+    registry = StatementRegistry(connection)
+
+    try:
+        registry.fetch_all("SELECT 1")
+    except mysql.connector.Error:
+        pass
+
+    assert connection.cursors[0].closed
+    assert registry._cursors == {}
+
+
+def test_cache_overflow_closes_the_oldest_cursor():
+    connection = FakeConnection()
+    registry = StatementRegistry(connection, max_statements=1)
+
+    registry.fetch_all("SELECT 1")
+    registry.fetch_all("SELECT 2")
+
+    assert connection.cursors[0].closed
+    assert not connection.cursors[1].closed
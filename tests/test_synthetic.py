@@ -0,0 +1,52 @@
+from benchmarks.synthetic import SCALES, LeagueGenerator, Scale, fingerprint, load_insert
+from enums.season_status import SeasonStatus
+from tests.sqlite_db import SQLiteConnection
+
+SCALE = Scale(countries=5, teams=6, teams_per_season=4, players_per_team=3, seasons=3)
+
+
+def test_generation_is_deterministic_per_seed():
+    counts, digest = fingerprint(SCALE, seed=7)
+
+    assert fingerprint(SCALE, seed=7) == (counts, digest)
+    assert fingerprint(SCALE, seed=8)[1] != digest
+    assert counts["tblCountries"] == 5 and counts["tblSeasons"] == 3
+
+
+def test_iso_codes_are_unique_at_every_scale():
+    for scale in SCALES.values():
+        countries = list(LeagueGenerator(scale).countries())
+        for column in (1, 2, 3):
+            assert len({row[column] for row in countries}) == len(countries)
+
+
+def test_loaded_league_is_consistent():
+    connection = SQLiteConnection()
+    raw = connection.raw
+
+    counts = load_insert(connection, LeagueGenerator(SCALE, seed=7).generate(), batch_size=7)
+
+    for table, count in counts.items():
+        assert raw.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == count
+
+    pairs = SCALE.teams_per_season * (SCALE.teams_per_season - 1)
+    assert raw.execute(
+        "SELECT SeasonId, COUNT(*), COUNT(DISTINCT `Order`) FROM tblMatches GROUP BY SeasonId ORDER BY SeasonId"
+    ).fetchall() == [(1, pairs + 4, pairs + 4), (2, pairs + 4, pairs + 4), (3, pairs + 1, pairs + 1)]
+
+    per_season = SCALE.teams_per_season * SCALE.players_per_team
+    assert raw.execute(
+        "SELECT SeasonId, COUNT(*), COUNT(DISTINCT PlayerId), COUNT(DISTINCT TeamId)"
+        " FROM tblPlayersSeasonsTeams GROUP BY SeasonId ORDER BY SeasonId"
+    ).fetchall() == [(season_id, per_season, per_season, SCALE.teams_per_season) for season_id in (1, 2, 3)]
+
+    assert raw.execute(
+        "SELECT COUNT(*) FROM tblMatches m"
+        " LEFT JOIN tblPlayersSeasonsTeams pst ON pst.SeasonId = m.SeasonId AND pst.TeamId = m.Team1"
+        " WHERE m.Team1 IS NOT NULL AND pst.Id IS NULL"
+    ).fetchone()[0] == 0
+    assert [row[0] for row in raw.execute("SELECT Status FROM tblSeasons ORDER BY Id")] == [
+        SeasonStatus.Completed.value,
+        SeasonStatus.Completed.value,
+        SeasonStatus.InProgress.value
+    ]
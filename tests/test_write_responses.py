@@ -0,0 +1,190 @@
+from datetime import date
+
+import pytest
+
+from core.column_defaults import ColumnDefaults
+from core.database import UnitOfWork, _current
+from enums.match_category import MatchCategory
+from enums.match_outcome import MatchOutcome
+from enums.match_status import MatchStatus
+from repositories.country_repository import CountryRepository
+from repositories.match_repository import MatchRepository
+from repositories.player_repository import PlayerRepository
+from repositories.season_repository import SeasonRepository
+from repositories.team_repository import TeamRepository
+from schemas.country_schema import CountryCreateRequest, CountryUpdateRequest
+from schemas.match_schema import MatchCreateRequest, MatchUpdateRequest
+from schemas.player_schema import PlayerCreateRequest, PlayerUpdateRequest
+from schemas.season_schema import SeasonCreateRequest, SeasonUpdateRequest
+from schemas.team_schema import TeamCreateRequest, TeamUpdateRequest
+from services.country_service import CountryService
+from services.match_service import MatchService
+from services.player_service import PlayerService
+from services.season_service import SeasonService
+from services.team_service import TeamService
+from tests.sqlite_db import SQLiteConnection
+
+
+@pytest.fixture
+def connection():
+    for repository in (CountryRepository, PlayerRepository, SeasonRepository, TeamRepository):
+        repository.cache.clear()
+    ColumnDefaults._defaults.clear()
+
+    connection = SQLiteConnection()
+    token = _current.set(UnitOfWork(lambda: connection))
+    yield connection
+    _current.reset(token)
+
+
+def write(action):
+    uow = _current.get()
+    with uow.transaction():
+        return action()
+
+
+def test_team_write_responses_match_the_stored_row(connection):
+    repository = TeamRepository()
+    service = TeamService(repository)
+
+    created = write(lambda: service.create(TeamCreateRequest(name="Falcons", slogan="Fly", logo_url=None)))
+    assert created == repository.get_by_id(created.id, cached=False)
+
+    updated = write(lambda: service.update(created.id, TeamUpdateRequest(slogan="Soar")))
+    assert updated == repository.get_by_id(created.id, cached=False)
+
+
+def test_team_update_does_not_start_from_a_cached_row(connection):
+    repository = TeamRepository()
+    service = TeamService(repository)
+
+    created = write(lambda: service.create(TeamCreateRequest(name="Falcons", slogan="Fly")))
+    repository.get_by_id(created.id)
+    connection.raw.execute("UPDATE tblTeams SET LogoUrl = 'logo.png' WHERE Id = ?", (created.id,))
+
+    updated = write(lambda: service.update(created.id, TeamUpdateRequest(name="Hawks")))
+
+    assert updated.logo_url == "logo.png"
+    assert updated == repository.get_by_id(created.id, cached=False)
+
+
+def test_player_write_responses_match_the_stored_row(connection):
+    countries = CountryService(CountryRepository())
+    repository = PlayerRepository()
+    service = PlayerService(repository, countries)
+
+    country = write(lambda: countries.create(CountryCreateRequest(name="Chile", iso_code2="CL", iso_code3="CHL")))
+    created = write(lambda: service.create(PlayerCreateRequest(
+        first_name=" Ana ",
+        last_name="Rojas",
+        date_of_birth=date(2000, 5, 17),
+        avatar_url="https://example.com/ana.png",
+        nationality_id=country.id
+    )))
+    assert created == repository.get_by_id(created.id, cached=False)
+
+    updated = write(lambda: service.update(created.id, PlayerUpdateRequest(
+        last_name=" Soto ",
+        avatar_url="https://example.com/soto.png"
+    )))
+    assert updated == repository.get_by_id(created.id, cached=False)
+
+
+def test_player_update_does_not_start_from_a_cached_row(connection):
+    countries = CountryService(CountryRepository())
+    repository = PlayerRepository()
+    service = PlayerService(repository, countries)
+
+    created = write(lambda: service.create(PlayerCreateRequest(first_name="Ana", last_name="Rojas")))
+    repository.get_by_id(created.id)
+    connection.raw.execute("UPDATE tblPlayers SET DateOfBirth = '1999-01-02' WHERE Id = ?", (created.id,))
+
+    updated = write(lambda: service.update(created.id, PlayerUpdateRequest(first_name="Eva")))
+
+    assert updated.date_of_birth == date(1999, 1, 2)
+    assert updated == repository.get_by_id(created.id, cached=False)
+
+
+def test_country_write_responses_match_the_stored_row(connection):
+    repository = CountryRepository()
+    service = CountryService(repository)
+
+    created = write(lambda: service.create(CountryCreateRequest(
+        name=" Peru ",
+        iso_code2="pe",
+        iso_code3="per",
+        capital="Lima"
+    )))
+    assert created == repository.get_by_id(created.id, cached=False)
+
+    updated = write(lambda: service.update(created.id, CountryUpdateRequest(iso_code3="pru", continent="South America")))
+    assert updated == repository.get_by_id(created.id, cached=False)
+
+
+def test_country_update_does_not_start_from_a_cached_row(connection):
+    repository = CountryRepository()
+    service = CountryService(repository)
+
+    created = write(lambda: service.create(CountryCreateRequest(name="Peru", iso_code2="PE", iso_code3="PER")))
+    repository.get_by_id(created.id)
+    connection.raw.execute("UPDATE tblCountries SET Capital = 'Lima' WHERE Id = ?", (created.id,))
+
+    updated = write(lambda: service.update(created.id, CountryUpdateRequest(phone_code="+51")))
+
+    assert updated.capital == "Lima"
+    assert updated == repository.get_by_id(created.id, cached=False)
+
+
+def test_season_update_does_not_start_from_a_cached_row(connection):
+    repository = SeasonRepository()
+    service = SeasonService(repository)
+
+    created = write(lambda: service.create_season(SeasonCreateRequest(name="Spring 2024")))
+    repository.get_by_id(created.id)
+    connection.raw.execute("UPDATE tblSeasons SET Status = 2, EndDate = '2024-06-30' WHERE Id = ?", (created.id,))
+
+    updated = write(lambda: service.update_season(created.id, SeasonUpdateRequest(name="Spring Cup 2024")))
+
+    assert updated.end_date == date(2024, 6, 30)
+    assert updated == repository.get_by_id(created.id, cached=False)
+
+
+def test_season_write_responses_match_the_stored_row(connection):
+    repository = SeasonRepository()
+    service = SeasonService(repository)
+
+    created = write(lambda: service.create_season(SeasonCreateRequest(
+        name="Summer 2024",
+        start_date=date(2024, 6, 1)
+    )))
+    assert created == repository.get_by_id(created.id, cached=False)
+
+    updated = write(lambda: service.update_season(created.id, SeasonUpdateRequest(end_date=date(2024, 8, 31))))
+    assert updated == repository.get_by_id(created.id, cached=False)
+
+
+def test_match_write_responses_match_the_stored_row(connection):
+    repository = MatchRepository()
+    service = MatchService(repository)
+
+    created = write(lambda: service.create(MatchCreateRequest(
+        team1=1,
+        team2=2,
+        scheduled_date=date(2024, 6, 1),
+        golden_strike=True,
+        category=MatchCategory.League,
+        status=MatchStatus.Scheduled,
+        order=1,
+        season_id=1,
+        outcome=MatchOutcome.NotDecided
+    )))
+    assert created.toss_outcome == 0
+    assert created == repository.get_by_id(created.id)
+
+    updated = write(lambda: service.update(created.id, MatchUpdateRequest(
+        scheduled_date=date(2024, 6, 2),
+        duration=90,
+        golden_strike=False,
+        status=MatchStatus.InProgress.value
+    )))
+    assert updated == repository.get_by_id(created.id)